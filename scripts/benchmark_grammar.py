@@ -0,0 +1,48 @@
+"""
+Compare how long the TatSu parser generated from shakespeare.ebnf takes to parse
+each sample play with the parser generated from the grammar at a git revision
+(HEAD by default), to see what a change to the grammar does to parsing time.
+"""
+
+from pathlib import Path
+import subprocess
+import sys
+import timeit
+import tatsu
+
+revision = sys.argv[1] if len(sys.argv) > 1 else "HEAD"
+root = Path(__file__).parent.parent
+grammars = {
+    revision: subprocess.run(
+        ["git", "show", f"{revision}:shakespearelang/shakespeare.ebnf"],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout,
+    "working tree": (root / "shakespearelang/shakespeare.ebnf").read_text(),
+}
+
+
+def parser_class(grammar):
+    namespace = {}
+    exec(tatsu.to_python_sourcecode(grammar, name="shakespeare"), namespace)
+    return namespace["shakespeareParser"]
+
+
+parsers = {name: parser_class(grammar) for name, grammar in grammars.items()}
+totals = dict.fromkeys(parsers, 0.0)
+print(f"{'play':<24}" + "".join(f"{name:>16}" for name in parsers))
+for path in sorted((root / "shakespearelang/tests/sample_plays").glob("*.spl")):
+    play = path.read_text()
+    line = f"{path.name:<24}"
+    for name, parser in parsers.items():
+        times = timeit.repeat(
+            lambda: parser().parse(play, rule_name="play"), number=1, repeat=5
+        )
+        totals[name] += min(times)
+        line += f"{min(times) * 1000:13.1f} ms"
+    print(line)
+print(
+    f"{'total':<24}" + "".join(f"{total * 1000:13.1f} ms" for total in totals.values())
+)
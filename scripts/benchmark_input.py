@@ -0,0 +1,37 @@
+"""
+Measure how many characters per second the basic input manager consumes from a
+single line of standard input, for lines of different lengths, and how many
+numbers per second it consumes, one per line.
+"""
+
+from shakespearelang._input import BasicInputManager
+from io import StringIO
+import sys
+import timeit
+
+lengths = [int(n) for n in sys.argv[1:]] or [10_000, 100_000, 1_000_000, 10_000_000]
+
+
+def consume_characters(length):
+    sys.stdin = StringIO("x" * length + "\n")
+    consume_character_input = BasicInputManager().consume_character_input
+    for _ in range(length):
+        consume_character_input()
+
+
+def consume_numbers(count):
+    sys.stdin = StringIO("1234567\n" * count)
+    consume_numeric_input = BasicInputManager().consume_numeric_input
+    for _ in range(count):
+        consume_numeric_input()
+
+
+for length in lengths:
+    elapsed = min(timeit.repeat(lambda: consume_characters(length), number=1, repeat=3))
+    print(
+        f"line of {length:>10} characters: "
+        f"{length / elapsed / 1e6:5.2f} million characters/s"
+    )
+count = 100_000
+elapsed = min(timeit.repeat(lambda: consume_numbers(count), number=1, repeat=3))
+print(f"{count} numbers, one per line: {count / elapsed / 1e6:5.2f} million numbers/s")
@@ -0,0 +1,49 @@
+from shakespearelang import Shakespeare
+import contextlib
+import io
+import sys
+import timeit
+
+# A large play with many scenes, whose first scene jumps straight to the last
+# one, so that only those two scenes run.
+scenes = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+prologue = "A large play.\nRomeo, a man.\nJuliet, a woman.\n"
+events = (
+    "Juliet: You are as good as the sum of a big big cat and the difference "
+    "between a small furry animal and thyself. Speak your mind!\n"
+    "Romeo: Are you better than me? If so, let us return to scene I.\n"
+) * 50
+
+
+def roman(number):
+    numerals = [(100, "C"), (90, "XC"), (50, "L"), (40, "XL"), (10, "X"), (9, "IX")]
+    numerals += [(5, "V"), (4, "IV"), (1, "I")]
+    result = ""
+    for value, numeral in numerals:
+        while number >= value:
+            result += numeral
+            number -= value
+    return result
+
+
+play = (
+    prologue
+    + "Act I: Generated.\n"
+    + "Scene I: The start.\n[Enter Romeo and Juliet]\n"
+    + f"Romeo: Let us proceed to scene {roman(scenes + 2)}.\n"
+    + "".join(
+        f"Scene {roman(scene)}: Generated.\n{events}" for scene in range(2, scenes + 2)
+    )
+    + f"Scene {roman(scenes + 2)}: The end.\n[Exeunt]\n"
+)
+print(f"{len(play.splitlines())} lines, {len(play) // 1024} KiB")
+
+
+def run(lazy):
+    with contextlib.redirect_stdout(io.StringIO()):
+        Shakespeare(play, lazy=lazy).run()
+
+
+for lazy in [False, True]:
+    times = timeit.repeat(lambda: run(lazy), number=1, repeat=3)
+    print(f"lazy={lazy}: best of 3 runs: {min(times) * 1000:.0f} ms")
@@ -0,0 +1,41 @@
+"""
+Measure how many characters per second the basic output manager writes to
+standard output (redirected to the null device), compared with printing each
+character on its own, as it used to.
+"""
+
+from shakespearelang._output import BasicOutputManager
+import contextlib
+import os
+import sys
+import timeit
+
+characters = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+codes = [ord(character) for character in "Hello, World!\n"] * (characters // 14)
+
+
+def print_each_character():
+    for code in codes:
+        print(chr(code), end="")
+    sys.stdout.flush()
+
+
+def basic_output_manager():
+    manager = BasicOutputManager()
+    output_character = manager.output_character
+    for code in codes:
+        output_character(code)
+    manager.flush()
+
+
+with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+    results = {
+        name: min(timeit.repeat(function, number=1, repeat=7))
+        for name, function in [
+            ("print() per character", print_each_character),
+            ("BasicOutputManager", basic_output_manager),
+        ]
+    }
+
+for name, elapsed in results.items():
+    print(f"{name:>22}: {len(codes) / elapsed / 1e6:6.2f} million characters/s")
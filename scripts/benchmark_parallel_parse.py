@@ -0,0 +1,39 @@
+from shakespearelang import Shakespeare
+from pathlib import Path
+import re
+import sys
+import timeit
+
+# A large play made of the dramatis personae of parse_everything.spl and many
+# copies of the events of its last scene.
+acts = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+source = (
+    Path(__file__).parent.parent
+    / "shakespearelang/tests/sample_plays/parse_everything.spl"
+).read_text()
+prologue_end = re.search(r"(?i)^\s*act\b", source, re.MULTILINE).start()
+events_start = list(re.finditer(r"(?i)scene [mdclxvi]+:[^.!]*[.!]", source))[-1].end()
+prologue, events = source[:prologue_end], source[events_start:]
+
+
+def roman(number):
+    numerals = [(10, "X"), (9, "IX"), (5, "V"), (4, "IV"), (1, "I")]
+    result = ""
+    for value, numeral in numerals:
+        while number >= value:
+            result += numeral
+            number -= value
+    return result
+
+
+play = prologue + "".join(
+    f"Act {roman(act)}: Generated.\n"
+    + "".join(f"Scene {roman(scene)}: Generated.\n{events}" for scene in range(1, 11))
+    for act in range(1, acts + 1)
+)
+print(f"{len(play.splitlines())} lines, {len(play) // 1024} KiB")
+
+for jobs in [1, 2, 4]:
+    interpreter = Shakespeare("Empty. Juliet, a test.", jobs=jobs)
+    times = timeit.repeat(lambda: interpreter.parse(play, "play"), number=1, repeat=3)
+    print(f"--jobs {jobs}: best of 3 parses: {min(times) * 1000:.0f} ms")
@@ -0,0 +1,13 @@
+from shakespearelang import Shakespeare
+from pathlib import Path
+import sys
+import timeit
+
+play_name = sys.argv[1] if len(sys.argv) > 1 else "parse_everything.spl"
+path = Path(__file__).parent.parent / f"shakespearelang/tests/sample_plays/{play_name}"
+play = path.read_text()
+
+for parser in ["fast", "tatsu"]:
+    interpreter = Shakespeare(play, parser=parser)
+    times = timeit.repeat(lambda: interpreter.parse(play, "play"), number=1, repeat=5)
+    print(f"{parser}: best of 5 parses of {play_name}: {min(times) * 1000:.1f} ms")
@@ -0,0 +1,47 @@
+"""
+Measure the peak memory used by the TatSu parser to parse parse_everything.spl
+and larger plays made of many copies of its scenes, with TatSu's default
+memoization and with the bounded memo of BoundedMemoParser, using tracemalloc.
+"""
+
+from shakespearelang._parser import shakespeareParser
+from shakespearelang._bounded_parser import BoundedMemoParser
+from pathlib import Path
+import re
+import sys
+import time
+import tracemalloc
+
+copies = [int(n) for n in sys.argv[1:]] or [1, 4]
+source = (
+    Path(__file__).parent.parent
+    / "shakespearelang/tests/sample_plays/parse_everything.spl"
+).read_text()
+# Parsing does not check that act numerals are unique, so the acts can simply
+# be repeated.
+first_act = re.search(r"(?i)^\s*act\b", source, re.MULTILINE).start()
+prologue, acts = source[:first_act], source[first_act:]
+
+
+def measure(parser_class, play):
+    # Timed separately, since tracing allocations makes parsing much slower.
+    start = time.perf_counter()
+    parser_class().parse(play, rule_name="play")
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    parser_class().parse(play, rule_name="play")
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+for n in copies:
+    play = prologue + acts * n
+    print(f"{n} copies of parse_everything.spl, {len(play) // 1024} KiB:")
+    for parser_class in [shakespeareParser, BoundedMemoParser]:
+        peak, elapsed = measure(parser_class, play)
+        print(
+            f"  {parser_class.__name__:>18}: peak {peak / 2**20:7.1f} MiB, "
+            f"{elapsed * 1000:7.0f} ms"
+        )
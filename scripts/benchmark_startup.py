@@ -0,0 +1,52 @@
+"""
+Measure the cold-start time of `shakespeare run hi.spl`, and the modules that
+take longest to import, using `python -X importtime`.
+"""
+
+from pathlib import Path
+import re
+import subprocess
+import sys
+import time
+
+RUNS = 10
+
+play_path = Path(__file__).parent.parent / "shakespearelang/tests/sample_plays/hi.spl"
+command = [
+    sys.executable,
+    "-X",
+    "importtime",
+    "-c",
+    "import sys; from shakespearelang.cli import main; main(sys.argv[1:])",
+    "run",
+    str(play_path),
+]
+
+
+def parse_importtime(stderr):
+    # Lines are "import time: <self us> | <cumulative us> | <indented name>".
+    imports = []
+    for line in stderr.splitlines():
+        match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)", line)
+        if match:
+            imports.append((int(match[2]), len(match[3]), match[4]))
+    return imports
+
+
+wall_times = []
+import_times = []
+for _ in range(RUNS):
+    start = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True, check=True)
+    wall_times.append(time.perf_counter() - start)
+    imports = parse_importtime(result.stderr)
+    import_times.append(
+        sum(cumulative for cumulative, depth, _ in imports if depth == 0)
+    )
+
+print(f"best of {RUNS} runs:")
+print(f"  wall time:   {min(wall_times) * 1000:8.1f} ms")
+print(f"  import time: {min(import_times) / 1000:8.1f} ms")
+print("slowest imports in the last run, cumulative:")
+for cumulative, _, name in sorted(imports, reverse=True)[:15]:
+    print(f"  {cumulative / 1000:8.1f} ms  {name}")
@@ -1,3 +1,4 @@
 from .shakespeare import *
 from .errors import *
 from .settings import *
+from .parse_profile import *
@@ -0,0 +1,66 @@
+"""
+Light stand-ins for the TatSu AST classes, used for plays parsed by the fast
+parser or loaded from a compiled play, so that TatSu is only imported when it is
+really needed. They support everything the interpreter uses the TatSu classes
+for.
+"""
+
+from bisect import bisect_right
+from collections import namedtuple
+
+
+class Node(dict):
+    """Stands in for tatsu.ast.AST. Like it, fields can be read as attributes,
+    which are None if the field is missing."""
+
+    def __getattr__(self, name):
+        return self.get(name)
+
+
+ParseInfo = namedtuple(
+    "ParseInfo", ["tokenizer", "rule", "pos", "endpos", "line", "endline"]
+)
+
+
+class SourceBuffer:
+    """Stands in for the TatSu buffer of the source of a play.
+
+    Line numbers are worked out the same way as TatSu does. Everything else is
+    only needed to show the context of errors, so the TatSu buffer it delegates
+    to is only created then.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self._buffer = None
+        self._line_starts = None
+        self._end_line = None
+
+    def posline(self, pos):
+        if self._line_starts is None:
+            self._index_lines()
+        if pos >= len(self.text):
+            return self._end_line
+        return bisect_right(self._line_starts, pos) - 1
+
+    def _index_lines(self):
+        lines = self.text.splitlines(True)
+        self._line_starts = []
+        start = 0
+        for line in lines:
+            self._line_starts.append(start)
+            start += len(line)
+        # Like TatSu, put the end of the text on the line after the last line
+        # (if any), or the one after that if the text ends with a line break.
+        self._end_line = max(len(lines), 1)
+        if lines and lines[-1][-1] in "\r\n":
+            self._end_line += 1
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if self._buffer is None:
+            from tatsu.buffering import Buffer
+
+            self._buffer = Buffer(self.text)
+        return getattr(self._buffer, name)
@@ -0,0 +1,51 @@
+"""
+The TatSu parser generated from shakespeare.ebnf, with its packrat memo kept to
+a bounded size.
+
+TatSu memoizes the result of every rule at every position it is tried, and keeps
+the memo until the parse ends, so parsing a large play takes far more memory
+than the play itself. This parser does not memoize rules that are cheaper to
+parse again than to look up, and forgets everything memoized before the end of
+each scene it parses, since a play is never parsed again from before the end
+of a scene. Neither changes the results, only how often rules are tried.
+"""
+
+from ._parser import shakespeareParser
+from tatsu.util import prune_dict
+
+# Rules that only match one of a few short keywords (or a regular expression),
+# whose memos would take more memory than they save time.
+UNMEMOIZED_RULES = frozenset(
+    [
+        "be",
+        "article",
+        "first_person",
+        "first_person_reflexive",
+        "first_person_possessive",
+        "second_person",
+        "second_person_reflexive",
+        "second_person_possessive",
+        "third_person_possessive",
+        "let_us",
+        "proceed_to",
+        "negative_if",
+        "positive_if",
+        "roman_numeral",
+        "text_before_punctuation",
+    ]
+)
+
+
+class BoundedMemoParser(shakespeareParser):
+    def _memoize(self, key, memo):
+        if key.rule.name in UNMEMOIZED_RULES:
+            return memo
+        return super()._memoize(key, memo)
+
+    def _scene_(self):
+        super()._scene_()
+        self._forget_before(self._pos)
+
+    def _forget_before(self, pos):
+        prune_dict(self._memos, lambda key, _: key.pos < pos)
+        prune_dict(self._results, lambda key, _: key.pos < pos)
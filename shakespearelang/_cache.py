@@ -0,0 +1,129 @@
+"""
+A cache of parsed plays on disk, so that loading the same play again does not
+parse it again.
+"""
+
+from ._serialize import (
+    dumps_ast,
+    loads_ast,
+    grammar_version,
+    FORMAT_VERSION,
+    PYTHON_VERSION,
+)
+from .errors import ShakespeareCompiledPlayError
+from pathlib import Path
+from importlib import metadata
+import hashlib
+import marshal
+import os
+import tempfile
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+_SUFFIX = ".play"
+
+
+def _current_version_key():
+    # Everything that can change the AST of a play or how it is stored, other
+    # than the play itself. The interpreter builds everything else from the AST
+    # each time, so its own version does not matter. TatSu's version is read
+    # from its metadata rather than by importing it, which is slow.
+    return "\0".join(
+        [
+            grammar_version(),
+            str(FORMAT_VERSION),
+            metadata.version("TatSu"),
+            PYTHON_VERSION,
+            str(marshal.version),
+        ]
+    ).encode()
+
+
+class PlayCache:
+    """
+    A directory of parsed plays, keyed by a hash of their source and of the
+    versions of the grammar, TatSu and Python, so entries from other versions
+    are never used. When the entries take up more than max_size bytes, the least
+    recently used ones are deleted.
+    """
+
+    _version_key = None
+
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE):
+        self.directory = Path(directory)
+        self.max_size = max_size
+        if PlayCache._version_key is None:
+            PlayCache._version_key = _current_version_key()
+
+    def load(self, text):
+        """
+        Returns:
+            The AST of the play with source text, or None if it is not cached.
+        """
+        path = self._path(text)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            ast = loads_ast(data)
+        except ShakespeareCompiledPlayError:
+            return None
+        if ast.parseinfo.tokenizer.text != text:
+            return None
+
+        # Mark the entry as recently used.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return ast
+
+    def store(self, text, ast):
+        """Store the AST of the play with source text, if possible.
+
+        Failing to write to the cache is not an error: the play just has to be
+        parsed again next time.
+        """
+        data = dumps_ast(ast)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first, so other processes reading the
+            # cache at the same time never see a partial entry.
+            fd, temporary_path = tempfile.mkstemp(dir=self.directory)
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temporary_path, self._path(text))
+        except OSError:
+            try:
+                os.unlink(temporary_path)
+            except OSError:
+                pass
+            return
+        self._evict()
+
+    def _path(self, text):
+        digest = hashlib.sha256(self._version_key + b"\0" + text.encode())
+        return self.directory / (digest.hexdigest() + _SUFFIX)
+
+    def _evict(self):
+        entries = []
+        for path in self.directory.glob("*" + _SUFFIX):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total_size -= size
@@ -1,77 +1,145 @@
 from ._utils import normalize_name
+from ._state import opposite_slot
 from .errors import ShakespeareRuntimeError, ShakespeareParseError
-from tatsu.ast import AST
+from typing import TYPE_CHECKING
 import math
 
+if TYPE_CHECKING:
+    from tatsu.ast import AST
+
 
 class Expression:
-    def __init__(self, ast_node: AST, character: str):
+    def __init__(self, ast_node: "AST", character: str):
         self.ast_node = ast_node
         self.character = normalize_name(character)
-        self.cacheable = False
-        self.cached_value = None
+        # Whether this expression always evaluates to constant_value without
+        # errors, so it can be replaced by that value when loading the play.
+        self.constant = False
+        self.constant_value = None
         self._setup()
 
     def _setup(self):
         pass
 
-    def evaluate(self, state):
-        state.assert_character_on_stage(self.character)
-
-        try:
-            return self._evaluate_logic_cached(state)
-        except ShakespeareRuntimeError as exc:
-            if not exc.parseinfo:
-                exc.parseinfo = self.ast_node.parseinfo
-            raise exc
+    def compile(self, character_slots, stage=None):
+        """Compile this expression into a function of the state that evaluates it.
+
+        Characters are looked up by their slot in character_slots rather than by
+        name. If stage is given, the function may assume that the stage mask
+        (see State.stage_mask) has that value.
+
+        The function does not check that the speaker is on stage, because that
+        cannot change while a sentence runs: sentences check it once before
+        evaluating any of their expressions. Use compile_checked to evaluate an
+        expression on its own.
+        """
+        # Everything the evaluation needs is bound into the closure up front, so
+        # evaluating is a single call per node with no attribute lookups.
+        logic = self._compile_logic_cached(character_slots, stage)
+        parseinfo = self.ast_node.parseinfo
+
+        def evaluate(state):
+            try:
+                return logic(state)
+            except ShakespeareRuntimeError as exc:
+                if not exc.parseinfo:
+                    exc.parseinfo = parseinfo
+                raise exc
+
+        return evaluate
+
+    def compile_checked(self, character_slots):
+        """Like compile, but the function first checks that the speaker is on
+        stage."""
+        evaluate_unchecked = self.compile(character_slots)
+        character = self.character
+        slot = character_slots.get(character)
+        parseinfo = self.ast_node.parseinfo
+
+        def evaluate(state):
+            if slot is None or not state.on_stage[slot]:
+                try:
+                    state.assert_character_on_stage(character)
+                except ShakespeareRuntimeError as exc:
+                    exc.parseinfo = parseinfo
+                    raise exc
+            return evaluate_unchecked(state)
+
+        return evaluate
+
+    def _compile_logic_cached(self, character_slots, stage):
+        if self.constant:
+            value = self.constant_value
+            return lambda state: value
+
+        return self._compile_logic(character_slots, stage)
+
+    def _simplify(self):
+        """Return an equivalent expression to use in place of this one."""
+        return self
 
-    def _evaluate_logic_cached(self, state):
-        if self.cacheable and self.cached_value is not None:
-            return self.cached_value
 
-        result = self._evaluate_logic(state)
+class FirstPersonValue(Expression):
+    def _compile_logic(self, character_slots, stage):
+        character = self.character
+        if character not in character_slots:
+            return lambda state: state.character_by_name(character).value
 
-        if self.cacheable:
-            self.cached_value = result
+        slot = character_slots[character]
+        return lambda state: state.character_list[slot].value
 
-        return result
 
+class SecondPersonValue(Expression):
+    def _compile_logic(self, character_slots, stage):
+        character = self.character
+        if character not in character_slots:
+            return lambda state: state.character_by_name(
+                state.character_opposite(character)
+            ).value
 
-class FirstPersonValue(Expression):
-    def _evaluate_logic(self, state):
-        return state.character_by_name(self.character).value
+        slot = character_slots[character]
+        known_opposite = opposite_slot(stage, slot)
+        if known_opposite is not None:
+            return lambda state: state.character_list[known_opposite].value
 
+        def logic(state):
+            character_opposite = state.opposites[slot]
+            if character_opposite is None:
+                state.character_opposite(character)
+            return character_opposite.value
 
-class SecondPersonValue(Expression):
-    def _evaluate_logic(self, state):
-        character_opposite = state.character_opposite(self.character)
-        return state.character_by_name(character_opposite).value
+        return logic
 
 
 class CharacterName(Expression):
     def _setup(self):
         self.name = normalize_name(self.ast_node.name)
 
-    def _evaluate_logic(self, state):
-        return state.character_by_name(self.name).value
+    def _compile_logic(self, character_slots, stage):
+        name = self.name
+        if name not in character_slots:
+            return lambda state: state.character_by_name(name).value
+
+        slot = character_slots[name]
+        return lambda state: state.character_list[slot].value
 
 
 class NegativeNounPhrase(Expression):
     def _setup(self):
-        self.cacheable = True
-        self.cached_value = -pow(2, len(self.ast_node.adjectives))
+        self.constant = True
+        self.constant_value = -pow(2, len(self.ast_node.adjectives))
 
 
 class PositiveNounPhrase(Expression):
     def _setup(self):
-        self.cacheable = True
-        self.cached_value = pow(2, len(self.ast_node.adjectives))
+        self.constant = True
+        self.constant_value = pow(2, len(self.ast_node.adjectives))
 
 
 class Nothing(Expression):
     def _setup(self):
-        self.cacheable = True
-        self.cached_value = 0
+        self.constant = True
+        self.constant_value = 0
 
 
 class UnaryOperation(Expression):
@@ -101,11 +169,14 @@ class UnaryOperation(Expression):
 
     def _setup(self):
         self.operand = expression_from_ast(self.ast_node.value, self.character)
-        self.cacheable = self.operand.cacheable
         self.operation = self._UNARY_OPERATION_HANDLERS[self.ast_node.operation]
+        if self.operand.constant:
+            _fold(self, self.operation, self.operand.constant_value)
 
-    def _evaluate_logic(self, state):
-        return self.operation(self.operand.evaluate(state))
+    def _compile_logic(self, character_slots, stage):
+        operation = self.operation
+        operand = self.operand.compile(character_slots, stage)
+        return lambda state: operation(operand(state))
 
 
 class BinaryOperation(Expression):
@@ -138,13 +209,45 @@ class BinaryOperation(Expression):
         self.second_operand = expression_from_ast(
             self.ast_node.second_value, self.character
         )
-        self.cacheable = self.first_operand.cacheable and self.second_operand.cacheable
         self.operation = self._BINARY_OPERATION_HANDLERS[self.ast_node.operation]
+        if self.first_operand.constant and self.second_operand.constant:
+            _fold(
+                self,
+                self.operation,
+                self.first_operand.constant_value,
+                self.second_operand.constant_value,
+            )
 
-    def _evaluate_logic(self, state):
-        return self.operation(
-            self.first_operand.evaluate(state), self.second_operand.evaluate(state)
-        )
+    # Operations that return one of their operands unchanged when the other is
+    # the given constant, as (operation, constant, position of the constant).
+    # Only exact integer operations are listed: the quotient goes through a
+    # float, so dividing by one is not an identity for large operands.
+    _IDENTITIES = {
+        (("the", "sum", "of"), 0, 0),
+        (("the", "sum", "of"), 0, 1),
+        (("the", "difference", "between"), 0, 1),
+        (("the", "product", "of"), 1, 0),
+        (("the", "product", "of"), 1, 1),
+    }
+
+    def _simplify(self):
+        # The remaining operand is still evaluated, so any error it raises is
+        # raised just the same, and with its own parseinfo.
+        operands = (self.first_operand, self.second_operand)
+        for position, operand in enumerate(operands):
+            if (
+                operand.constant
+                and (self.ast_node.operation, operand.constant_value, position)
+                in self._IDENTITIES
+            ):
+                return operands[1 - position]
+        return self
+
+    def _compile_logic(self, character_slots, stage):
+        operation = self.operation
+        first_operand = self.first_operand.compile(character_slots, stage)
+        second_operand = self.second_operand.compile(character_slots, stage)
+        return lambda state: operation(first_operand(state), second_operand(state))
 
 
 _EXPRESSION_CONSTRUCTORS = {
@@ -159,5 +262,32 @@ _EXPRESSION_CONSTRUCTORS = {
 }
 
 
-def expression_from_ast(ast_node: AST, character: str):
-    return _EXPRESSION_CONSTRUCTORS[ast_node.parseinfo.rule](ast_node, character)
+# Folding factorials of larger numbers, or nested powers that grow without
+# bound, could make loading a play take as long as running it, even if the
+# expression is never evaluated. Results larger than this are left unfolded, so
+# that the operands of any fold are no larger either.
+_MAX_FOLDED_FACTORIAL_OPERAND = 1000
+_MAX_FOLDED_BITS = 10_000
+
+
+def _fold(expression, operation, *operands):
+    if (
+        operation is UnaryOperation._evaluate_factorial
+        and operands[0] > _MAX_FOLDED_FACTORIAL_OPERAND
+    ):
+        return
+    try:
+        value = operation(*operands)
+    except (ShakespeareRuntimeError, ArithmeticError):
+        # Leave it to be raised if and when the expression is evaluated. That
+        # includes overflowing a float, in the square root or the quotient.
+        return
+    if value.bit_length() > _MAX_FOLDED_BITS:
+        return
+    expression.constant_value = value
+    expression.constant = True
+
+
+def expression_from_ast(ast_node: "AST", character: str):
+    expression = _EXPRESSION_CONSTRUCTORS[ast_node.parseinfo.rule](ast_node, character)
+    return expression._simplify()
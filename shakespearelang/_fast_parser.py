@@ -0,0 +1,894 @@
+"""
+A hand-written parser for whole plays, producing the same AST as the TatSu parser
+generated from shakespeare.ebnf (made of the stand-ins for TatSu's classes in
+_ast), without its backtracking and memoization, and without importing TatSu.
+
+It is only ever used as a shortcut: it gives up on anything it cannot parse
+exactly as the TatSu parser would, and the caller then falls back to TatSu, which
+also produces the parse errors.
+"""
+
+from ._ast import Node, ParseInfo, SourceBuffer
+from ._serialize import _encode, _decode
+from pathlib import Path
+import re
+
+# A word, including inner apostrophes and hyphens as in "summer's" and
+# "fat-kidneyed", or any other single character. Words end where TatSu's name
+# guard would let a keyword end.
+_TOKEN = re.compile(r"\s*(?:([^\W_]+(?:['\-][^\W_]+)*)|(\S))")
+_WHITESPACE = re.compile(r"\s*")
+_TEXT_BEFORE_PUNCTUATION = re.compile(r"[^!\.]*")
+_ROMAN_NUMERAL = re.compile(
+    r"(?i)M{0,4}(CM|CD|D?C{0,3})(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})"
+)
+# Where an act or scene heading probably starts. It only decides where the play
+# is split to be parsed in parallel, so it does not need to be exact.
+_HEADING = re.compile(r"(?i)(?<![\w'\-])(?:act|scene)(?![\w'\-])\s*[ivxlcdm]*\s*:")
+
+# Parsing a chunk of a play in another process only pays off if the chunk is
+# large enough.
+_MIN_CHUNK_SIZE = 32 * 1024
+_CHUNKS_PER_JOB = 4
+
+# What the outline of a play looks for after the dramatis personae: a heading,
+# or the keyword of a Recall sentence, whose text could look like a heading.
+_OUTLINE_WORD = re.compile(
+    r"(?i)(?<![\w'\-])(?:(recall)(?![\w'\-])|(act|scene)\s*[ivxlcdm]*\s*:)"
+)
+
+# A group of alternatives behind a lookahead on their first letter, as the
+# grammar writes long choices of keywords.
+_GUARDED_GROUP = re.compile(r"&/[^/]*/\s*\(([^)]*)\)")
+
+
+def _keyword_rules():
+    """Read the rules of the grammar that are ordered choices of keywords.
+
+    Returns a dict from rule name to a dict from the lowercase first word of an
+    alternative to a list of (lowercase remaining words, result) pairs, in the
+    order of the grammar, where result is what TatSu returns for that
+    alternative: the keyword as spelled in the grammar, or a tuple of them. So
+    classifying a word takes one lookup rather than trying every alternative,
+    even for multi-word keywords like "Lady Macbeth". The lookaheads the grammar
+    groups long choices by are left out, since they never change the result.
+    """
+    grammar = (Path(__file__).parent / "shakespeare.ebnf").read_text()
+    rules = {}
+    for name, body in re.findall(r"^(\w+)\s*=\s*([^;]*);", grammar, re.MULTILINE):
+        body = _GUARDED_GROUP.sub(r"\1", body)
+        alternatives = [alternative.split() for alternative in body.split("|")]
+        if not all(
+            re.fullmatch(r'"[^"\s]+"', word)
+            for alternative in alternatives
+            for word in alternative
+        ):
+            continue
+        rules[name] = {}
+        for alternative in alternatives:
+            words = tuple(word.strip('"') for word in alternative)
+            result = words[0] if len(words) == 1 else words
+            first, *rest = (word.lower() for word in words)
+            rules[name].setdefault(first, []).append((tuple(rest), result))
+    return rules
+
+
+_KEYWORDS = _keyword_rules()
+
+
+class FastParser:
+    """Parser for the 'play' rule of the grammar."""
+
+    def parse(self, text, jobs=1):
+        """
+        Arguments:
+            text: The source of the play.
+            jobs: How many processes to parse the play in. If more than one,
+                the acts and scenes of a large play are split into chunks that
+                are parsed in parallel.
+
+        Returns:
+            The AST of the play, or None if the play must be parsed by TatSu
+            instead, e.g. because it has a syntax error.
+        """
+        parser = _PlayParser(SourceBuffer(text))
+        if jobs > 1:
+            return _parse_in_parallel(parser, jobs)
+        return parser.play()
+
+    def outline(self, text):
+        """
+        Parse the title, the dramatis personae and the act and scene headings of
+        a play, finding the headings without parsing the events between them.
+
+        Returns:
+            The AST of the play with no events in its scenes, or None if the
+            outline cannot be found, e.g. because the play has a syntax error
+            outside its scenes.
+        """
+        return _PlayParser(SourceBuffer(text)).outline()
+
+    def parse_scene(self, buffer, start, end):
+        """
+        Arguments:
+            buffer: The source of the play, as in the parseinfo of its outline.
+            start: Where the scene starts.
+            end: Where the scene ends, at the next heading or the end of the play.
+
+        Returns:
+            The AST of the scene, or None if it must be parsed by TatSu instead.
+        """
+        return _PlayParser(buffer, end).scene(start)
+
+
+def _parse_in_parallel(parser, jobs):
+    # Parse the title and dramatis personae here, then split the rest at act
+    # and scene headings into chunks of similar size for the other processes.
+    # Each chunk is parsed into a list of acts (without their scenes) and
+    # scenes, which are put together again as the whole play would have been
+    # parsed. If any chunk cannot be parsed, e.g. because it was split at
+    # something that only looked like a heading, the whole play is parsed here.
+    text = parser.text
+    prologue = parser.prologue()
+    if prologue is None:
+        return None
+    title, dramatis_personae, start = prologue
+
+    chunk_size = max((len(text) - start) / (jobs * _CHUNKS_PER_JOB), _MIN_CHUNK_SIZE)
+    chunks = []
+    chunk_start = start
+    for heading in _HEADING.finditer(text, parser._skip(start) + 1):
+        if heading.start() - chunk_start >= chunk_size:
+            chunks.append((chunk_start, heading.start()))
+            chunk_start = heading.start()
+    chunks.append((chunk_start, len(text)))
+    if len(chunks) == 1:
+        return parser.play()
+
+    # Imported here because it imports multiprocessing, which is slow to import.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        min(jobs, len(chunks)), initializer=_start_worker, initargs=(text,)
+    ) as executor:
+        results = list(executor.map(_parse_chunk, *zip(*chunks)))
+    if None in results:
+        return parser.play()
+
+    acts = []
+    # Like the serial parser, each act or scene starts where the one before it
+    # ended, before any whitespace.
+    pos = start
+    for encoded_sections in results:
+        for encoded in encoded_sections:
+            section = _decode(encoded, parser.buffer)
+            info = section.parseinfo
+            section["parseinfo"] = info._replace(
+                pos=pos, line=parser.buffer.posline(pos)
+            )
+            if info.rule == "act":
+                acts.append(section)
+            elif not acts:
+                return None
+            else:
+                act = acts[-1]
+                act.scenes.append(section)
+                act["parseinfo"] = act.parseinfo._replace(
+                    endpos=info.endpos, endline=info.endline
+                )
+            pos = info.endpos
+
+    node, _ = parser._node(
+        "play",
+        0,
+        len(text),
+        title=title,
+        dramatis_personae=dramatis_personae,
+        acts=acts,
+    )
+    return node
+
+
+# The source of the play being parsed, in a worker process.
+_worker_buffer = None
+
+
+def _start_worker(text):
+    global _worker_buffer
+    _worker_buffer = SourceBuffer(text)
+
+
+def _parse_chunk(start, end):
+    sections = _PlayParser(_worker_buffer, end).sections(start)
+    if sections is None:
+        return None
+    # Sent back in the serialized form, which is much smaller than the pickled
+    # AST with its reference to the whole source.
+    return [_encode(section) for section in sections]
+
+
+class _PlayParser:
+    # Each rule method takes the position to parse from and returns a tuple of
+    # the result and the position after it, or None if the rule does not match.
+    # Like TatSu, a rule skips whitespace before each keyword and at its own
+    # start, but records its position from before the skip and its end from
+    # just after its last keyword.
+
+    def __init__(self, buffer, end=None):
+        self.buffer = buffer
+        self.text = buffer.text
+        # Where to stop parsing, for chunks of a play parsed on their own.
+        self.end = len(self.text) if end is None else end
+        self._token_cache = {}
+
+    # TOKENS
+
+    def _skip(self, pos):
+        return _WHITESPACE.match(self.text, pos, self.end).end()
+
+    def _next_token(self, pos):
+        token = self._token_cache.get(pos)
+        if token is None:
+            match = _TOKEN.match(self.text, pos, self.end)
+            if match is None:
+                token = (None, pos)
+            else:
+                token = ((match.group(1) or match.group(2)).lower(), match.end())
+            self._token_cache[pos] = token
+        return token
+
+    def _token(self, pos, keyword):
+        word, end = self._next_token(pos)
+        return end if word == keyword else None
+
+    def _token_sequence(self, pos, keywords):
+        for keyword in keywords:
+            pos = self._token(pos, keyword)
+            if pos is None:
+                return None
+        return pos
+
+    def _keyword(self, pos, rule):
+        word, end = self._next_token(self._skip(pos))
+        for rest, result in _KEYWORDS[rule].get(word, ()):
+            rest_end = self._token_sequence(end, rest)
+            if rest_end is not None:
+                return result, rest_end
+        return None
+
+    def _keywords(self, pos, *rules):
+        for rule in rules:
+            parsed = self._keyword(pos, rule)
+            if parsed is not None:
+                return parsed
+        return None
+
+    def _end_of_sentence(self, pos):
+        end = self._token(pos, "!")
+        if end is None:
+            end = self._token(pos, ".")
+        return end
+
+    def _node(self, rule, pos, end, **fields):
+        node = Node(fields)
+        posline = self.buffer.posline
+        node["parseinfo"] = ParseInfo(
+            self.buffer, rule, pos, end, posline(pos), posline(end)
+        )
+        return node, end
+
+    def _first(self, pos, *rules):
+        for rule in rules:
+            parsed = rule(pos)
+            if parsed is not None:
+                return parsed
+        return None
+
+    def _repeat(self, pos, rule, skip=False):
+        results = []
+        while True:
+            parsed = rule(self._skip(pos) if skip else pos)
+            if parsed is None:
+                return results, pos
+            result, pos = parsed
+            results.append(result)
+
+    # STRUCTURE
+
+    def play(self):
+        parsed = self.prologue()
+        if parsed is None:
+            return None
+        title, dramatis_personae, pos = parsed
+        acts, pos = self._repeat(pos, self._act)
+        pos = self._skip(pos)
+        if pos != self.end:
+            return None
+        node, _ = self._node(
+            "play",
+            0,
+            pos,
+            title=title,
+            dramatis_personae=dramatis_personae,
+            acts=acts,
+        )
+        return node
+
+    def prologue(self):
+        """
+        Returns:
+            A tuple of the title, the dramatis personae and the position after
+            them, or None if they cannot be parsed.
+        """
+        title, pos = self._text_before_punctuation(0)
+        pos = self._end_of_sentence(pos)
+        if pos is None:
+            return None
+        dramatis_personae, pos = self._dramatis_personae(pos)
+        return title, dramatis_personae, pos
+
+    def sections(self, start):
+        """Parse the acts and scenes from start to the end of the chunk.
+
+        Returns:
+            A list of the acts, each without its scenes, and scenes in order,
+            or None if they cannot be parsed.
+        """
+        sections, pos = self._repeat(start, self._section)
+        if self._skip(pos) != self.end:
+            return None
+        return sections
+
+    def outline(self):
+        prologue = self.prologue()
+        if prologue is None:
+            return None
+        title, dramatis_personae, pos = prologue
+
+        acts = []
+        # Where the next heading must be, right after the dramatis personae or
+        # an act heading; anywhere after a scene heading.
+        expected = self._skip(pos)
+        while True:
+            match = _OUTLINE_WORD.search(self.text, pos)
+            if match is None:
+                break
+            if match.group(1):
+                # The text of a Recall sentence could contain anything.
+                _, pos = self._text_before_punctuation(match.end())
+                continue
+            start = match.start()
+            keyword = match.group(2).lower()
+            parsed = self._heading(start, keyword)
+            if parsed is None or expected not in (None, start):
+                return None
+            number, name, pos = parsed
+            if keyword == "act":
+                act, _ = self._node(
+                    "act", start, pos, name=name, number=number, scenes=[]
+                )
+                acts.append(act)
+                expected = self._skip(pos)
+            elif not acts:
+                return None
+            else:
+                scene, _ = self._node(
+                    "scene", start, pos, events=None, name=name, number=number
+                )
+                acts[-1].scenes.append(scene)
+                expected = None
+        if expected not in (None, self.end):
+            return None
+
+        node, _ = self._node(
+            "play",
+            0,
+            len(self.text),
+            title=title,
+            dramatis_personae=dramatis_personae,
+            acts=acts,
+        )
+        return node
+
+    def scene(self, start):
+        """Parse the scene from start to the end of the chunk.
+
+        Returns:
+            The AST of the scene, or None if it cannot be parsed.
+        """
+        parsed = self._scene(start)
+        if parsed is None:
+            return None
+        scene, pos = parsed
+        if self._skip(pos) != self.end:
+            return None
+        return scene
+
+    def _text_before_punctuation(self, pos):
+        match = _TEXT_BEFORE_PUNCTUATION.match(self.text, self._skip(pos), self.end)
+        return match.group(), match.end()
+
+    def _roman_numeral(self, pos):
+        match = _ROMAN_NUMERAL.match(self.text, self._skip(pos), self.end)
+        return self._node("roman_numeral", pos, match.end(), value=match.group())
+
+    def _dramatis_personae(self, pos):
+        return self._repeat(self._skip(pos), self._dramatis_persona, True)
+
+    def _dramatis_persona(self, start):
+        parsed = self._keyword(start, "character")
+        if parsed is None:
+            return None
+        character, pos = parsed
+        pos = self._token(pos, ",")
+        if pos is None:
+            return None
+        _, pos = self._text_before_punctuation(pos)
+        pos = self._end_of_sentence(pos)
+        if pos is None:
+            return None
+        return self._node("dramatis_persona", start, pos, character=character)
+
+    def _act(self, start):
+        parsed = self._heading(start, "act")
+        if parsed is None:
+            return None
+        number, name, pos = parsed
+        scenes, pos = self._repeat(pos, self._scene)
+        return self._node("act", start, pos, name=name, number=number, scenes=scenes)
+
+    def _scene(self, start):
+        parsed = self._heading(start, "scene")
+        if parsed is None:
+            return None
+        number, name, pos = parsed
+        events, pos = self._repeat(pos, self._event)
+        return self._node("scene", start, pos, events=events, name=name, number=number)
+
+    def _section(self, start):
+        # An act is never followed by anything but scenes, and neither can
+        # start with the other's keyword, so the scenes of an act can be parsed
+        # on their own and added to the act afterwards.
+        parsed = self._heading(start, "act")
+        if parsed is None:
+            return self._scene(start)
+        number, name, pos = parsed
+        return self._node("act", start, pos, name=name, number=number, scenes=[])
+
+    def _heading(self, start, keyword):
+        pos = self._token(start, keyword)
+        if pos is None:
+            return None
+        number, pos = self._roman_numeral(self._skip(pos))
+        pos = self._token(pos, ":")
+        if pos is None:
+            return None
+        name, pos = self._text_before_punctuation(pos)
+        pos = self._end_of_sentence(pos)
+        if pos is None:
+            return None
+        return number, name, pos
+
+    # EVENTS
+
+    def _event(self, pos):
+        return self._first(
+            self._skip(pos),
+            self._line,
+            self._breakpoint,
+            self._entrance,
+            self._exit,
+            self._exeunt,
+        )
+
+    def _line(self, start):
+        parsed = self._keyword(start, "character")
+        if parsed is None:
+            return None
+        character, pos = parsed
+        pos = self._token(pos, ":")
+        if pos is None:
+            return None
+        parsed = self._sentence(self._skip(pos))
+        if parsed is None:
+            return None
+        sentence, pos = parsed
+        sentences, pos = self._repeat(pos, self._sentence, True)
+        contents = [sentence] + sentences
+        return self._node("line", start, pos, character=character, contents=contents)
+
+    def _breakpoint(self, start):
+        pos = self._token_sequence(start, ("[", "a", "pause", "]"))
+        if pos is None:
+            return None
+        return self._node("breakpoint", start, pos, dummy=["[", "A", "pause", "]"])
+
+    def _entrance(self, start):
+        pos = self._token_sequence(start, ("[", "enter"))
+        if pos is None:
+            return None
+        parsed = self._character_list(pos)
+        if parsed is None:
+            return None
+        characters, pos = parsed
+        pos = self._token(pos, "]")
+        if pos is None:
+            return None
+        return self._node("entrance", start, pos, characters=characters)
+
+    def _exit(self, start):
+        pos = self._token_sequence(start, ("[", "exit"))
+        if pos is None:
+            return None
+        parsed = self._keyword(pos, "character")
+        if parsed is None:
+            return None
+        character, pos = parsed
+        pos = self._token(pos, "]")
+        if pos is None:
+            return None
+        return self._node("exit", start, pos, character=character)
+
+    def _exeunt(self, start):
+        pos = self._token_sequence(start, ("[", "exeunt"))
+        if pos is None:
+            return None
+        characters = None
+        parsed = self._character_list(pos)
+        if parsed is not None:
+            characters, pos = parsed
+        pos = self._token(pos, "]")
+        if pos is None:
+            return None
+        return self._node("exeunt", start, pos, action="Exeunt", characters=characters)
+
+    def _character_list(self, pos):
+        parsed = self._keyword(pos, "character")
+        if parsed is None:
+            return None
+        first, after_first = parsed
+        characters = [first]
+        pos = after_first
+        while True:
+            after_comma = self._token(pos, ",")
+            parsed = after_comma and self._keyword(after_comma, "character")
+            if not parsed:
+                break
+            characters.append(parsed[0])
+            pos = parsed[1]
+        after_and = self._token(pos, "and")
+        parsed = after_and and self._keyword(after_and, "character")
+        if not parsed:
+            return [first], after_first
+        characters.append(parsed[0])
+        return characters, parsed[1]
+
+    # SENTENCES
+
+    def _sentence(self, start):
+        pos = self._skip(start)
+        condition = None
+        parsed = self._condition(pos)
+        if parsed is not None:
+            condition, pos = parsed
+        parsed = self._first(
+            pos,
+            self._question,
+            self._assignment,
+            self._goto,
+            self._output,
+            self._input,
+            self._push,
+            self._pop,
+        )
+        if parsed is None:
+            return None
+        operation, pos = parsed
+        return self._node(
+            "sentence", start, pos, condition=condition, operation=operation
+        )
+
+    def _condition(self, start):
+        for rule, keyword in (("negative_if", "not"), ("positive_if", "so")):
+            pos = self._token_sequence(start, ("if", keyword, ","))
+            if pos is not None:
+                return self._node(rule, start, pos, if_=["If", keyword, ","])
+        return None
+
+    def _question(self, start):
+        parsed = self._keyword(start, "be")
+        parsed = parsed and self._value(parsed[1])
+        if not parsed:
+            return None
+        first_value, pos = parsed
+        parsed = self._first(
+            pos,
+            self._positive_comparative,
+            self._neutral_comparative,
+            self._negative_comparative,
+        )
+        if parsed is None:
+            return None
+        comparative, pos = parsed
+        parsed = self._value(pos)
+        if parsed is None:
+            return None
+        second_value, pos = parsed
+        pos = self._token(pos, "?")
+        if pos is None:
+            return None
+        return self._node(
+            "question",
+            start,
+            pos,
+            comparative=comparative,
+            first_value=first_value,
+            second_value=second_value,
+        )
+
+    def _comparative(self, start, rule, keywords, adjective_rule):
+        pos = self._skip(start)
+        word, end = self._next_token(pos)
+        if word in keywords:
+            comparison = word
+        elif word == "more":
+            parsed = self._keyword(end, adjective_rule)
+            if parsed is None:
+                return None
+            comparison = ["more", parsed[0]]
+            end = parsed[1]
+        else:
+            return None
+        end = self._token(end, "than")
+        if end is None:
+            return None
+        return self._node(rule, start, end, comparison=comparison)
+
+    def _positive_comparative(self, start):
+        return self._comparative(
+            start,
+            "positive_comparative",
+            ("better", "bigger", "fresher", "friendlier", "nicer", "jollier"),
+            "positive_adjective",
+        )
+
+    def _negative_comparative(self, start):
+        return self._comparative(
+            start,
+            "negative_comparative",
+            ("punier", "smaller", "worse"),
+            "negative_adjective",
+        )
+
+    def _neutral_comparative(self, start):
+        pos = self._token(start, "as")
+        parsed = pos and self._keywords(
+            pos,
+            "negative_adjective",
+            "positive_adjective",
+            "neutral_adjective",
+        )
+        if not parsed:
+            return None
+        comparison, pos = parsed
+        pos = self._token(pos, "as")
+        if pos is None:
+            return None
+        return self._node("neutral_comparative", start, pos, comparison=comparison)
+
+    def _assignment(self, start):
+        parsed = self._keyword(start, "second_person")
+        if parsed is None:
+            return None
+        pos = parsed[1]
+        parsed = self._keyword(pos, "be")
+        if parsed is not None:
+            pos = parsed[1]
+        after_as = self._token(pos, "as")
+        if after_as is not None:
+            pos = after_as
+            parsed = self._keywords(
+                pos, "positive_adjective", "neutral_adjective", "negative_adjective"
+            )
+            after_second_as = parsed and self._token(parsed[1], "as")
+            if after_second_as:
+                pos = after_second_as
+        parsed = self._value(pos)
+        if parsed is None:
+            return None
+        value, pos = parsed
+        pos = self._end_of_sentence(pos)
+        if pos is None:
+            return None
+        return self._node("assignment", start, pos, value=value)
+
+    def _goto(self, start):
+        parsed = self._keyword(start, "let_us")
+        parsed = parsed and self._keyword(parsed[1], "proceed_to")
+        pos = parsed and self._token(parsed[1], "scene")
+        if not pos:
+            return None
+        destination, pos = self._roman_numeral(pos)
+        pos = self._end_of_sentence(pos)
+        if pos is None:
+            return None
+        return self._node("goto", start, pos, destination=destination)
+
+    def _output(self, start):
+        fields = {"output_char": None, "output_number": None}
+        pos = self._second_person_phrase(start, ("open",), "heart")
+        if pos is not None:
+            fields["output_number"] = pos[0]
+        else:
+            pos = self._second_person_phrase(start, ("speak",), "mind")
+            if pos is None:
+                return None
+            fields["output_char"] = pos[0]
+        end = self._end_of_sentence(pos[1])
+        if end is None:
+            return None
+        return self._node("output", start, end, **fields)
+
+    def _input(self, start):
+        fields = {"input_char": None, "input_number": None}
+        pos = self._second_person_phrase(start, ("listen", "to"), "heart")
+        if pos is not None:
+            fields["input_number"] = pos[0]
+        else:
+            pos = self._second_person_phrase(start, ("open",), "mind")
+            if pos is None:
+                return None
+            fields["input_char"] = pos[0]
+        end = self._end_of_sentence(pos[1])
+        if end is None:
+            return None
+        return self._node("input", start, end, **fields)
+
+    def _second_person_phrase(self, pos, before, after):
+        # As in "listen to your heart": returns the words as spelled in the
+        # grammar, and the position after them.
+        pos = self._token_sequence(pos, before)
+        parsed = pos and self._keyword(pos, "second_person_possessive")
+        pos = parsed and self._token(parsed[1], after)
+        if not pos:
+            return None
+        return [*before, parsed[0], after], pos
+
+    def _push(self, start):
+        pos = self._token(start, "remember")
+        parsed = pos and self._value(pos)
+        if not parsed:
+            return None
+        value, pos = parsed
+        pos = self._end_of_sentence(pos)
+        if pos is None:
+            return None
+        return self._node("push", start, pos, value=value)
+
+    def _pop(self, start):
+        pos = self._token(start, "recall")
+        if pos is None:
+            return None
+        recall_string, pos = self._text_before_punctuation(pos)
+        pos = self._end_of_sentence(pos)
+        if pos is None:
+            return None
+        return self._node("pop", start, pos, recall_string=recall_string)
+
+    # VALUES
+
+    def _value(self, pos):
+        return self._first(
+            self._skip(pos),
+            self._binary_expression,
+            self._unary_expression,
+            self._first_person_value,
+            self._second_person_value,
+            self._negative_noun_phrase,
+            self._positive_noun_phrase,
+            self._character_name,
+            self._nothing,
+        )
+
+    def _binary_expression(self, start):
+        parsed = self._keyword(start, "binary_operation")
+        if parsed is None:
+            return None
+        operation, pos = parsed
+        parsed = self._value(pos)
+        if parsed is None:
+            return None
+        first_value, pos = parsed
+        pos = self._token(pos, "and")
+        parsed = pos and self._value(pos)
+        if not parsed:
+            return None
+        second_value, pos = parsed
+        return self._node(
+            "binary_expression",
+            start,
+            pos,
+            first_value=first_value,
+            operation=operation,
+            second_value=second_value,
+        )
+
+    def _unary_expression(self, start):
+        parsed = self._keyword(start, "unary_operation")
+        if parsed is None:
+            return None
+        operation, pos = parsed
+        parsed = self._value(pos)
+        if parsed is None:
+            return None
+        value, pos = parsed
+        return self._node(
+            "unary_expression", start, pos, operation=operation, value=value
+        )
+
+    def _first_person_value(self, start):
+        parsed = self._keywords(start, "first_person", "first_person_reflexive")
+        if parsed is None:
+            return None
+        word, pos = parsed
+        return self._node("first_person_value", start, pos, first_person_word=word)
+
+    def _second_person_value(self, start):
+        parsed = self._keywords(start, "second_person", "second_person_reflexive")
+        if parsed is None:
+            return None
+        word, pos = parsed
+        return self._node("second_person_value", start, pos, second_person_word=word)
+
+    def _noun_phrase(self, rule, start, adjective_rules, noun_rules):
+        pos = start
+        parsed = self._keywords(
+            pos,
+            "article",
+            "first_person_possessive",
+            "second_person_possessive",
+            "third_person_possessive",
+        )
+        if parsed is not None:
+            pos = parsed[1]
+        adjectives = []
+        while True:
+            parsed = self._keywords(pos, *adjective_rules)
+            if parsed is None:
+                break
+            adjectives.append(parsed[0])
+            pos = parsed[1]
+        parsed = self._keywords(pos, *noun_rules)
+        if parsed is None:
+            return None
+        noun, pos = parsed
+        return self._node(rule, start, pos, adjectives=adjectives, noun=noun)
+
+    def _negative_noun_phrase(self, start):
+        return self._noun_phrase(
+            "negative_noun_phrase",
+            start,
+            ("negative_adjective", "neutral_adjective"),
+            ("negative_noun",),
+        )
+
+    def _positive_noun_phrase(self, start):
+        return self._noun_phrase(
+            "positive_noun_phrase",
+            start,
+            ("positive_adjective", "neutral_adjective"),
+            ("positive_noun", "neutral_noun"),
+        )
+
+    def _character_name(self, start):
+        parsed = self._keyword(start, "character")
+        if parsed is None:
+            return None
+        name, pos = parsed
+        return self._node("character_name", start, pos, name=name)
+
+    def _nothing(self, start):
+        word, pos = self._next_token(start)
+        if word not in ("nothing", "zero"):
+            return None
+        return self._node("nothing", start, pos, nothing_word=word)
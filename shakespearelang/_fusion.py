@@ -0,0 +1,106 @@
+from ._operation import Question, Assignment, Output, Goto, _VERBOSE_OUTPUT_STYLES
+from .errors import ShakespeareRuntimeError
+
+
+class FusedOperationError(Exception):
+    """Raised by a fused operation when an operation after its first one fails,
+    so that the interpreter can stop at the operation that failed."""
+
+    def __init__(self, error, position):
+        self.error = error
+        self.position = position
+        super().__init__()
+
+
+def fuse_operations(play, output_style):
+    """Combine adjacent operations that are commonly run together.
+
+    Returns a list of compiled operations for running the play straight
+    through. Where a pair of operations is fused, the first position holds a
+    function that runs both and returns the position to continue from, so the
+    interpreter makes one call instead of two. The second position keeps its own
+    compiled operation, for jumps to it and for stepping through the play one
+    operation at a time.
+    """
+    operations = play.operations
+    compiled_operations = play.compiled_operations(output_style)
+    fused_operations = list(compiled_operations)
+    position = 0
+    while position + 1 < len(operations):
+        pair = (type(operations[position]), type(operations[position + 1]))
+        fuser = _FUSERS.get(pair)
+        fused = fuser(play, output_style, position) if fuser else None
+        if fused is None:
+            position += 1
+            continue
+        fused_operations[position] = fused
+        position += 2
+    return fused_operations
+
+
+def _fuse_sequence(play, output_style, position):
+    compiled_operations = play.compiled_operations(output_style)
+    first = compiled_operations[position]
+    second = compiled_operations[position + 1]
+    second_position = position + 1
+    next_position = position + 2
+
+    def run(state, settings):
+        first(state, settings)
+        try:
+            new_position = second(state, settings)
+        except ShakespeareRuntimeError as exc:
+            raise FusedOperationError(exc, second_position) from None
+        if new_position is None or new_position == second_position:
+            return next_position
+        return new_position
+
+    return run
+
+
+def _fuse_question_goto(play, output_style, position):
+    question, goto = play.operations[position], play.operations[position + 1]
+    destination = goto.destination_position
+    if destination == position:
+        # Landing on the fused operation would count as not jumping at all.
+        return None
+    if destination == position + 1:
+        # Jumping to the Goto itself moves on past it.
+        destination = position + 2
+
+    # With verbose output, or without knowing who is on stage, there is nothing
+    # to gain over running the two operations one after the other.
+    sequence = _fuse_sequence(play, output_style, position)
+    if output_style in _VERBOSE_OUTPUT_STYLES:
+        return sequence
+    stage = play.stages[position]
+    slots = play.character_slots
+    speakers = {question.character, goto.character}
+    if stage is None or not all(
+        name in slots and stage & (1 << slots[name]) for name in speakers
+    ):
+        return sequence
+
+    compare = question._compile_comparison(slots, stage)
+    has_condition = goto.has_condition
+    condition_type_positive = goto.condition_type_positive
+    next_position = position + 2
+
+    def run(state, settings):
+        if state.stage_mask != stage:
+            return sequence(state, settings)
+
+        result = compare(state)
+        state.global_boolean = result
+        if not has_condition or result == condition_type_positive:
+            return destination
+        return next_position
+
+    return run
+
+
+_FUSERS = {
+    (Question, Goto): _fuse_question_goto,
+    (Question, Output): _fuse_sequence,
+    (Assignment, Output): _fuse_sequence,
+}
@@ -1,10 +1,43 @@
 from .errors import ShakespeareRuntimeError
+from ._output import _flush_stream
+import io
+import mmap
+import os
+import re
+import stat
 import sys
 
+# The most input read at once, when a line is longer than that.
+_READ_SIZE = 64 * 1024
+_DIGITS = re.compile(r"\d+")
+_BINARY_DIGITS = re.compile(rb"\d+")
+
 
 class BasicInputManager:
-    def __init__(self):
-        self._input_buffer = ""
+    """
+    Reads input from standard input a line at a time, or a block at a time for
+    long lines, and consumes it by moving a position through what was read, so
+    that consuming a character takes the same time however long the line is.
+    """
+
+    _EMPTY = ""
+    _NEWLINE = "\n"
+    _DIGITS = _DIGITS
+
+    def __init__(self, flush_output=None, stdin=None, stdout=None):
+        """
+        Arguments:
+            flush_output: Called before reading input, to make all output that
+                has already happened appear before it.
+            stdin: The file-like object to read input from instead of standard
+                input, which must be binary for BinaryInputManager.
+            stdout: Not used, since there is no prompt for input. Accepted so
+                that all input managers are created the same way.
+        """
+        self._flush_output = flush_output or _flush_stdout
+        self._stdin = stdin
+        self._input_buffer = self._EMPTY
+        self._position = 0
 
     def consume_numeric_input(self):
         try:
@@ -18,54 +51,190 @@ class BasicInputManager:
         return number
 
     def _consume_newline_if_present(self):
-        if self._input_buffer and self._input_buffer[0] == "\n":
-            self._input_buffer = self._input_buffer[1:]
+        if self._position == len(self._input_buffer):
+            self._read_more_of_line()
+        position = self._position
+        if self._input_buffer[position : position + 1] == self._NEWLINE:
+            self._position = position + 1
 
     def _consume_digits(self):
-        number_input = ""
-        while self._input_buffer and self._input_buffer[0].isdigit():
-            number_input += self._input_buffer[0]
-            self._input_buffer = self._input_buffer[1:]
-
-        if len(number_input) == 0:
+        digits = []
+        while True:
+            match = self._DIGITS.match(self._input_buffer, self._position)
+            if match is None:
+                break
+            digits.append(match.group())
+            self._position = match.end()
+            # The number may go on in the rest of a long line.
+            if (
+                self._position < len(self._input_buffer)
+                or not self._read_more_of_line()
+            ):
+                break
+
+        if not digits:
             raise ShakespeareRuntimeError("No numeric input was given.")
 
-        return int(number_input)
+        return int(self._EMPTY.join(digits))
 
     def consume_character_input(self):
-        try:
-            self._ensure_input_buffer()
-        except EOFError:
-            return -1
+        position = self._position
+        if position == len(self._input_buffer):
+            try:
+                self._ensure_input_buffer()
+            except EOFError:
+                return -1
+            position = self._position
 
-        value = ord(self._input_buffer[0])
-        self._input_buffer = self._input_buffer[1:]
-        return value
+        self._position = position + 1
+        return ord(self._input_buffer[position])
 
     def _ensure_input_buffer(self):
-        if not self._input_buffer:
+        if self._position == len(self._input_buffer):
             # We want all output that has already happened to appear before we
             # ask the user for input
-            sys.stdout.flush()
-            self._input_buffer = sys.stdin.readline()
+            self._flush_output()
+            self._read()
             if not self._input_buffer:
                 raise EOFError()
 
+    def _read_more_of_line(self):
+        """Read more of the line the input buffer ends in the middle of, once
+        all of the buffer has been consumed. Returns whether there was more."""
+        if self._input_buffer[-1:] == self._NEWLINE:
+            return False
+        self._read()
+        return bool(self._input_buffer)
+
+    def _read(self):
+        # Never reads past the end of a line, so input is not waited for
+        # before it is needed, and whatever follows is left for anything else
+        # reading standard input.
+        self._input_buffer = self._readline()
+        self._position = 0
+
+    def _readline(self):
+        return self._stream().readline(_READ_SIZE)
+
+    def _stream(self):
+        # Standard input is looked up when read, since it may have been replaced.
+        return sys.stdin if self._stdin is None else self._stdin
+
+
+class BinaryInputManager(BasicInputManager):
+    """
+    Reads input from standard input as bytes rather than text, so that each
+    character of input is a byte value from 0 to 255 and nothing is decoded.
+
+    When the input is a regular file, the rest of it is memory-mapped and
+    consumed straight from the mapping, so that however large the file is it is
+    neither read into memory nor copied a line at a time.
+    """
+
+    _EMPTY = b""
+    _NEWLINE = b"\n"
+    _DIGITS = _BINARY_DIGITS
+
+    def __init__(self, flush_output=None, stdin=None, stdout=None):
+        super().__init__(flush_output, stdin, stdout)
+        self._tried_mapping = False
+
+    def consume_character_input(self):
+        position = self._position
+        if position == len(self._input_buffer):
+            try:
+                self._ensure_input_buffer()
+            except EOFError:
+                return -1
+            position = self._position
+
+        self._position = position + 1
+        # Indexing bytes gives the byte value.
+        return self._input_buffer[position]
+
+    def _read(self):
+        if not self._tried_mapping:
+            self._tried_mapping = True
+            if self._map_input():
+                return
+        super()._read()
+
+    def _map_input(self):
+        """Map the rest of the input into the input buffer if it is a regular
+        file. Returns whether it was mapped."""
+        stdin = self._stream()
+        try:
+            fileno = stdin.fileno()
+            if not stat.S_ISREG(os.fstat(fileno).st_mode):
+                return False
+            start = stdin.tell()
+            mapping = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Not a file at all, or an empty one, which cannot be mapped.
+            return False
+        if start >= len(mapping):
+            mapping.close()
+            return False
+
+        # The mapping holds all the rest of the input, so the file is left at
+        # its end, where reading it again finds the end of the input.
+        stdin.seek(0, io.SEEK_END)
+        self._input_buffer = mapping
+        self._position = start
+        return True
+
+    def _stream(self):
+        return sys.stdin.buffer if self._stdin is None else self._stdin
+
 
 class InteractiveInputManager:
+    def __init__(self, flush_output=None, stdin=None, stdout=None):
+        """
+        Arguments:
+            flush_output: Called before asking for input, to make all output
+                that has already happened appear before the prompt.
+            stdin: The file-like object to read input from instead of standard
+                input.
+            stdout: The file-like object to write prompts to instead of
+                standard output.
+        """
+        self._flush_output = flush_output or _flush_stdout
+        self._stdin = stdin
+        self._stdout = stdout
+
     def consume_numeric_input(self):
+        self._flush_output()
         try:
-            value = int(input("Taking input number: "))
+            value = int(self._input("Taking input number: "))
         except ValueError:
             raise ShakespeareRuntimeError("No numeric input was given.")
 
         return value
 
     def consume_character_input(self):
-        value = input("Taking input character: ")
+        self._flush_output()
+        value = self._input("Taking input character: ")
         if value == "EOF":
             return -1
         elif value == "":
             return ord("\n")
         else:
             return ord(value[0])
+
+    def _input(self, prompt):
+        if self._stdin is None and self._stdout is None:
+            return input(prompt)
+
+        stdout = sys.stdout if self._stdout is None else self._stdout
+        stdout.write(prompt)
+        _flush_stream(stdout)
+        stdin = sys.stdin if self._stdin is None else self._stdin
+        line = stdin.readline()
+        if not line:
+            raise EOFError()
+        return line[:-1] if line.endswith("\n") else line
+
+
+def _flush_stdout():
+    # Looked up when called, since sys.stdout may have been replaced.
+    sys.stdout.flush()
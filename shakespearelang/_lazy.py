@@ -0,0 +1,158 @@
+"""
+Plays whose scenes are only parsed when the play first reaches them, so that a
+play can start running before all of it is parsed.
+
+The operations of a lazily parsed play start with one placeholder for each
+scene, in order, where Gotos and the scene before it go to. The first time a
+placeholder runs, its scene is parsed and its operations are added to the end of
+the play, followed by a jump to the placeholder of the next scene; from then on
+the placeholder jumps to them. Positions of operations never change, so the
+interpreter runs a lazily parsed play just like any other.
+"""
+
+from ._preprocess import Play
+from ._operation import operations_from_event, Operation, Breakpoint, Goto
+from typing import TYPE_CHECKING, Callable
+from bisect import bisect_right
+import sys
+
+if TYPE_CHECKING:
+    from tatsu.ast import AST
+
+# Where the jump after the last scene goes: past the end of the play, however
+# many scenes have been added to it.
+END_OF_PLAY = sys.maxsize
+
+
+class LazyPlay(Play):
+    def __init__(self, outline: "AST", parse_scene: Callable):
+        """
+        Arguments:
+            outline: The AST of the play with no events in its scenes.
+            parse_scene: Called with the outlines of an act and one of its
+                scenes and where the scene ends, to parse the scene.
+        """
+        self._parse_scene = parse_scene
+        # The outlines of each scene and its act, in order, where the scene
+        # ends, and where its operations start once it is parsed.
+        self._scenes = []
+        self._scene_ends = None
+        self._scene_positions = []
+        self._operation_acts = []
+        super().__init__(outline)
+        # Added to as scenes are parsed.
+        self.breakpoint_positions = set()
+
+    def fused_operations(self, output_style: str):
+        """The same as compiled_operations: operations are not fused, because
+        the pairs of them that could be are not known in advance."""
+        return self.compiled_operations(output_style)
+
+    def get_act(self, position: int):
+        return self._operation_acts[min(position, len(self._operation_acts) - 1)]
+
+    def scene_position(self, index: int):
+        """The position of the first operation of a scene, which is parsed
+        first if it has not been yet."""
+        position = self._scene_positions[index]
+        if position is None:
+            position = self._add_scene_operations(index)
+        return position
+
+    def parse_all_scenes(self):
+        """Parse every scene that has not been parsed yet."""
+        for index in range(len(self._scenes)):
+            self.scene_position(index)
+
+    def _preprocess(self, ast: "AST"):
+        self._add_characters(ast)
+
+        for act in ast.acts:
+            act_number = self._add_act(act)
+            for scene in act.scenes:
+                self._add_scene(act_number, scene)
+                self._scenes.append((act, scene))
+                self._scene_positions.append(None)
+                self._operation_acts.append(act_number)
+                self.operations.append(_SceneStart(scene, len(self._scenes) - 1))
+
+        # Each scene ends where the next act or scene starts.
+        starts = [
+            heading.parseinfo.pos for act in ast.acts for heading in [act, *act.scenes]
+        ]
+        starts.append(len(ast.parseinfo.tokenizer.text))
+        self._scene_ends = [
+            starts[bisect_right(starts, scene.parseinfo.pos)]
+            for _, scene in self._scenes
+        ]
+
+    def _add_scene_operations(self, index):
+        act, outline = self._scenes[index]
+        scene = self._parse_scene(act, outline, self._scene_ends[index])
+        operations = []
+        for event in scene.events:
+            operations += operations_from_event(event)
+        for operation in operations:
+            if isinstance(operation, Goto):
+                operation.resolve(self, act.number.value)
+        if index + 1 < len(self._scenes):
+            operations.append(_Jump(scene, index + 1))
+        else:
+            operations.append(_Jump(scene, END_OF_PLAY))
+
+        start = len(self.operations)
+        stages = [None] * len(operations)
+        for output_style, compiled_operations in self._compiled_operations.items():
+            compiled_operations += self._compile_operations(
+                operations, stages, output_style
+            )
+        self.operations += operations
+        self.stages += stages
+        self._operation_acts += [act.number.value] * len(operations)
+        self.breakpoint_positions.update(
+            start + offset
+            for offset, operation in enumerate(operations)
+            if isinstance(operation, Breakpoint)
+        )
+        self._scene_positions[index] = start
+        return start
+
+    def _compile_operations(self, operations, stages, output_style):
+        compiled_operations = super()._compile_operations(
+            operations, stages, output_style
+        )
+        # The jumps between scenes are not in the play, so they are never shown
+        # in debug output.
+        return [
+            operation.compile(self) if isinstance(operation, _JUMPS) else run
+            for operation, run in zip(operations, compiled_operations)
+        ]
+
+    def _analyze_stage(self):
+        # Who is on stage depends on scenes that have not been parsed, so it is
+        # always checked when the play runs.
+        return [None] * len(self.operations)
+
+
+class _SceneStart(Operation):
+    def __init__(self, ast_node: "AST", index: int):
+        self.ast_node = ast_node
+        self.index = index
+
+    def compile(self, play, stage=None, output_style="basic"):
+        scene_position = play.scene_position
+        index = self.index
+        return lambda state, settings: scene_position(index)
+
+
+class _Jump(Operation):
+    def __init__(self, ast_node: "AST", destination_position: int):
+        self.ast_node = ast_node
+        self.destination_position = destination_position
+
+    def compile(self, play, stage=None, output_style="basic"):
+        destination_position = self.destination_position
+        return lambda state, settings: destination_position
+
+
+_JUMPS = (_SceneStart, _Jump)
@@ -1,73 +1,137 @@
-from ._utils import normalize_name
+from ._utils import normalize_name, parseinfo_context
 from ._expression import expression_from_ast
 from .errors import ShakespeareRuntimeError, ShakespeareParseError
-from tatsu.ast import AST
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tatsu.ast import AST
 
 
 class Operation:
-    def __init__(self, ast_node: AST):
+    def __init__(self, ast_node: "AST"):
         self.ast_node = ast_node
         self._setup(ast_node)
 
     def _setup(self, ast_node):
         pass
 
-    def run(self, state, settings):
-        try:
-            self._run_logic(state, settings)
-        except ShakespeareRuntimeError as exc:
-            if not exc.parseinfo:
-                exc.parseinfo = self.ast_node.parseinfo
-            raise exc
+    def compile(self, play, stage=None, output_style="basic"):
+        """Compile this operation into a function of (state, settings).
+
+        The function returns the position to jump to, or None to continue with
+        the next operation. If stage is given, it is the stage mask (see
+        State.stage_mask) that Play has proven to hold whenever the operation
+        runs. The function only works with the given output style: with the
+        'verbose' and 'debug' styles it describes what it does, and with 'basic'
+        it does not check the style at all.
+        """
+        verbose = output_style in _VERBOSE_OUTPUT_STYLES
+        logic = self._compile_logic_for_style(play.character_slots, stage, verbose)
+        parseinfo = self.ast_node.parseinfo
+
+        def run(state, settings):
+            try:
+                logic(state, settings)
+            except ShakespeareRuntimeError as exc:
+                if not exc.parseinfo:
+                    exc.parseinfo = parseinfo
+                raise exc
 
-    def _run_logic(self, state, settings):
-        pass
+        return run
+
+    def _compile_logic_for_style(self, character_slots, stage, verbose):
+        logic = self._compile_logic(character_slots, stage)
+        if not verbose:
+            return logic
+        return self._add_verbose_output(logic)
+
+    def _compile_logic(self, character_slots, stage):
+        return lambda state, settings: None
+
+    def _add_verbose_output(self, logic):
+        return logic
+
+
+_VERBOSE_OUTPUT_STYLES = ["verbose", "debug"]
+
+
+def add_debug_output(operation, run):
+    """Wrap a compiled operation to show where the play is and its state before
+    running it, for the 'debug' output style."""
+    parseinfo = operation.ast_node.parseinfo
+    location = (
+        f"----------\nat line {parseinfo.line}\n-----\n"
+        + parseinfo_context(parseinfo)
+        + "-----\n"
+    )
+
+    def debug_run(state, settings):
+        print(location + str(state) + "\n----------", file=settings.stdout)
+        return run(state, settings)
+
+    return debug_run
+
+
+def _print_before(message, logic):
+    def verbose_logic(state, settings):
+        print(message, file=settings.stdout)
+        logic(state, settings)
+
+    return verbose_logic
 
 
 class Entrance(Operation):
-    def _setup(self, ast_node: AST):
+    def _setup(self, ast_node: "AST"):
         self.characters = [normalize_name(c) for c in ast_node.characters]
 
-    def _run_logic(self, state, settings):
-        if settings.output_style in ["verbose", "debug"]:
-            print(f"Enter {', '.join(self.characters)}")
-        state.enter_characters(self.characters)
+    def _compile_logic(self, character_slots, stage):
+        characters = self.characters
+        return lambda state, settings: state.enter_characters(characters)
+
+    def _add_verbose_output(self, logic):
+        return _print_before(f"Enter {', '.join(self.characters)}", logic)
 
 
 class Exit(Operation):
-    def _setup(self, ast_node: AST):
+    def _setup(self, ast_node: "AST"):
         self.character = normalize_name(ast_node.character)
 
-    def _run_logic(self, state, settings):
-        if settings.output_style in ["verbose", "debug"]:
-            print(f"Exit {self.character}")
-        state.exit_character(self.character)
+    def _compile_logic(self, character_slots, stage):
+        character = self.character
+        return lambda state, settings: state.exit_character(character)
+
+    def _add_verbose_output(self, logic):
+        return _print_before(f"Exit {self.character}", logic)
 
 
 class Exeunt(Operation):
-    def _setup(self, ast_node: AST):
+    def _setup(self, ast_node: "AST"):
         if ast_node.characters:
             self.characters = [normalize_name(c) for c in ast_node.characters]
         else:
             self.characters = None
 
-    def _run_logic(self, state, settings):
-        if self.characters is not None:
-            if settings.output_style in ["verbose", "debug"]:
-                print(f"Exeunt {', '.join(self.characters)}")
-            state.exeunt_characters(self.characters)
-        else:
-            if settings.output_style in ["verbose", "debug"]:
-                print("Exeunt all")
-            state.exeunt_all()
+    def _compile_logic(self, character_slots, stage):
+        characters = self.characters
+        if characters is None:
+            return lambda state, settings: state.exeunt_all()
+        return lambda state, settings: state.exeunt_characters(characters)
+
+    def _add_verbose_output(self, logic):
+        if self.characters is None:
+            return _print_before("Exeunt all", logic)
+        return _print_before(f"Exeunt {', '.join(self.characters)}", logic)
 
 
 class Breakpoint(Operation):
-    pass
+    def compile(self, play, stage=None, output_style="basic"):
+        # Breakpoints only do something when the interpreter is given a
+        # callback for them, which it calls itself.
+        return lambda state, settings: None
 
 
 class SentenceOperation(Operation):
-    def __init__(self, ast_node: AST, character: str):
+    def __init__(self, ast_node: "AST", character: str):
         self.ast_node = ast_node
         self.op_ast_node = ast_node.operation
         self.character = normalize_name(character)
@@ -83,22 +147,93 @@ class SentenceOperation(Operation):
     def _setup(self):
         pass
 
-    def run(self, state, settings):
-        state.assert_character_on_stage(self.character)
+    def compile(self, play, stage=None, output_style="basic"):
+        verbose = output_style in _VERBOSE_OUTPUT_STYLES
+        # As long as the stage matches, sentences skip checking who is on stage.
+        logic = self._compile_logic_for_style(play.character_slots, None, verbose)
+        character = self.character
+        # A speaker without a slot was never initialized, so the check below
+        # always raises for them and the logic never sees a slot of None.
+        slot = play.character_slots.get(character)
+        parseinfo = self.ast_node.parseinfo
+
+        def run(state, settings):
+            if slot is None or not state.on_stage[slot]:
+                state.assert_character_on_stage(character)
 
-        if self.has_condition and self.condition_type_positive != state.global_boolean:
-            if settings.output_style in ["verbose", "debug"]:
-                print(
-                    f"Not executing conditional {type(self).__name__.lower()}, global boolean is {state.global_boolean}"
-                )
-        else:
             try:
-                self._run_logic(state, settings)
+                logic(state, settings)
             except ShakespeareRuntimeError as exc:
                 if not exc.parseinfo:
-                    exc.parseinfo = self.ast_node.parseinfo
+                    exc.parseinfo = parseinfo
                 raise exc
 
+        if stage is not None and slot is not None and stage & (1 << slot):
+            run = self._compile_for_stage(play, stage, verbose, run)
+
+        if not self.has_condition:
+            return run
+
+        condition_type_positive = self.condition_type_positive
+        operation_name = type(self).__name__.lower()
+
+        def run_conditional(state, settings):
+            if condition_type_positive == state.global_boolean:
+                return run(state, settings)
+
+            if slot is None or not state.on_stage[slot]:
+                state.assert_character_on_stage(character)
+
+        def run_conditional_verbose(state, settings):
+            if condition_type_positive == state.global_boolean:
+                return run(state, settings)
+
+            if slot is None or not state.on_stage[slot]:
+                state.assert_character_on_stage(character)
+            print(
+                f"Not executing conditional {operation_name}, global boolean is {state.global_boolean}",
+                file=settings.stdout,
+            )
+
+        return run_conditional_verbose if verbose else run_conditional
+
+    def _compile_for_stage(self, play, stage, verbose, checked_run):
+        logic = self._compile_logic_for_style(play.character_slots, stage, verbose)
+        parseinfo = self.ast_node.parseinfo
+
+        def run(state, settings):
+            # The state can still differ from what the analysis proved, e.g.
+            # after events run from the debugger, so fall back to the checked
+            # version when it does.
+            if state.stage_mask != stage:
+                return checked_run(state, settings)
+
+            try:
+                logic(state, settings)
+            except ShakespeareRuntimeError as exc:
+                if not exc.parseinfo:
+                    exc.parseinfo = parseinfo
+                raise exc
+
+        return run
+
+    def _print_opposite_after(self, describe, logic):
+        # For sentences acting on the character being spoken to: by the time
+        # the logic has run without errors, that character is known to exist.
+        character = self.character
+
+        def verbose_logic(state, settings):
+            logic(state, settings)
+            character_opposite = state.character_opposite(character)
+            print(
+                describe(
+                    character_opposite, state.character_by_name(character_opposite)
+                ),
+                file=settings.stdout,
+            )
+
+        return verbose_logic
+
 
 class Question(SentenceOperation):
     _COMPARATIVE_TYPE_HANDLERS = {
@@ -121,108 +256,227 @@ class Question(SentenceOperation):
             )
         self.comparison = self._COMPARATIVE_TYPE_HANDLERS[comparative_rule]
 
-    def _run_logic(self, state, settings):
-        result = self._evaluate(state)
+    def _compile_comparison(self, character_slots, stage):
+        comparison = self.comparison
+        first_value = self.first_value.compile(character_slots, stage)
+        second_value = self.second_value.compile(character_slots, stage)
+        return lambda state: comparison(first_value(state), second_value(state))
 
-        if settings.output_style in ["verbose", "debug"]:
-            print(f"Setting global boolean to {result}")
+    def _compile_logic(self, character_slots, stage):
+        compare = self._compile_comparison(character_slots, stage)
 
-        state.global_boolean = result
+        def logic(state, settings):
+            state.global_boolean = compare(state)
 
-    def _evaluate(self, state) -> bool:
-        return self.comparison(
-            self.first_value.evaluate(state), self.second_value.evaluate(state)
-        )
+        return logic
+
+    def _add_verbose_output(self, logic):
+        def verbose_logic(state, settings):
+            logic(state, settings)
+            print(
+                f"Setting global boolean to {state.global_boolean}",
+                file=settings.stdout,
+            )
+
+        return verbose_logic
 
 
 class Assignment(SentenceOperation):
     def _setup(self):
         self.value = expression_from_ast(self.op_ast_node.value, self.character)
 
-    def _run_logic(self, state, settings):
-        character_opposite = state.character_opposite(self.character)
-        value = self.value.evaluate(state)
-        state.character_by_name(character_opposite).value = value
+    def _compile_logic(self, character_slots, stage):
+        character = self.character
+        slot = character_slots.get(character)
+        value_expression = self.value.compile(character_slots, stage)
 
-        if settings.output_style in ["verbose", "debug"]:
-            print(f"{character_opposite} set to {value}")
+        def logic(state, settings):
+            character_opposite = state.opposites[slot]
+            if character_opposite is None:
+                # Raises the error explaining why there is nobody to talk to.
+                state.character_opposite(character)
+            character_opposite.value = value_expression(state)
+
+        return logic
+
+    def _add_verbose_output(self, logic):
+        return self._print_opposite_after(
+            lambda name, character: f"{name} set to {character.value}", logic
+        )
 
 
 class Input(SentenceOperation):
     def _setup(self):
         self.input_type = "number" if self.op_ast_node.input_number else "char"
 
-    def _run_logic(self, state, settings):
-        character_to_set = state.character_opposite(self.character)
-        if self.input_type == "number":
-            value = settings.input_manager.consume_numeric_input()
-        else:
-            value = settings.input_manager.consume_character_input()
+    def _compile_logic(self, character_slots, stage):
+        character = self.character
+        slot = character_slots.get(character)
+        consume_number = self.input_type == "number"
+
+        def logic(state, settings):
+            character_to_set = state.opposites[slot]
+            if character_to_set is None:
+                state.character_opposite(character)
+            if consume_number:
+                character_to_set.value = settings.input_manager.consume_numeric_input()
+            else:
+                character_to_set.value = (
+                    settings.input_manager.consume_character_input()
+                )
 
-        if settings.output_style in ["verbose", "debug"]:
-            print(f"Setting {character_to_set} to input value {repr(value)}")
+        return logic
 
-        state.character_by_name(character_to_set).value = value
+    def _add_verbose_output(self, logic):
+        return self._print_opposite_after(
+            lambda name, character: f"Setting {name} to input value {repr(character.value)}",
+            logic,
+        )
 
 
 class Output(SentenceOperation):
     def _setup(self):
         self.output_type = "number" if self.op_ast_node.output_number else "char"
 
-    def _run_logic(self, state, settings):
-        character_to_output = state.character_opposite(self.character)
-        value = state.character_by_name(character_to_output).value
-        if settings.output_style in ["verbose", "debug"]:
-            print(f"Outputting {character_to_output}")
-        if self.output_type == "number":
-            settings.output_manager.output_number(value)
-        else:
-            settings.output_manager.output_character(value)
+    def _compile_logic(self, character_slots, stage):
+        character = self.character
+        slot = character_slots.get(character)
+        output_number = self.output_type == "number"
+
+        def logic(state, settings):
+            character_to_output = state.opposites[slot]
+            if character_to_output is None:
+                state.character_opposite(character)
+            if output_number:
+                settings.output_manager.output_number(character_to_output.value)
+            else:
+                settings.output_manager.output_character(character_to_output.value)
+
+        return logic
+
+    def _add_verbose_output(self, logic):
+        character = self.character
+
+        def verbose_logic(state, settings):
+            # Unlike the other sentences, this describes the output before it
+            # happens.
+            print(
+                f"Outputting {state.character_opposite(character)}",
+                file=settings.stdout,
+            )
+            logic(state, settings)
+
+        return verbose_logic
 
 
 class Push(SentenceOperation):
     def _setup(self):
         self.value = expression_from_ast(self.op_ast_node.value, self.character)
 
-    def _run_logic(self, state, settings):
-        pushing_character = state.character_opposite(self.character)
-        value = self.value.evaluate(state)
-        state.character_by_name(pushing_character).push(value)
+    def _compile_logic(self, character_slots, stage):
+        character = self.character
+        slot = character_slots.get(character)
+        value_expression = self.value.compile(character_slots, stage)
 
-        if settings.output_style in ["verbose", "debug"]:
-            print(f"{pushing_character} pushed {value}")
+        def logic(state, settings):
+            pushing_character = state.opposites[slot]
+            if pushing_character is None:
+                state.character_opposite(character)
+            pushing_character.push(value_expression(state))
+
+        return logic
+
+    def _add_verbose_output(self, logic):
+        return self._print_opposite_after(
+            lambda name, character: f"{name} pushed {character.stack[-1]}", logic
+        )
 
 
 class Pop(SentenceOperation):
-    def _run_logic(self, state, settings):
-        popping_character = state.character_opposite(self.character)
-        state.character_by_name(popping_character).pop()
+    def _compile_logic(self, character_slots, stage):
+        character = self.character
+        slot = character_slots.get(character)
 
-        if settings.output_style in ["verbose", "debug"]:
-            print(f"Popping stack of {popping_character}")
+        def logic(state, settings):
+            popping_character = state.opposites[slot]
+            if popping_character is None:
+                state.character_opposite(character)
+            popping_character.pop()
+
+        return logic
+
+    def _add_verbose_output(self, logic):
+        return self._print_opposite_after(
+            lambda name, character: f"Popping stack of {name}", logic
+        )
 
 
 class Goto(SentenceOperation):
     def _setup(self):
         self.destination = self.op_ast_node.destination.value
+        self.destination_position = None
+
+    def resolve(self, play, act, must_exist=True):
+        """Resolve the destination scene to the position of its first operation.
+
+        Must be called before compiling. Scene numbers are relative to the act
+        the Goto is in. If must_exist is false, a destination scene that does
+        not exist is only an error when the jump is taken, after the Goto has
+        checked that the speaker is on stage and its condition.
+        """
+        scenes = play.scene_indices[act]
+        if self.destination in scenes:
+            self.destination_position = scenes[self.destination]
+        elif must_exist:
+            raise self._missing_destination_error()
+
+    def _missing_destination_error(self):
+        return ShakespeareRuntimeError(
+            f"Scene {self.destination} does not exist.",
+            parseinfo=self.ast_node.parseinfo,
+        )
+
+    def compile(self, play, stage=None, output_style="basic"):
+        verbose = output_style in _VERBOSE_OUTPUT_STYLES
+        character = self.character
+        slot = play.character_slots.get(character)
+        destination = self.destination
+        destination_position = self.destination_position
+        has_condition = self.has_condition
+        condition_type_positive = self.condition_type_positive
+
+        def run(state, settings):
+            if slot is None or not state.on_stage[slot]:
+                state.assert_character_on_stage(character)
 
-    def run(self, state, interpreter, play, settings):
-        state.assert_character_on_stage(self.character)
+            if has_condition and condition_type_positive != state.global_boolean:
+                return None
+            return destination_position
 
-        if self.has_condition and self.condition_type_positive != state.global_boolean:
-            if settings.output_style in ["verbose", "debug"]:
+        def run_verbose(state, settings):
+            if slot is None or not state.on_stage[slot]:
+                state.assert_character_on_stage(character)
+
+            if has_condition and condition_type_positive != state.global_boolean:
                 print(
-                    f"Not jumping to Scene {self.destination} because global boolean is {state.global_boolean}"
+                    f"Not jumping to Scene {destination} because global boolean is {state.global_boolean}",
+                    file=settings.stdout,
                 )
-            return
+                return None
+
+            print(f"Jumping to Scene {destination}", file=settings.stdout)
+            return destination_position
+
+        checked_run = run_verbose if verbose else run
+        if destination_position is not None:
+            return checked_run
+
+        def run_to_missing_scene(state, settings):
+            checked_run(state, settings)
+            if not has_condition or condition_type_positive == state.global_boolean:
+                raise self._missing_destination_error()
 
-        if settings.output_style in ["verbose", "debug"]:
-            print(f"Jumping to Scene {self.destination}")
-        act = play.get_act(interpreter.current_position)
-        if self.destination not in play.scene_indices[act]:
-            raise ShakespeareRuntimeError(f"Scene {self.destination} does not exist.")
-        new_position = play.scene_indices[act][self.destination]
-        interpreter.current_position = new_position
+        return run_to_missing_scene
 
 
 _OPERATIONS_CONSTRUCTORS = {
@@ -240,7 +494,7 @@ _OPERATIONS_CONSTRUCTORS = {
 }
 
 
-def operations_from_event(event: AST):
+def operations_from_event(event: "AST"):
     rule = event.parseinfo.rule
     if rule == "line":
         return [operation_from_sentence(s, event.character) for s in event.contents]
@@ -248,6 +502,6 @@ def operations_from_event(event: AST):
         return [_OPERATIONS_CONSTRUCTORS[rule](event)]
 
 
-def operation_from_sentence(sentence: AST, character: str):
+def operation_from_sentence(sentence: "AST", character: str):
     sentence_operation_rule = sentence.operation.parseinfo.rule
     return _OPERATIONS_CONSTRUCTORS[sentence_operation_rule](sentence, character)
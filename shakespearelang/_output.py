@@ -1,21 +1,161 @@
 from .errors import ShakespeareRuntimeError
+import atexit
+import io
+import sys
+import weakref
+
+# Every basic output manager, so that output that was never flushed is still
+# written when the process exits.
+_basic_output_managers = weakref.WeakSet()
 
 
 class BasicOutputManager:
+    """
+    Writes output to standard output in batches, rather than one character at a
+    time: writing to standard output costs far more than the character itself.
+    """
+
+    def __init__(
+        self, buffer_size=io.DEFAULT_BUFFER_SIZE, flush_policy=None, stdout=None
+    ):
+        """
+        Arguments:
+            buffer_size: How many characters (or numbers) of output to hold
+                before writing them to standard output.
+            flush_policy: 'line' to also flush the output whenever a line ends,
+                'full' to only write it when the buffer is full or flushed.
+                By default 'line' when standard output is a terminal and
+                'full' otherwise, like Python's own standard output.
+            stdout: The file-like object to write output to instead of
+                standard output, which must be binary for BinaryOutputManager.
+        """
+        if flush_policy is None:
+            stream = sys.stdout if stdout is None else stdout
+            # File-like objects given as output need only have write.
+            isatty = getattr(stream, "isatty", None)
+            flush_policy = "line" if isatty is not None and isatty() else "full"
+        if flush_policy not in ("line", "full"):
+            raise ValueError("Unknown flush policy")
+
+        self.buffer_size = buffer_size
+        self.flush_policy = flush_policy
+        self._line_buffered = flush_policy == "line"
+        self._stdout = stdout
+        self._buffer = []
+        _basic_output_managers.add(self)
+
     def output_number(self, number):
-        print(number, end="")
+        buffer = self._buffer
+        buffer.append(str(number))
+        if len(buffer) >= self.buffer_size:
+            self._write_buffer()
 
     def output_character(self, character_code):
-        print(_code_to_character(character_code), end="")
+        # This runs for every character output, so chr is called directly.
+        try:
+            character = chr(character_code)
+        except ValueError:
+            character = _code_to_character(character_code)
+        buffer = self._buffer
+        buffer.append(character)
+        if character == "\n" and self._line_buffered:
+            self.flush()
+        elif len(buffer) >= self.buffer_size:
+            self._write_buffer()
+
+    def flush(self):
+        """Write all output held so far to standard output, and flush that."""
+        self._write_buffer()
+        _flush_stream(self._stream())
+
+    def _write_buffer(self):
+        if self._buffer:
+            text = "".join(self._buffer)
+            self._buffer.clear()
+            self._stream().write(text)
+
+    def _stream(self):
+        # Standard output is looked up when written to, since it may have been
+        # replaced.
+        return sys.stdout if self._stdout is None else self._stdout
+
+
+class BinaryOutputManager(BasicOutputManager):
+    """
+    Writes output to standard output as bytes rather than text, so that each
+    character of output is a byte value from 0 to 255 and nothing is encoded.
+    """
+
+    def __init__(
+        self, buffer_size=io.DEFAULT_BUFFER_SIZE, flush_policy=None, stdout=None
+    ):
+        super().__init__(buffer_size, flush_policy, stdout)
+        self._buffer = bytearray()
+
+    def output_number(self, number):
+        buffer = self._buffer
+        buffer += str(number).encode("ascii")
+        if len(buffer) >= self.buffer_size:
+            self._write_buffer()
+
+    def output_character(self, character_code):
+        buffer = self._buffer
+        try:
+            buffer.append(character_code)
+        except ValueError:
+            raise ShakespeareRuntimeError(
+                "Invalid byte value: " + str(character_code)
+            ) from None
+        if character_code == 10 and self._line_buffered:
+            self.flush()
+        elif len(buffer) >= self.buffer_size:
+            self._write_buffer()
+
+    def flush(self):
+        """Write all output held so far to standard output, and flush that."""
+        self._write_buffer()
+        _flush_stream(self._stream())
+
+    def _write_buffer(self):
+        if self._buffer:
+            data = bytes(self._buffer)
+            self._buffer.clear()
+            self._stream().write(data)
+
+    def _stream(self):
+        if self._stdout is not None:
+            return self._stdout
+        # Anything already written to standard output as text has to come out
+        # first.
+        sys.stdout.flush()
+        return sys.stdout.buffer
 
 
 class VerboseOutputManager:
+    def __init__(self, stdout=None):
+        """
+        Arguments:
+            stdout: The file-like object to write output to instead of
+                standard output.
+        """
+        self._stdout = stdout
+
     def output_number(self, number):
-        print(f"Outputting number: {str(number)}")
+        print(f"Outputting number: {str(number)}", file=self._stdout)
 
     def output_character(self, character_code):
         char = _code_to_character(character_code)
-        print(f"Outputting character: {repr(char)}")
+        print(f"Outputting character: {repr(char)}", file=self._stdout)
+
+    def flush(self):
+        _flush_stream(sys.stdout if self._stdout is None else self._stdout)
+
+
+def _flush_stream(stream):
+    # File-like objects given as output need only have write.
+    flush = getattr(stream, "flush", None)
+    if flush is not None:
+        flush()
 
 
 def _code_to_character(character_code):
@@ -23,3 +163,9 @@ def _code_to_character(character_code):
         return chr(character_code)
     except ValueError:
         raise ShakespeareRuntimeError("Invalid character code: " + str(character_code))
+
+
+@atexit.register
+def _flush_basic_output_managers():
+    for output_manager in list(_basic_output_managers):
+        output_manager._write_buffer()
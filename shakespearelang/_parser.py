@@ -237,71 +237,152 @@ class shakespeareParser(Parser):
     def _negative_adjective_(self):  # noqa
         with self._choice():
             with self._option():
-                self._token("bad")
-            with self._option():
-                self._token("cowardly")
-            with self._option():
-                self._token("cursed")
-            with self._option():
-                self._token("damned")
-            with self._option():
-                self._token("dirty")
-            with self._option():
-                self._token("disgusting")
-            with self._option():
-                self._token("distasteful")
-            with self._option():
-                self._token("dusty")
-            with self._option():
-                self._token("evil")
-            with self._option():
-                self._token("fat-kidneyed")
-            with self._option():
-                self._token("fatherless")
-            with self._option():
-                self._token("fat")
-            with self._option():
-                self._token("foul")
-            with self._option():
-                self._token("hairy")
-            with self._option():
-                self._token("half-witted")
-            with self._option():
-                self._token("horrible")
-            with self._option():
-                self._token("horrid")
-            with self._option():
-                self._token("infected")
-            with self._option():
-                self._token("lying")
-            with self._option():
-                self._token("miserable")
+                with self._if():
+                    self._pattern("(?i)b")
+                with self._group():
+                    self._token("bad")
             with self._option():
-                self._token("misused")
+                with self._if():
+                    self._pattern("(?i)c")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("cowardly")
+                        with self._option():
+                            self._token("cursed")
+                        self._error("expecting one of: " "'cowardly' 'cursed'")
             with self._option():
-                self._token("oozing")
+                with self._if():
+                    self._pattern("(?i)d")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("damned")
+                        with self._option():
+                            self._token("dirty")
+                        with self._option():
+                            self._token("disgusting")
+                        with self._option():
+                            self._token("distasteful")
+                        with self._option():
+                            self._token("dusty")
+                        self._error(
+                            "expecting one of: "
+                            "'damned' 'dirty' 'disgusting'"
+                            "'distasteful' 'dusty'"
+                        )
             with self._option():
-                self._token("rotten")
+                with self._if():
+                    self._pattern("(?i)e")
+                with self._group():
+                    self._token("evil")
             with self._option():
-                self._token("rotten")
+                with self._if():
+                    self._pattern("(?i)f")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("fat-kidneyed")
+                        with self._option():
+                            self._token("fatherless")
+                        with self._option():
+                            self._token("fat")
+                        with self._option():
+                            self._token("foul")
+                        self._error(
+                            "expecting one of: "
+                            "'fat-kidneyed' 'fatherless' 'fat' 'foul'"
+                        )
             with self._option():
-                self._token("smelly")
+                with self._if():
+                    self._pattern("(?i)h")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("hairy")
+                        with self._option():
+                            self._token("half-witted")
+                        with self._option():
+                            self._token("horrible")
+                        with self._option():
+                            self._token("horrid")
+                        self._error(
+                            "expecting one of: "
+                            "'hairy' 'half-witted' 'horrible'"
+                            "'horrid'"
+                        )
             with self._option():
-                self._token("snotty")
+                with self._if():
+                    self._pattern("(?i)i")
+                with self._group():
+                    self._token("infected")
             with self._option():
-                self._token("sorry")
+                with self._if():
+                    self._pattern("(?i)l")
+                with self._group():
+                    self._token("lying")
             with self._option():
-                self._token("stinking")
+                with self._if():
+                    self._pattern("(?i)m")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("miserable")
+                        with self._option():
+                            self._token("misused")
+                        self._error("expecting one of: " "'miserable' 'misused'")
             with self._option():
-                self._token("stuffed")
+                with self._if():
+                    self._pattern("(?i)o")
+                with self._group():
+                    self._token("oozing")
             with self._option():
-                self._token("stupid")
+                with self._if():
+                    self._pattern("(?i)r")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("rotten")
+                        with self._option():
+                            self._token("rotten")
+                        self._error("expecting one of: " "'rotten'")
             with self._option():
-                self._token("vile")
+                with self._if():
+                    self._pattern("(?i)s")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("smelly")
+                        with self._option():
+                            self._token("snotty")
+                        with self._option():
+                            self._token("sorry")
+                        with self._option():
+                            self._token("stinking")
+                        with self._option():
+                            self._token("stuffed")
+                        with self._option():
+                            self._token("stupid")
+                        self._error(
+                            "expecting one of: "
+                            "'smelly' 'snotty' 'sorry' 'stinking'"
+                            "'stuffed' 'stupid'"
+                        )
             with self._option():
-                self._token("villainous")
+                with self._if():
+                    self._pattern("(?i)v")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("vile")
+                        with self._option():
+                            self._token("villainous")
+                        self._error("expecting one of: " "'vile' 'villainous'")
             with self._option():
-                self._token("worried")
+                with self._if():
+                    self._pattern("(?i)w")
+                with self._group():
+                    self._token("worried")
             self._error(
                 "expecting one of: "
                 "'bad' 'cowardly' 'cursed' 'damned'"
@@ -319,45 +400,100 @@ class shakespeareParser(Parser):
     def _neutral_adjective_(self):  # noqa
         with self._choice():
             with self._option():
-                self._token("big")
-            with self._option():
-                self._token("black")
-            with self._option():
-                self._token("blue")
-            with self._option():
-                self._token("bluest")
-            with self._option():
-                self._token("bottomless")
-            with self._option():
-                self._token("furry")
-            with self._option():
-                self._token("green")
-            with self._option():
-                self._token("hard")
+                with self._if():
+                    self._pattern("(?i)b")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("big")
+                        with self._option():
+                            self._token("black")
+                        with self._option():
+                            self._token("blue")
+                        with self._option():
+                            self._token("bluest")
+                        with self._option():
+                            self._token("bottomless")
+                        self._error(
+                            "expecting one of: "
+                            "'big' 'black' 'blue' 'bluest'"
+                            "'bottomless'"
+                        )
             with self._option():
-                self._token("huge")
+                with self._if():
+                    self._pattern("(?i)f")
+                with self._group():
+                    self._token("furry")
             with self._option():
-                self._token("large")
+                with self._if():
+                    self._pattern("(?i)g")
+                with self._group():
+                    self._token("green")
             with self._option():
-                self._token("little")
+                with self._if():
+                    self._pattern("(?i)h")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("hard")
+                        with self._option():
+                            self._token("huge")
+                        self._error("expecting one of: " "'hard' 'huge'")
             with self._option():
-                self._token("normal")
+                with self._if():
+                    self._pattern("(?i)l")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("large")
+                        with self._option():
+                            self._token("little")
+                        self._error("expecting one of: " "'large' 'little'")
             with self._option():
-                self._token("old")
+                with self._if():
+                    self._pattern("(?i)n")
+                with self._group():
+                    self._token("normal")
             with self._option():
-                self._token("purple")
+                with self._if():
+                    self._pattern("(?i)o")
+                with self._group():
+                    self._token("old")
             with self._option():
-                self._token("red")
+                with self._if():
+                    self._pattern("(?i)p")
+                with self._group():
+                    self._token("purple")
             with self._option():
-                self._token("rural")
+                with self._if():
+                    self._pattern("(?i)r")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("red")
+                        with self._option():
+                            self._token("rural")
+                        self._error("expecting one of: " "'red' 'rural'")
             with self._option():
-                self._token("small")
+                with self._if():
+                    self._pattern("(?i)s")
+                with self._group():
+                    self._token("small")
             with self._option():
-                self._token("tiny")
+                with self._if():
+                    self._pattern("(?i)t")
+                with self._group():
+                    self._token("tiny")
             with self._option():
-                self._token("white")
+                with self._if():
+                    self._pattern("(?i)w")
+                with self._group():
+                    self._token("white")
             with self._option():
-                self._token("yellow")
+                with self._if():
+                    self._pattern("(?i)y")
+                with self._group():
+                    self._token("yellow")
             self._error(
                 "expecting one of: "
                 "'big' 'black' 'blue' 'bluest'"
@@ -371,77 +507,164 @@ class shakespeareParser(Parser):
     def _positive_adjective_(self):  # noqa
         with self._choice():
             with self._option():
-                self._token("amazing")
-            with self._option():
-                self._token("beautiful")
-            with self._option():
-                self._token("blossoming")
-            with self._option():
-                self._token("bold")
-            with self._option():
-                self._token("brave")
-            with self._option():
-                self._token("charming")
-            with self._option():
-                self._token("clearest")
-            with self._option():
-                self._token("cunning")
-            with self._option():
-                self._token("cute")
-            with self._option():
-                self._token("delicious")
-            with self._option():
-                self._token("embroidered")
-            with self._option():
-                self._token("fair")
-            with self._option():
-                self._token("fine")
-            with self._option():
-                self._token("gentle")
-            with self._option():
-                self._token("golden")
-            with self._option():
-                self._token("good")
-            with self._option():
-                self._token("handsome")
-            with self._option():
-                self._token("happy")
-            with self._option():
-                self._token("healthy")
-            with self._option():
-                self._token("honest")
-            with self._option():
-                self._token("lovely")
+                with self._if():
+                    self._pattern("(?i)a")
+                with self._group():
+                    self._token("amazing")
             with self._option():
-                self._token("loving")
+                with self._if():
+                    self._pattern("(?i)b")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("beautiful")
+                        with self._option():
+                            self._token("blossoming")
+                        with self._option():
+                            self._token("bold")
+                        with self._option():
+                            self._token("brave")
+                        self._error(
+                            "expecting one of: "
+                            "'beautiful' 'blossoming' 'bold' 'brave'"
+                        )
             with self._option():
-                self._token("mighty")
+                with self._if():
+                    self._pattern("(?i)c")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("charming")
+                        with self._option():
+                            self._token("clearest")
+                        with self._option():
+                            self._token("cunning")
+                        with self._option():
+                            self._token("cute")
+                        self._error(
+                            "expecting one of: "
+                            "'charming' 'clearest' 'cunning' 'cute'"
+                        )
             with self._option():
-                self._token("noble")
+                with self._if():
+                    self._pattern("(?i)d")
+                with self._group():
+                    self._token("delicious")
             with self._option():
-                self._token("peaceful")
+                with self._if():
+                    self._pattern("(?i)e")
+                with self._group():
+                    self._token("embroidered")
             with self._option():
-                self._token("pretty")
+                with self._if():
+                    self._pattern("(?i)f")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("fair")
+                        with self._option():
+                            self._token("fine")
+                        self._error("expecting one of: " "'fair' 'fine'")
             with self._option():
-                self._token("prompt")
+                with self._if():
+                    self._pattern("(?i)g")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("gentle")
+                        with self._option():
+                            self._token("golden")
+                        with self._option():
+                            self._token("good")
+                        self._error("expecting one of: " "'gentle' 'golden' 'good'")
             with self._option():
-                self._token("proud")
+                with self._if():
+                    self._pattern("(?i)h")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("handsome")
+                        with self._option():
+                            self._token("happy")
+                        with self._option():
+                            self._token("healthy")
+                        with self._option():
+                            self._token("honest")
+                        self._error(
+                            "expecting one of: " "'handsome' 'happy' 'healthy' 'honest'"
+                        )
             with self._option():
-                self._token("reddest")
+                with self._if():
+                    self._pattern("(?i)l")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("lovely")
+                        with self._option():
+                            self._token("loving")
+                        self._error("expecting one of: " "'lovely' 'loving'")
             with self._option():
-                self._token("rich")
+                with self._if():
+                    self._pattern("(?i)m")
+                with self._group():
+                    self._token("mighty")
             with self._option():
-                self._token("smooth")
+                with self._if():
+                    self._pattern("(?i)n")
+                with self._group():
+                    self._token("noble")
             with self._option():
-                self._token("sunny")
+                with self._if():
+                    self._pattern("(?i)p")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("peaceful")
+                        with self._option():
+                            self._token("pretty")
+                        with self._option():
+                            self._token("prompt")
+                        with self._option():
+                            self._token("proud")
+                        self._error(
+                            "expecting one of: " "'peaceful' 'pretty' 'prompt' 'proud'"
+                        )
             with self._option():
-                self._token("sweet")
+                with self._if():
+                    self._pattern("(?i)r")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("reddest")
+                        with self._option():
+                            self._token("rich")
+                        self._error("expecting one of: " "'reddest' 'rich'")
             with self._option():
-                self._token("sweetest")
+                with self._if():
+                    self._pattern("(?i)s")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("smooth")
+                        with self._option():
+                            self._token("sunny")
+                        with self._option():
+                            self._token("sweet")
+                        with self._option():
+                            self._token("sweetest")
+                        self._error(
+                            "expecting one of: " "'smooth' 'sunny' 'sweet' 'sweetest'"
+                        )
             with self._option():
-                self._token("trustworthy")
+                with self._if():
+                    self._pattern("(?i)t")
+                with self._group():
+                    self._token("trustworthy")
             with self._option():
-                self._token("warm")
+                with self._if():
+                    self._pattern("(?i)w")
+                with self._group():
+                    self._token("warm")
             self._error(
                 "expecting one of: "
                 "'amazing' 'beautiful' 'blossoming'"
@@ -460,61 +683,121 @@ class shakespeareParser(Parser):
     def _negative_noun_(self):  # noqa
         with self._choice():
             with self._option():
-                self._token("Hell")
-            with self._option():
-                self._token("Microsoft")
-            with self._option():
-                self._token("bastard")
-            with self._option():
-                self._token("beggar")
-            with self._option():
-                self._token("blister")
-            with self._option():
-                self._token("codpiece")
-            with self._option():
-                self._token("coward")
-            with self._option():
-                self._token("curse")
-            with self._option():
-                self._token("death")
-            with self._option():
-                self._token("devil")
-            with self._option():
-                self._token("draught")
-            with self._option():
-                self._token("famine")
-            with self._option():
-                self._token("flirt-gill")
-            with self._option():
-                self._token("goat")
+                with self._if():
+                    self._pattern("(?i)h")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Hell")
+                        with self._option():
+                            self._token("hate")
+                        with self._option():
+                            self._token("hog")
+                        with self._option():
+                            self._token("hound")
+                        self._error("expecting one of: " "'Hell' 'hate' 'hog' 'hound'")
             with self._option():
-                self._token("hate")
+                with self._if():
+                    self._pattern("(?i)m")
+                with self._group():
+                    self._token("Microsoft")
             with self._option():
-                self._token("hog")
+                with self._if():
+                    self._pattern("(?i)b")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("bastard")
+                        with self._option():
+                            self._token("beggar")
+                        with self._option():
+                            self._token("blister")
+                        self._error("expecting one of: " "'bastard' 'beggar' 'blister'")
             with self._option():
-                self._token("hound")
+                with self._if():
+                    self._pattern("(?i)c")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("codpiece")
+                        with self._option():
+                            self._token("coward")
+                        with self._option():
+                            self._token("curse")
+                        self._error("expecting one of: " "'codpiece' 'coward' 'curse'")
             with self._option():
-                self._token("leech")
+                with self._if():
+                    self._pattern("(?i)d")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("death")
+                        with self._option():
+                            self._token("devil")
+                        with self._option():
+                            self._token("draught")
+                        self._error("expecting one of: " "'death' 'devil' 'draught'")
             with self._option():
-                self._token("lie")
+                with self._if():
+                    self._pattern("(?i)f")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("famine")
+                        with self._option():
+                            self._token("flirt-gill")
+                        self._error("expecting one of: " "'famine' 'flirt-gill'")
             with self._option():
-                self._token("pig")
+                with self._if():
+                    self._pattern("(?i)g")
+                with self._group():
+                    self._token("goat")
             with self._option():
-                self._token("plague")
+                with self._if():
+                    self._pattern("(?i)l")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("leech")
+                        with self._option():
+                            self._token("lie")
+                        self._error("expecting one of: " "'leech' 'lie'")
             with self._option():
-                self._token("starvation")
+                with self._if():
+                    self._pattern("(?i)p")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("pig")
+                        with self._option():
+                            self._token("plague")
+                        self._error("expecting one of: " "'pig' 'plague'")
             with self._option():
-                self._token("toad")
+                with self._if():
+                    self._pattern("(?i)s")
+                with self._group():
+                    self._token("starvation")
             with self._option():
-                self._token("war")
+                with self._if():
+                    self._pattern("(?i)t")
+                with self._group():
+                    self._token("toad")
             with self._option():
-                self._token("wolf")
-            self._error(
-                "expecting one of: "
-                "'Hell' 'Microsoft' 'bastard' 'beggar'"
-                "'blister' 'codpiece' 'coward' 'curse'"
-                "'death' 'devil' 'draught' 'famine'"
-                "'flirt-gill' 'goat' 'hate' 'hog' 'hound'"
+                with self._if():
+                    self._pattern("(?i)w")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("war")
+                        with self._option():
+                            self._token("wolf")
+                        self._error("expecting one of: " "'war' 'wolf'")
+            self._error(
+                "expecting one of: "
+                "'Hell' 'hate' 'hog' 'hound' 'Microsoft'"
+                "'bastard' 'beggar' 'blister' 'codpiece'"
+                "'coward' 'curse' 'death' 'devil'"
+                "'draught' 'famine' 'flirt-gill' 'goat'"
                 "'leech' 'lie' 'pig' 'plague'"
                 "'starvation' 'toad' 'war' 'wolf'"
             )
@@ -523,88 +806,183 @@ class shakespeareParser(Parser):
     def _neutral_noun_(self):  # noqa
         with self._choice():
             with self._option():
-                self._token("animal")
-            with self._option():
-                self._token("aunt")
-            with self._option():
-                self._token("brother")
-            with self._option():
-                self._token("cat")
-            with self._option():
-                self._token("chihuahua")
-            with self._option():
-                self._token("cousin")
-            with self._option():
-                self._token("cow")
-            with self._option():
-                self._token("daughter")
-            with self._option():
-                self._token("door")
-            with self._option():
-                self._token("face")
-            with self._option():
-                self._token("father")
-            with self._option():
-                self._token("fellow")
-            with self._option():
-                self._token("granddaughter")
-            with self._option():
-                self._token("grandfather")
-            with self._option():
-                self._token("grandmother")
-            with self._option():
-                self._token("grandson")
-            with self._option():
-                self._token("hair")
-            with self._option():
-                self._token("hamster")
-            with self._option():
-                self._token("horse")
-            with self._option():
-                self._token("lamp")
-            with self._option():
-                self._token("lantern")
-            with self._option():
-                self._token("mistletoe")
-            with self._option():
-                self._token("moon")
-            with self._option():
-                self._token("morning")
-            with self._option():
-                self._token("mother")
-            with self._option():
-                self._token("nephew")
+                with self._if():
+                    self._pattern("(?i)a")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("animal")
+                        with self._option():
+                            self._token("aunt")
+                        self._error("expecting one of: " "'animal' 'aunt'")
             with self._option():
-                self._token("niece")
+                with self._if():
+                    self._pattern("(?i)b")
+                with self._group():
+                    self._token("brother")
             with self._option():
-                self._token("nose")
+                with self._if():
+                    self._pattern("(?i)c")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("cat")
+                        with self._option():
+                            self._token("chihuahua")
+                        with self._option():
+                            self._token("cousin")
+                        with self._option():
+                            self._token("cow")
+                        self._error(
+                            "expecting one of: " "'cat' 'chihuahua' 'cousin' 'cow'"
+                        )
             with self._option():
-                self._token("purse")
+                with self._if():
+                    self._pattern("(?i)d")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("daughter")
+                        with self._option():
+                            self._token("door")
+                        self._error("expecting one of: " "'daughter' 'door'")
             with self._option():
-                self._token("road")
+                with self._if():
+                    self._pattern("(?i)f")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("face")
+                        with self._option():
+                            self._token("father")
+                        with self._option():
+                            self._token("fellow")
+                        self._error("expecting one of: " "'face' 'father' 'fellow'")
             with self._option():
-                self._token("roman")
+                with self._if():
+                    self._pattern("(?i)g")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("granddaughter")
+                        with self._option():
+                            self._token("grandfather")
+                        with self._option():
+                            self._token("grandmother")
+                        with self._option():
+                            self._token("grandson")
+                        self._error(
+                            "expecting one of: "
+                            "'granddaughter' 'grandfather'"
+                            "'grandmother' 'grandson'"
+                        )
             with self._option():
-                self._token("sister")
+                with self._if():
+                    self._pattern("(?i)h")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("hair")
+                        with self._option():
+                            self._token("hamster")
+                        with self._option():
+                            self._token("horse")
+                        self._error("expecting one of: " "'hair' 'hamster' 'horse'")
             with self._option():
-                self._token("sky")
+                with self._if():
+                    self._pattern("(?i)l")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("lamp")
+                        with self._option():
+                            self._token("lantern")
+                        self._error("expecting one of: " "'lamp' 'lantern'")
             with self._option():
-                self._token("son")
+                with self._if():
+                    self._pattern("(?i)m")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("mistletoe")
+                        with self._option():
+                            self._token("moon")
+                        with self._option():
+                            self._token("morning")
+                        with self._option():
+                            self._token("mother")
+                        self._error(
+                            "expecting one of: " "'mistletoe' 'moon' 'morning' 'mother'"
+                        )
             with self._option():
-                self._token("squirrel")
+                with self._if():
+                    self._pattern("(?i)n")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("nephew")
+                        with self._option():
+                            self._token("niece")
+                        with self._option():
+                            self._token("nose")
+                        self._error("expecting one of: " "'nephew' 'niece' 'nose'")
             with self._option():
-                self._token("stone")
-                self._token("wall")
+                with self._if():
+                    self._pattern("(?i)p")
+                with self._group():
+                    self._token("purse")
             with self._option():
-                self._token("thing")
+                with self._if():
+                    self._pattern("(?i)r")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("road")
+                        with self._option():
+                            self._token("roman")
+                        self._error("expecting one of: " "'road' 'roman'")
             with self._option():
-                self._token("town")
+                with self._if():
+                    self._pattern("(?i)s")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("sister")
+                        with self._option():
+                            self._token("sky")
+                        with self._option():
+                            self._token("son")
+                        with self._option():
+                            self._token("squirrel")
+                        with self._option():
+                            self._token("stone")
+                            self._token("wall")
+                        self._error(
+                            "expecting one of: "
+                            "'sister' 'sky' 'son' 'squirrel' 'stone'"
+                        )
             with self._option():
-                self._token("tree")
+                with self._if():
+                    self._pattern("(?i)t")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("thing")
+                        with self._option():
+                            self._token("town")
+                        with self._option():
+                            self._token("tree")
+                        self._error("expecting one of: " "'thing' 'town' 'tree'")
             with self._option():
-                self._token("uncle")
+                with self._if():
+                    self._pattern("(?i)u")
+                with self._group():
+                    self._token("uncle")
             with self._option():
-                self._token("wind")
+                with self._if():
+                    self._pattern("(?i)w")
+                with self._group():
+                    self._token("wind")
             self._error(
                 "expecting one of: "
                 "'animal' 'aunt' 'brother' 'cat'"
@@ -624,386 +1002,609 @@ class shakespeareParser(Parser):
     def _positive_noun_(self):  # noqa
         with self._choice():
             with self._option():
-                self._token("Heaven")
-            with self._option():
-                self._token("King")
-            with self._option():
-                self._token("Lord")
-            with self._option():
-                self._token("angel")
-            with self._option():
-                self._token("flower")
+                with self._if():
+                    self._pattern("(?i)h")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Heaven")
+                        with self._option():
+                            self._token("happiness")
+                        with self._option():
+                            self._token("hero")
+                        self._error("expecting one of: " "'Heaven' 'happiness' 'hero'")
             with self._option():
-                self._token("happiness")
+                with self._if():
+                    self._pattern("(?i)k")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("King")
+                        with self._option():
+                            self._token("kingdom")
+                        self._error("expecting one of: " "'King' 'kingdom'")
             with self._option():
-                self._token("joy")
+                with self._if():
+                    self._pattern("(?i)l")
+                with self._group():
+                    self._token("Lord")
             with self._option():
-                self._token("plum")
+                with self._if():
+                    self._pattern("(?i)a")
+                with self._group():
+                    self._token("angel")
             with self._option():
-                self._token("summer's")
-                self._token("day")
+                with self._if():
+                    self._pattern("(?i)f")
+                with self._group():
+                    self._token("flower")
             with self._option():
-                self._token("hero")
+                with self._if():
+                    self._pattern("(?i)j")
+                with self._group():
+                    self._token("joy")
             with self._option():
-                self._token("rose")
+                with self._if():
+                    self._pattern("(?i)p")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("plum")
+                        with self._option():
+                            self._token("pony")
+                        self._error("expecting one of: " "'plum' 'pony'")
             with self._option():
-                self._token("kingdom")
+                with self._if():
+                    self._pattern("(?i)s")
+                with self._group():
+                    self._token("summer's")
+                    self._token("day")
             with self._option():
-                self._token("pony")
+                with self._if():
+                    self._pattern("(?i)r")
+                with self._group():
+                    self._token("rose")
             self._error(
                 "expecting one of: "
-                "'Heaven' 'King' 'Lord' 'angel' 'flower'"
-                "'happiness' 'joy' 'plum' \"summer's\""
-                "'hero' 'rose' 'kingdom' 'pony'"
+                "'Heaven' 'happiness' 'hero' 'King'"
+                "'kingdom' 'Lord' 'angel' 'flower' 'joy'"
+                "'plum' 'pony' \"summer's\" 'rose'"
             )
 
     @tatsumasu()
-    def _character_(self):  # noqa
-        with self._choice():
-            with self._option():
-                self._token("Achilles")
-            with self._option():
-                self._token("Adonis")
-            with self._option():
-                self._token("Adriana")
-            with self._option():
-                self._token("Aegeon")
-            with self._option():
-                self._token("Aemilia")
-            with self._option():
-                self._token("Agamemnon")
-            with self._option():
-                self._token("Agrippa")
-            with self._option():
-                self._token("Ajax")
-            with self._option():
-                self._token("Alonso")
-            with self._option():
-                self._token("Andromache")
-            with self._option():
-                self._token("Angelo")
-            with self._option():
-                self._token("Antiochus")
-            with self._option():
-                self._token("Antonio")
-            with self._option():
-                self._token("Arthur")
-            with self._option():
-                self._token("Autolycus")
-            with self._option():
-                self._token("Balthazar")
-            with self._option():
-                self._token("Banquo")
-            with self._option():
-                self._token("Beatrice")
-            with self._option():
-                self._token("Benedick")
-            with self._option():
-                self._token("Benvolio")
-            with self._option():
-                self._token("Bianca")
-            with self._option():
-                self._token("Brabantio")
-            with self._option():
-                self._token("Brutus")
-            with self._option():
-                self._token("Capulet")
-            with self._option():
-                self._token("Cassandra")
-            with self._option():
-                self._token("Cassius")
-            with self._option():
-                self._token("Christopher")
-                self._token("Sly")
-            with self._option():
-                self._token("Cicero")
-            with self._option():
-                self._token("Claudio")
-            with self._option():
-                self._token("Claudius")
-            with self._option():
-                self._token("Cleopatra")
-            with self._option():
-                self._token("Cordelia")
-            with self._option():
-                self._token("Cornelius")
-            with self._option():
-                self._token("Cressida")
-            with self._option():
-                self._token("Cymberline")
-            with self._option():
-                self._token("Demetrius")
-            with self._option():
-                self._token("Desdemona")
-            with self._option():
-                self._token("Dionyza")
-            with self._option():
-                self._token("Doctor")
-                self._token("Caius")
-            with self._option():
-                self._token("Dogberry")
-            with self._option():
-                self._token("Don")
-                self._token("John")
-            with self._option():
-                self._token("Don")
-                self._token("Pedro")
-            with self._option():
-                self._token("Donalbain")
-            with self._option():
-                self._token("Dorcas")
-            with self._option():
-                self._token("Duncan")
-            with self._option():
-                self._token("Egeus")
-            with self._option():
-                self._token("Emilia")
-            with self._option():
-                self._token("Escalus")
-            with self._option():
-                self._token("Falstaff")
-            with self._option():
-                self._token("Fenton")
-            with self._option():
-                self._token("Ferdinand")
-            with self._option():
-                self._token("Ford")
-            with self._option():
-                self._token("Fortinbras")
-            with self._option():
-                self._token("Francisca")
-            with self._option():
-                self._token("Friar")
-                self._token("John")
-            with self._option():
-                self._token("Friar")
-                self._token("Laurence")
-            with self._option():
-                self._token("Gertrude")
-            with self._option():
-                self._token("Goneril")
-            with self._option():
-                self._token("Hamlet")
-            with self._option():
-                self._token("Hecate")
-            with self._option():
-                self._token("Hector")
-            with self._option():
-                self._token("Helen")
-            with self._option():
-                self._token("Helena")
-            with self._option():
-                self._token("Hermia")
-            with self._option():
-                self._token("Hermonie")
-            with self._option():
-                self._token("Hippolyta")
-            with self._option():
-                self._token("Horatio")
-            with self._option():
-                self._token("Imogen")
-            with self._option():
-                self._token("Isabella")
-            with self._option():
-                self._token("John")
-                self._token("of")
-                self._token("Gaunt")
-            with self._option():
-                self._token("John")
-                self._token("of")
-                self._token("Lancaster")
-            with self._option():
-                self._token("Julia")
-            with self._option():
-                self._token("Juliet")
-            with self._option():
-                self._token("Julius")
-                self._token("Caesar")
-            with self._option():
-                self._token("King")
-                self._token("Henry")
-            with self._option():
-                self._token("King")
-                self._token("John")
-            with self._option():
-                self._token("King")
-                self._token("Lear")
-            with self._option():
-                self._token("King")
-                self._token("Richard")
-            with self._option():
-                self._token("Lady")
-                self._token("Capulet")
-            with self._option():
-                self._token("Lady")
-                self._token("Macbeth")
-            with self._option():
-                self._token("Lady")
-                self._token("Macduff")
-            with self._option():
-                self._token("Lady")
-                self._token("Montague")
-            with self._option():
-                self._token("Lennox")
-            with self._option():
-                self._token("Leonato")
-            with self._option():
-                self._token("Luciana")
-            with self._option():
-                self._token("Lucio")
-            with self._option():
-                self._token("Lychorida")
-            with self._option():
-                self._token("Lysander")
-            with self._option():
-                self._token("Macbeth")
-            with self._option():
-                self._token("Macduff")
-            with self._option():
-                self._token("Malcolm")
-            with self._option():
-                self._token("Mariana")
-            with self._option():
-                self._token("Mark")
-                self._token("Antony")
-            with self._option():
-                self._token("Mercutio")
-            with self._option():
-                self._token("Miranda")
-            with self._option():
-                self._token("Mistress")
-                self._token("Ford")
-            with self._option():
-                self._token("Mistress")
-                self._token("Overdone")
-            with self._option():
-                self._token("Mistress")
-                self._token("Page")
-            with self._option():
-                self._token("Montague")
-            with self._option():
-                self._token("Mopsa")
-            with self._option():
-                self._token("Oberon")
-            with self._option():
-                self._token("Octavia")
-            with self._option():
-                self._token("Octavius")
-                self._token("Caesar")
-            with self._option():
-                self._token("Olivia")
-            with self._option():
-                self._token("Ophelia")
-            with self._option():
-                self._token("Orlando")
-            with self._option():
-                self._token("Orsino")
-            with self._option():
-                self._token("Othello")
-            with self._option():
-                self._token("Page")
-            with self._option():
-                self._token("Pantino")
-            with self._option():
-                self._token("Paris")
-            with self._option():
-                self._token("Pericles")
-            with self._option():
-                self._token("Pinch")
-            with self._option():
-                self._token("Polonius")
-            with self._option():
-                self._token("Pompeius")
-            with self._option():
-                self._token("Portia")
-            with self._option():
-                self._token("Priam")
-            with self._option():
-                self._token("Prince")
-                self._token("Henry")
-            with self._option():
-                self._token("Prospero")
-            with self._option():
-                self._token("Proteus")
-            with self._option():
-                self._token("Publius")
-            with self._option():
-                self._token("Puck")
-            with self._option():
-                self._token("Queen")
-                self._token("Elinor")
-            with self._option():
-                self._token("Regan")
-            with self._option():
-                self._token("Robin")
-            with self._option():
-                self._token("Romeo")
-            with self._option():
-                self._token("Rosalind")
-            with self._option():
-                self._token("Sebastian")
-            with self._option():
-                self._token("Shallow")
-            with self._option():
-                self._token("Shylock")
-            with self._option():
-                self._token("Slender")
+    def _character_(self):  # noqa
+        with self._choice():
             with self._option():
-                self._token("Solinus")
+                with self._if():
+                    self._pattern("(?i)a")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Achilles")
+                        with self._option():
+                            self._token("Adonis")
+                        with self._option():
+                            self._token("Adriana")
+                        with self._option():
+                            self._token("Aegeon")
+                        with self._option():
+                            self._token("Aemilia")
+                        with self._option():
+                            self._token("Agamemnon")
+                        with self._option():
+                            self._token("Agrippa")
+                        with self._option():
+                            self._token("Ajax")
+                        with self._option():
+                            self._token("Alonso")
+                        with self._option():
+                            self._token("Andromache")
+                        with self._option():
+                            self._token("Angelo")
+                        with self._option():
+                            self._token("Antiochus")
+                        with self._option():
+                            self._token("Antonio")
+                        with self._option():
+                            self._token("Arthur")
+                        with self._option():
+                            self._token("Autolycus")
+                        self._error(
+                            "expecting one of: "
+                            "'Achilles' 'Adonis' 'Adriana' 'Aegeon'"
+                            "'Aemilia' 'Agamemnon' 'Agrippa' 'Ajax'"
+                            "'Alonso' 'Andromache' 'Angelo'"
+                            "'Antiochus' 'Antonio' 'Arthur'"
+                            "'Autolycus'"
+                        )
             with self._option():
-                self._token("Stephano")
+                with self._if():
+                    self._pattern("(?i)b")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Balthazar")
+                        with self._option():
+                            self._token("Banquo")
+                        with self._option():
+                            self._token("Beatrice")
+                        with self._option():
+                            self._token("Benedick")
+                        with self._option():
+                            self._token("Benvolio")
+                        with self._option():
+                            self._token("Bianca")
+                        with self._option():
+                            self._token("Brabantio")
+                        with self._option():
+                            self._token("Brutus")
+                        self._error(
+                            "expecting one of: "
+                            "'Balthazar' 'Banquo' 'Beatrice'"
+                            "'Benedick' 'Benvolio' 'Bianca'"
+                            "'Brabantio' 'Brutus'"
+                        )
             with self._option():
-                self._token("Thaisa")
+                with self._if():
+                    self._pattern("(?i)c")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Capulet")
+                        with self._option():
+                            self._token("Cassandra")
+                        with self._option():
+                            self._token("Cassius")
+                        with self._option():
+                            self._token("Christopher")
+                            self._token("Sly")
+                        with self._option():
+                            self._token("Cicero")
+                        with self._option():
+                            self._token("Claudio")
+                        with self._option():
+                            self._token("Claudius")
+                        with self._option():
+                            self._token("Cleopatra")
+                        with self._option():
+                            self._token("Cordelia")
+                        with self._option():
+                            self._token("Cornelius")
+                        with self._option():
+                            self._token("Cressida")
+                        with self._option():
+                            self._token("Cymberline")
+                        self._error(
+                            "expecting one of: "
+                            "'Capulet' 'Cassandra' 'Cassius'"
+                            "'Christopher' 'Cicero' 'Claudio'"
+                            "'Claudius' 'Cleopatra' 'Cordelia'"
+                            "'Cornelius' 'Cressida' 'Cymberline'"
+                        )
             with self._option():
-                self._token("The")
-                self._token("Abbot")
-                self._token("of")
-                self._token("Westminster")
+                with self._if():
+                    self._pattern("(?i)d")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Demetrius")
+                        with self._option():
+                            self._token("Desdemona")
+                        with self._option():
+                            self._token("Dionyza")
+                        with self._option():
+                            self._token("Doctor")
+                            self._token("Caius")
+                        with self._option():
+                            self._token("Dogberry")
+                        with self._option():
+                            self._token("Don")
+                            self._token("John")
+                        with self._option():
+                            self._token("Don")
+                            self._token("Pedro")
+                        with self._option():
+                            self._token("Donalbain")
+                        with self._option():
+                            self._token("Dorcas")
+                        with self._option():
+                            self._token("Duncan")
+                        self._error(
+                            "expecting one of: "
+                            "'Demetrius' 'Desdemona' 'Dionyza'"
+                            "'Doctor' 'Dogberry' 'Don' 'Donalbain'"
+                            "'Dorcas' 'Duncan'"
+                        )
             with self._option():
-                self._token("The")
-                self._token("Apothecary")
+                with self._if():
+                    self._pattern("(?i)e")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Egeus")
+                        with self._option():
+                            self._token("Emilia")
+                        with self._option():
+                            self._token("Escalus")
+                        self._error("expecting one of: " "'Egeus' 'Emilia' 'Escalus'")
             with self._option():
-                self._token("The")
-                self._token("Archbishop")
-                self._token("of")
-                self._token("Canterbury")
+                with self._if():
+                    self._pattern("(?i)f")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Falstaff")
+                        with self._option():
+                            self._token("Fenton")
+                        with self._option():
+                            self._token("Ferdinand")
+                        with self._option():
+                            self._token("Ford")
+                        with self._option():
+                            self._token("Fortinbras")
+                        with self._option():
+                            self._token("Francisca")
+                        with self._option():
+                            self._token("Friar")
+                            self._token("John")
+                        with self._option():
+                            self._token("Friar")
+                            self._token("Laurence")
+                        self._error(
+                            "expecting one of: "
+                            "'Falstaff' 'Fenton' 'Ferdinand' 'Ford'"
+                            "'Fortinbras' 'Francisca' 'Friar'"
+                        )
             with self._option():
-                self._token("The")
-                self._token("Duke")
-                self._token("of")
-                self._token("Milan")
+                with self._if():
+                    self._pattern("(?i)g")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Gertrude")
+                        with self._option():
+                            self._token("Goneril")
+                        self._error("expecting one of: " "'Gertrude' 'Goneril'")
             with self._option():
-                self._token("The")
-                self._token("Duke")
-                self._token("of")
-                self._token("Venice")
+                with self._if():
+                    self._pattern("(?i)h")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Hamlet")
+                        with self._option():
+                            self._token("Hecate")
+                        with self._option():
+                            self._token("Hector")
+                        with self._option():
+                            self._token("Helen")
+                        with self._option():
+                            self._token("Helena")
+                        with self._option():
+                            self._token("Hermia")
+                        with self._option():
+                            self._token("Hermonie")
+                        with self._option():
+                            self._token("Hippolyta")
+                        with self._option():
+                            self._token("Horatio")
+                        self._error(
+                            "expecting one of: "
+                            "'Hamlet' 'Hecate' 'Hector' 'Helen'"
+                            "'Helena' 'Hermia' 'Hermonie' 'Hippolyta'"
+                            "'Horatio'"
+                        )
             with self._option():
-                self._token("The")
-                self._token("Ghost")
+                with self._if():
+                    self._pattern("(?i)i")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Imogen")
+                        with self._option():
+                            self._token("Isabella")
+                        self._error("expecting one of: " "'Imogen' 'Isabella'")
             with self._option():
-                self._token("Theseus")
+                with self._if():
+                    self._pattern("(?i)j")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("John")
+                            self._token("of")
+                            self._token("Gaunt")
+                        with self._option():
+                            self._token("John")
+                            self._token("of")
+                            self._token("Lancaster")
+                        with self._option():
+                            self._token("Julia")
+                        with self._option():
+                            self._token("Juliet")
+                        with self._option():
+                            self._token("Julius")
+                            self._token("Caesar")
+                        self._error(
+                            "expecting one of: " "'John' 'Julia' 'Juliet' 'Julius'"
+                        )
             with self._option():
-                self._token("Thurio")
+                with self._if():
+                    self._pattern("(?i)k")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("King")
+                            self._token("Henry")
+                        with self._option():
+                            self._token("King")
+                            self._token("John")
+                        with self._option():
+                            self._token("King")
+                            self._token("Lear")
+                        with self._option():
+                            self._token("King")
+                            self._token("Richard")
+                        self._error("expecting one of: " "'King'")
             with self._option():
-                self._token("Timon")
+                with self._if():
+                    self._pattern("(?i)l")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Lady")
+                            self._token("Capulet")
+                        with self._option():
+                            self._token("Lady")
+                            self._token("Macbeth")
+                        with self._option():
+                            self._token("Lady")
+                            self._token("Macduff")
+                        with self._option():
+                            self._token("Lady")
+                            self._token("Montague")
+                        with self._option():
+                            self._token("Lennox")
+                        with self._option():
+                            self._token("Leonato")
+                        with self._option():
+                            self._token("Luciana")
+                        with self._option():
+                            self._token("Lucio")
+                        with self._option():
+                            self._token("Lychorida")
+                        with self._option():
+                            self._token("Lysander")
+                        self._error(
+                            "expecting one of: "
+                            "'Lady' 'Lennox' 'Leonato' 'Luciana'"
+                            "'Lucio' 'Lychorida' 'Lysander'"
+                        )
             with self._option():
-                self._token("Titania")
+                with self._if():
+                    self._pattern("(?i)m")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Macbeth")
+                        with self._option():
+                            self._token("Macduff")
+                        with self._option():
+                            self._token("Malcolm")
+                        with self._option():
+                            self._token("Mariana")
+                        with self._option():
+                            self._token("Mark")
+                            self._token("Antony")
+                        with self._option():
+                            self._token("Mercutio")
+                        with self._option():
+                            self._token("Miranda")
+                        with self._option():
+                            self._token("Mistress")
+                            self._token("Ford")
+                        with self._option():
+                            self._token("Mistress")
+                            self._token("Overdone")
+                        with self._option():
+                            self._token("Mistress")
+                            self._token("Page")
+                        with self._option():
+                            self._token("Montague")
+                        with self._option():
+                            self._token("Mopsa")
+                        self._error(
+                            "expecting one of: "
+                            "'Macbeth' 'Macduff' 'Malcolm' 'Mariana'"
+                            "'Mark' 'Mercutio' 'Miranda' 'Mistress'"
+                            "'Montague' 'Mopsa'"
+                        )
             with self._option():
-                self._token("Titus")
+                with self._if():
+                    self._pattern("(?i)o")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Oberon")
+                        with self._option():
+                            self._token("Octavia")
+                        with self._option():
+                            self._token("Octavius")
+                            self._token("Caesar")
+                        with self._option():
+                            self._token("Olivia")
+                        with self._option():
+                            self._token("Ophelia")
+                        with self._option():
+                            self._token("Orlando")
+                        with self._option():
+                            self._token("Orsino")
+                        with self._option():
+                            self._token("Othello")
+                        self._error(
+                            "expecting one of: "
+                            "'Oberon' 'Octavia' 'Octavius' 'Olivia'"
+                            "'Ophelia' 'Orlando' 'Orsino' 'Othello'"
+                        )
             with self._option():
-                self._token("Troilus")
+                with self._if():
+                    self._pattern("(?i)p")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Page")
+                        with self._option():
+                            self._token("Pantino")
+                        with self._option():
+                            self._token("Paris")
+                        with self._option():
+                            self._token("Pericles")
+                        with self._option():
+                            self._token("Pinch")
+                        with self._option():
+                            self._token("Polonius")
+                        with self._option():
+                            self._token("Pompeius")
+                        with self._option():
+                            self._token("Portia")
+                        with self._option():
+                            self._token("Priam")
+                        with self._option():
+                            self._token("Prince")
+                            self._token("Henry")
+                        with self._option():
+                            self._token("Prospero")
+                        with self._option():
+                            self._token("Proteus")
+                        with self._option():
+                            self._token("Publius")
+                        with self._option():
+                            self._token("Puck")
+                        self._error(
+                            "expecting one of: "
+                            "'Page' 'Pantino' 'Paris' 'Pericles'"
+                            "'Pinch' 'Polonius' 'Pompeius' 'Portia'"
+                            "'Priam' 'Prince' 'Prospero' 'Proteus'"
+                            "'Publius' 'Puck'"
+                        )
             with self._option():
-                self._token("Tybalt")
+                with self._if():
+                    self._pattern("(?i)q")
+                with self._group():
+                    self._token("Queen")
+                    self._token("Elinor")
             with self._option():
-                self._token("Ulysses")
+                with self._if():
+                    self._pattern("(?i)r")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Regan")
+                        with self._option():
+                            self._token("Robin")
+                        with self._option():
+                            self._token("Romeo")
+                        with self._option():
+                            self._token("Rosalind")
+                        self._error(
+                            "expecting one of: " "'Regan' 'Robin' 'Romeo' 'Rosalind'"
+                        )
             with self._option():
-                self._token("Valentine")
+                with self._if():
+                    self._pattern("(?i)s")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Sebastian")
+                        with self._option():
+                            self._token("Shallow")
+                        with self._option():
+                            self._token("Shylock")
+                        with self._option():
+                            self._token("Slender")
+                        with self._option():
+                            self._token("Solinus")
+                        with self._option():
+                            self._token("Stephano")
+                        self._error(
+                            "expecting one of: "
+                            "'Sebastian' 'Shallow' 'Shylock'"
+                            "'Slender' 'Solinus' 'Stephano'"
+                        )
             with self._option():
-                self._token("Venus")
+                with self._if():
+                    self._pattern("(?i)t")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Thaisa")
+                        with self._option():
+                            self._token("The")
+                            self._token("Abbot")
+                            self._token("of")
+                            self._token("Westminster")
+                        with self._option():
+                            self._token("The")
+                            self._token("Apothecary")
+                        with self._option():
+                            self._token("The")
+                            self._token("Archbishop")
+                            self._token("of")
+                            self._token("Canterbury")
+                        with self._option():
+                            self._token("The")
+                            self._token("Duke")
+                            self._token("of")
+                            self._token("Milan")
+                        with self._option():
+                            self._token("The")
+                            self._token("Duke")
+                            self._token("of")
+                            self._token("Venice")
+                        with self._option():
+                            self._token("The")
+                            self._token("Ghost")
+                        with self._option():
+                            self._token("Theseus")
+                        with self._option():
+                            self._token("Thurio")
+                        with self._option():
+                            self._token("Timon")
+                        with self._option():
+                            self._token("Titania")
+                        with self._option():
+                            self._token("Titus")
+                        with self._option():
+                            self._token("Troilus")
+                        with self._option():
+                            self._token("Tybalt")
+                        self._error(
+                            "expecting one of: "
+                            "'Thaisa' 'The' 'Theseus' 'Thurio'"
+                            "'Timon' 'Titania' 'Titus' 'Troilus'"
+                            "'Tybalt'"
+                        )
             with self._option():
-                self._token("Vincentio")
+                with self._if():
+                    self._pattern("(?i)u")
+                with self._group():
+                    self._token("Ulysses")
             with self._option():
-                self._token("Viola")
+                with self._if():
+                    self._pattern("(?i)v")
+                with self._group():
+                    with self._choice():
+                        with self._option():
+                            self._token("Valentine")
+                        with self._option():
+                            self._token("Venus")
+                        with self._option():
+                            self._token("Vincentio")
+                        with self._option():
+                            self._token("Viola")
+                        self._error(
+                            "expecting one of: "
+                            "'Valentine' 'Venus' 'Vincentio' 'Viola'"
+                        )
             self._error(
                 "expecting one of: "
                 "'Achilles' 'Adonis' 'Adriana' 'Aegeon'"
@@ -1093,9 +1694,9 @@ class shakespeareParser(Parser):
                 self._neutral_noun_()
             self._error(
                 "expecting one of: "
-                "'Heaven' 'King' 'Lord' 'angel' 'flower'"
-                "'happiness' 'joy' 'plum' \"summer's\""
-                "'hero' 'rose' 'kingdom' 'pony'"
+                "'Heaven' 'happiness' 'hero' 'King'"
+                "'kingdom' 'Lord' 'angel' 'flower' 'joy'"
+                "'plum' 'pony' \"summer's\" 'rose'"
                 "<positive_noun> 'animal' 'aunt'"
                 "'brother' 'cat' 'chihuahua' 'cousin'"
                 "'cow' 'daughter' 'door' 'face' 'father'"
@@ -1182,10 +1783,10 @@ class shakespeareParser(Parser):
                 self._positive_noun_phrase_()
             self._error(
                 "expecting one of: "
-                "'Hell' 'Microsoft' 'bastard' 'beggar'"
-                "'blister' 'codpiece' 'coward' 'curse'"
-                "'death' 'devil' 'draught' 'famine'"
-                "'flirt-gill' 'goat' 'hate' 'hog' 'hound'"
+                "'Hell' 'hate' 'hog' 'hound' 'Microsoft'"
+                "'bastard' 'beggar' 'blister' 'codpiece'"
+                "'coward' 'curse' 'death' 'devil'"
+                "'draught' 'famine' 'flirt-gill' 'goat'"
                 "'leech' 'lie' 'pig' 'plague'"
                 "'starvation' 'toad' 'war' 'wolf'"
                 "<negative_noun> 'bad' 'cowardly'"
@@ -1208,10 +1809,10 @@ class shakespeareParser(Parser):
                 "'your' <second_person_possessive> 'his'"
                 "'her' 'its' 'their'"
                 "<third_person_possessive> <possessive>"
-                "<negative_noun_phrase> 'Heaven' 'King'"
-                "'Lord' 'angel' 'flower' 'happiness'"
-                "'joy' 'plum' \"summer's\" 'hero' 'rose'"
-                "'kingdom' 'pony' <positive_noun>"
+                "<negative_noun_phrase> 'Heaven'"
+                "'happiness' 'hero' 'King' 'kingdom'"
+                "'Lord' 'angel' 'flower' 'joy' 'plum'"
+                "'pony' \"summer's\" 'rose' <positive_noun>"
                 "'animal' 'aunt' 'brother' 'cat'"
                 "'chihuahua' 'cousin' 'cow' 'daughter'"
                 "'door' 'face' 'father' 'fellow'"
@@ -1302,17 +1903,17 @@ class shakespeareParser(Parser):
                 "<first_person_value> 'thee' 'thou' 'you'"
                 "<second_person> 'thyself' 'yourself'"
                 "<second_person_reflexive>"
-                "<second_person_value> 'Hell' 'Microsoft'"
-                "'bastard' 'beggar' 'blister' 'codpiece'"
-                "'coward' 'curse' 'death' 'devil'"
-                "'draught' 'famine' 'flirt-gill' 'goat'"
-                "'hate' 'hog' 'hound' 'leech' 'lie' 'pig'"
-                "'plague' 'starvation' 'toad' 'war'"
-                "'wolf' <negative_noun> 'bad' 'cowardly'"
-                "'cursed' 'damned' 'dirty' 'disgusting'"
-                "'distasteful' 'dusty' 'evil' 'fat-"
-                "kidneyed' 'fatherless' 'fat' 'foul'"
-                "'hairy' 'half-witted' 'horrible'"
+                "<second_person_value> 'Hell' 'hate'"
+                "'hog' 'hound' 'Microsoft' 'bastard'"
+                "'beggar' 'blister' 'codpiece' 'coward'"
+                "'curse' 'death' 'devil' 'draught'"
+                "'famine' 'flirt-gill' 'goat' 'leech'"
+                "'lie' 'pig' 'plague' 'starvation' 'toad'"
+                "'war' 'wolf' <negative_noun> 'bad'"
+                "'cowardly' 'cursed' 'damned' 'dirty'"
+                "'disgusting' 'distasteful' 'dusty'"
+                "'evil' 'fat-kidneyed' 'fatherless' 'fat'"
+                "'foul' 'hairy' 'half-witted' 'horrible'"
                 "'horrid' 'infected' 'lying' 'miserable'"
                 "'misused' 'oozing' 'rotten' 'smelly'"
                 "'snotty' 'sorry' 'stinking' 'stuffed'"
@@ -1328,9 +1929,9 @@ class shakespeareParser(Parser):
                 "<second_person_possessive> 'his' 'her'"
                 "'its' 'their' <third_person_possessive>"
                 "<possessive> <negative_noun_phrase>"
-                "'Heaven' 'King' 'Lord' 'angel' 'flower'"
-                "'happiness' 'joy' 'plum' \"summer's\""
-                "'hero' 'rose' 'kingdom' 'pony'"
+                "'Heaven' 'happiness' 'hero' 'King'"
+                "'kingdom' 'Lord' 'angel' 'flower' 'joy'"
+                "'plum' 'pony' \"summer's\" 'rose'"
                 "<positive_noun> 'animal' 'aunt'"
                 "'brother' 'cat' 'chihuahua' 'cousin'"
                 "'cow' 'daughter' 'door' 'face' 'father'"
@@ -1588,6 +2189,7 @@ class shakespeareParser(Parser):
     @tatsumasu()
     def _goto_(self):  # noqa
         self._let_us_()
+        self._cut()
         self._proceed_to_()
         self._token("scene")
         self._roman_numeral_()
@@ -1657,6 +2259,7 @@ class shakespeareParser(Parser):
     @tatsumasu()
     def _push_(self):  # noqa
         self._token("Remember")
+        self._cut()
         self._value_()
         self.name_last_node("value")
         with self._group():
@@ -1671,6 +2274,7 @@ class shakespeareParser(Parser):
     @tatsumasu()
     def _pop_(self):  # noqa
         self._token("Recall")
+        self._cut()
         self._text_before_punctuation_()
         self.name_last_node("recall_string")
         with self._group():
@@ -1733,6 +2337,7 @@ class shakespeareParser(Parser):
         self._character_()
         self.name_last_node("character")
         self._token(":")
+        self._cut()
         self._line_contents_()
         self.name_last_node("contents")
         self._define(["character", "contents"], [])
@@ -1811,6 +2416,7 @@ class shakespeareParser(Parser):
     def _entrance_(self):  # noqa
         self._token("[")
         self._token("Enter")
+        self._cut()
         self._character_list_()
         self.name_last_node("characters")
         self._token("]")
@@ -1820,6 +2426,7 @@ class shakespeareParser(Parser):
     def _exit_(self):  # noqa
         self._token("[")
         self._token("Exit")
+        self._cut()
         self._character_()
         self.name_last_node("character")
         self._token("]")
@@ -1830,6 +2437,7 @@ class shakespeareParser(Parser):
         self._token("[")
         self._token("Exeunt")
         self.name_last_node("action")
+        self._cut()
         with self._optional():
             self._character_list_()
             self.name_last_node("characters")
@@ -1973,17 +2581,17 @@ class shakespeareParser(Parser):
                 "<first_person_value> 'thee' 'thou' 'you'"
                 "<second_person> 'thyself' 'yourself'"
                 "<second_person_reflexive>"
-                "<second_person_value> 'Hell' 'Microsoft'"
-                "'bastard' 'beggar' 'blister' 'codpiece'"
-                "'coward' 'curse' 'death' 'devil'"
-                "'draught' 'famine' 'flirt-gill' 'goat'"
-                "'hate' 'hog' 'hound' 'leech' 'lie' 'pig'"
-                "'plague' 'starvation' 'toad' 'war'"
-                "'wolf' <negative_noun> 'bad' 'cowardly'"
-                "'cursed' 'damned' 'dirty' 'disgusting'"
-                "'distasteful' 'dusty' 'evil' 'fat-"
-                "kidneyed' 'fatherless' 'fat' 'foul'"
-                "'hairy' 'half-witted' 'horrible'"
+                "<second_person_value> 'Hell' 'hate'"
+                "'hog' 'hound' 'Microsoft' 'bastard'"
+                "'beggar' 'blister' 'codpiece' 'coward'"
+                "'curse' 'death' 'devil' 'draught'"
+                "'famine' 'flirt-gill' 'goat' 'leech'"
+                "'lie' 'pig' 'plague' 'starvation' 'toad'"
+                "'war' 'wolf' <negative_noun> 'bad'"
+                "'cowardly' 'cursed' 'damned' 'dirty'"
+                "'disgusting' 'distasteful' 'dusty'"
+                "'evil' 'fat-kidneyed' 'fatherless' 'fat'"
+                "'foul' 'hairy' 'half-witted' 'horrible'"
                 "'horrid' 'infected' 'lying' 'miserable'"
                 "'misused' 'oozing' 'rotten' 'smelly'"
                 "'snotty' 'sorry' 'stinking' 'stuffed'"
@@ -1999,10 +2607,10 @@ class shakespeareParser(Parser):
                 "'your' <second_person_possessive> 'his'"
                 "'her' 'its' 'their'"
                 "<third_person_possessive> <possessive>"
-                "<negative_noun_phrase> 'Heaven' 'Lord'"
-                "'angel' 'flower' 'happiness' 'joy'"
-                "'plum' \"summer's\" 'hero' 'rose'"
-                "'kingdom' 'pony' <positive_noun>"
+                "<negative_noun_phrase> 'Heaven'"
+                "'happiness' 'hero' 'kingdom' 'Lord'"
+                "'angel' 'flower' 'joy' 'plum' 'pony'"
+                "\"summer's\" 'rose' <positive_noun>"
                 "'animal' 'aunt' 'brother' 'cat'"
                 "'chihuahua' 'cousin' 'cow' 'daughter'"
                 "'door' 'face' 'father' 'fellow'"
@@ -2057,6 +2665,7 @@ class shakespeareParser(Parser):
     @tatsumasu()
     def _scene_(self):  # noqa
         self._token("Scene")
+        self._cut()
         self._pattern("\\s*")
         self._roman_numeral_()
         self.name_last_node("number")
@@ -2082,6 +2691,7 @@ class shakespeareParser(Parser):
     @tatsumasu()
     def _act_(self):  # noqa
         self._token("Act")
+        self._cut()
         self._pattern("\\s*")
         self._roman_numeral_()
         self.name_last_node("number")
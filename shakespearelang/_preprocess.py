@@ -1,38 +1,188 @@
-from ._operation import operations_from_event
+from ._operation import (
+    operations_from_event,
+    Entrance,
+    Exit,
+    Exeunt,
+    Breakpoint,
+    Goto,
+    add_debug_output,
+)
+from ._fusion import fuse_operations
+from ._utils import normalize_name
 from .errors import ShakespeareRuntimeError
-from tatsu.ast import AST
+from typing import TYPE_CHECKING
+from bisect import bisect_right
+
+if TYPE_CHECKING:
+    from tatsu.ast import AST
 
 
 class Play:
-    def __init__(self, ast: AST):
+    def __init__(self, ast: "AST"):
+        self.ast = ast
+        self.title = ast.title.strip()
+        self.character_slots = {}
         self.operations = []
         self.act_indices = []
+        self._act_starts = []
         self.scene_indices = {}
         self._preprocess(ast)
+        self.breakpoint_positions = frozenset(
+            position
+            for position, operation in enumerate(self.operations)
+            if isinstance(operation, Breakpoint)
+        )
+        self.stages = self._analyze_stage()
+        # Compiled and fused operations, keyed by output style.
+        self._compiled_operations = {}
+        self._fused_operations = {}
 
-    def _preprocess(self, ast: AST):
-        for act in ast.acts:
-            act_number = act.number.value
-            if act_number in self.scene_indices:
-                raise ShakespeareRuntimeError(
-                    f"Act numeral {act_number} is not unique",
-                    parseinfo=act.number.parseinfo,
+    def compiled_operations(self, output_style: str):
+        """The operations compiled for the output style, built on first use."""
+        if output_style not in self._compiled_operations:
+            self._compiled_operations[output_style] = self._compile_operations(
+                self.operations, self.stages, output_style
+            )
+        return self._compiled_operations[output_style]
+
+    def fused_operations(self, output_style: str):
+        """Like compiled_operations, but with common pairs of operations fused
+        (see fuse_operations)."""
+        if output_style not in self._fused_operations:
+            self._fused_operations[output_style] = fuse_operations(self, output_style)
+        return self._fused_operations[output_style]
+
+    def _compile_operations(self, operations, stages, output_style):
+        compiled_operations = [
+            operation.compile(self, stage, output_style)
+            for operation, stage in zip(operations, stages)
+        ]
+        if output_style == "debug":
+            compiled_operations = [
+                (
+                    run
+                    if isinstance(operation, Breakpoint)
+                    else add_debug_output(operation, run)
                 )
-            self.act_indices.append((act_number, len(self.operations)))
-            self.scene_indices[act_number] = {}
+                for operation, run in zip(operations, compiled_operations)
+            ]
+        return compiled_operations
+
+    def _preprocess(self, ast: "AST"):
+        self._add_characters(ast)
+
+        for act in ast.acts:
+            act_number = self._add_act(act)
+            act_start = len(self.operations)
             for scene in act.scenes:
-                scene_number = scene.number.value
-                if scene_number in self.scene_indices[act_number]:
-                    raise ShakespeareRuntimeError(
-                        f"Scene numeral {scene_number} is not unique in {act_number}",
-                        parseinfo=scene.number.parseinfo,
-                    )
-                self.scene_indices[act_number][scene_number] = len(self.operations)
+                self._add_scene(act_number, scene)
                 for event in scene.events:
                     self.operations += operations_from_event(event)
 
+            # Gotos can jump forward, so they are resolved once the whole act
+            # is indexed.
+            for operation in self.operations[act_start:]:
+                if isinstance(operation, Goto):
+                    operation.resolve(self, act_number)
+
+    def _add_characters(self, ast: "AST"):
+        for persona in ast.dramatis_personae:
+            name = normalize_name(persona.character)
+            self.character_slots.setdefault(name, len(self.character_slots))
+
+    def _add_act(self, act: "AST"):
+        act_number = act.number.value
+        if act_number in self.scene_indices:
+            raise ShakespeareRuntimeError(
+                f"Act numeral {act_number} is not unique",
+                parseinfo=act.number.parseinfo,
+            )
+        act_start = len(self.operations)
+        self.act_indices.append((act_number, act_start))
+        self._act_starts.append(act_start)
+        self.scene_indices[act_number] = {}
+        return act_number
+
+    def _add_scene(self, act_number, scene: "AST"):
+        scene_number = scene.number.value
+        if scene_number in self.scene_indices[act_number]:
+            raise ShakespeareRuntimeError(
+                f"Scene numeral {scene_number} is not unique in {act_number}",
+                parseinfo=scene.number.parseinfo,
+            )
+        self.scene_indices[act_number][scene_number] = len(self.operations)
+
     def get_act(self, position: int):
-        i = 0
-        while i + 1 < len(self.act_indices) and self.act_indices[i + 1][1] <= position:
-            i = i + 1
-        return self.act_indices[i][0]
+        i = bisect_right(self._act_starts, position) - 1
+        return self.act_indices[max(i, 0)][0]
+
+    def _analyze_stage(self):
+        """Find out who is on stage whenever each operation runs.
+
+        Returns a list with the stage mask (see State.stage_mask) at each
+        operation, or None where it depends on the path taken to get there or
+        the operation is never reached.
+        """
+        # A forward dataflow analysis over the operations: each position holds
+        # None (not reached yet), a stage mask, or _CONFLICTING_STAGES once two
+        # paths disagree.
+        stages = [None] * len(self.operations)
+        if stages:
+            stages[0] = 0
+        worklist = [0] if stages else []
+        while worklist:
+            position = worklist.pop()
+            for successor, stage in self._stage_successors(position, stages[position]):
+                if successor >= len(stages) or stages[successor] == _CONFLICTING_STAGES:
+                    continue
+                if stages[successor] is None:
+                    stages[successor] = stage
+                elif stages[successor] != stage:
+                    stages[successor] = _CONFLICTING_STAGES
+                else:
+                    continue
+                worklist.append(successor)
+
+        return [None if stage == _CONFLICTING_STAGES else stage for stage in stages]
+
+    def _stage_successors(self, position, stage):
+        operation = self.operations[position]
+
+        if isinstance(operation, Goto):
+            destination = operation.destination_position
+            if destination == position:
+                destination = position + 1
+            successors = [destination]
+            if operation.has_condition:
+                successors.append(position + 1)
+            return [(successor, stage) for successor in successors]
+
+        if isinstance(operation, Exeunt) and operation.characters is None:
+            return [(position + 1, 0)]
+
+        if stage == _CONFLICTING_STAGES or not isinstance(
+            operation, (Entrance, Exit, Exeunt)
+        ):
+            return [(position + 1, stage)]
+
+        if isinstance(operation, Exit):
+            characters = [operation.character]
+        else:
+            characters = operation.characters
+        bits = 0
+        for character in characters:
+            if character not in self.character_slots:
+                # Always an error, so nothing runs after this.
+                return []
+            bits |= 1 << self.character_slots[character]
+
+        if isinstance(operation, Entrance):
+            if stage & bits:
+                return []
+            return [(position + 1, stage | bits)]
+        if stage & bits != bits:
+            return []
+        return [(position + 1, stage & ~bits)]
+
+
+_CONFLICTING_STAGES = -1
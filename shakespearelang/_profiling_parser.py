@@ -0,0 +1,41 @@
+from ._bounded_parser import BoundedMemoParser
+from tatsu.exceptions import FailedLeftRecursion, FailedParse
+from time import perf_counter
+
+
+class ProfilingParser(BoundedMemoParser):
+    """The parser used for plays TatSu parses, recording how each rule of the
+    grammar fares in a ParseProfile."""
+
+    def __init__(self, profile, **kwargs):
+        super().__init__(**kwargs)
+        self.profile = profile
+        # How many calls of each rule are in progress, so that the time of
+        # recursive calls is only counted once.
+        self._active_calls = {}
+
+    def _call(self, ruleinfo):
+        name = ruleinfo.name
+        rule = self.profile.rule(name)
+        rule.calls += 1
+        active_calls = self._active_calls.get(name, 0)
+        self._active_calls[name] = active_calls + 1
+        start = perf_counter()
+        try:
+            node = super()._call(ruleinfo)
+        except FailedParse:
+            rule.failures += 1
+            raise
+        finally:
+            self._active_calls[name] = active_calls
+            if not active_calls:
+                rule.time += perf_counter() - start
+        rule.successes += 1
+        return node
+
+    def _memo_for(self, key):
+        memo = super()._memo_for(key)
+        # The guard against left recursion is not a real result.
+        if memo is not None and not isinstance(memo, FailedLeftRecursion):
+            self.profile.rule(key.rule.name).memo_hits += 1
+        return memo
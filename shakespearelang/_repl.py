@@ -1,7 +1,6 @@
 from .shakespeare import Shakespeare
 from .errors import ShakespeareError
 from ._utils import normalize_name
-from tatsu.exceptions import FailedParse
 
 try:
     import readline
@@ -88,8 +87,8 @@ def run_repl(interpreter):
         except ShakespeareError as e:
             print(str(e), file=sys.stderr)
 
-    interpreter.input_style = previous_input_style
-    interpreter.output_style = previous_output_style
+    interpreter.settings.input_style = previous_input_style
+    interpreter.settings.output_style = previous_output_style
 
 
 def _run_repl_input(interpreter, repl_input, current_character):
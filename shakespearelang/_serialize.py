@@ -0,0 +1,166 @@
+"""
+A compact serialization of parsed plays, so they can be stored and loaded again
+without parsing them.
+
+Loading does not import TatSu, so it stays fast: the loaded AST is made of the
+stand-ins for the TatSu classes in _ast.
+
+The AST is stored with marshal, which is only compatible with the same version
+of Python and is not safe against maliciously constructed data, so serialized
+plays must come from a trusted source. The header records the version of
+Python, so that plays from any other are refused before marshal reads them.
+"""
+
+from ._ast import Node, ParseInfo, SourceBuffer
+from .errors import ShakespeareCompiledPlayError
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+import marshal
+import mmap
+import sys
+
+MAGIC = b"SPLC"
+
+# Change this whenever the serialized form changes.
+FORMAT_VERSION = 2
+
+# The Python implementation and version whose marshal format the AST is stored
+# in.
+PYTHON_VERSION = (
+    f"{sys.implementation.name}-{sys.version_info.major}.{sys.version_info.minor}"
+)
+
+# The magic number, then the Python version between null bytes. Older formats
+# had marshal data straight after the magic number, which never starts with a
+# null byte.
+_HEADER = MAGIC + b"\0" + PYTHON_VERSION.encode() + b"\0"
+_MAX_PYTHON_VERSION_LENGTH = 64
+
+# Tags for the types that marshal cannot tell apart by itself.
+_AST, _LIST, _TUPLE = range(3)
+
+
+@lru_cache(maxsize=None)
+def grammar_version():
+    """A hash of the grammar, which determines the shape of the AST."""
+    grammar = (Path(__file__).parent / "shakespeare.ebnf").read_bytes()
+    return hashlib.sha256(grammar).hexdigest()
+
+
+def dumps_ast(ast) -> bytes:
+    """Serialize the AST of a play, including the source it was parsed from."""
+    payload = (
+        FORMAT_VERSION,
+        grammar_version(),
+        ast.parseinfo.tokenizer.text,
+        _encode(ast),
+    )
+    return _HEADER + marshal.dumps(payload)
+
+
+def loads_ast(data) -> Node:
+    """Load an AST serialized by dumps_ast from a bytes-like object.
+
+    The loaded AST has parseinfo into the same source, so it can be used just
+    like the AST it was serialized from.
+    """
+    # Release the views explicitly, so that a memory map can be closed even if
+    # this raises.
+    with memoryview(data) as view, view[len(_HEADER) :] as payload:
+        if view[: len(_HEADER)] != _HEADER:
+            _raise_header_error(view)
+        try:
+            version, grammar, text, encoded = marshal.loads(payload)
+        except (EOFError, ValueError, TypeError):
+            raise ShakespeareCompiledPlayError("Corrupted compiled play") from None
+    if version != FORMAT_VERSION or grammar != grammar_version():
+        raise ShakespeareCompiledPlayError(
+            "Compiled by an incompatible version of shakespearelang, compile the "
+            "play again"
+        )
+
+    buffer = SourceBuffer(text)
+    try:
+        return _decode(encoded, buffer)
+    except (IndexError, KeyError, ValueError, TypeError):
+        raise ShakespeareCompiledPlayError("Corrupted compiled play") from None
+
+
+def _raise_header_error(view):
+    if view[: len(MAGIC)] != MAGIC:
+        raise ShakespeareCompiledPlayError("Not a compiled play")
+    start = len(MAGIC) + 1
+    if view[len(MAGIC) : start] != b"\0":
+        raise ShakespeareCompiledPlayError(
+            "Compiled by an incompatible version of shakespearelang, compile the "
+            "play again"
+        )
+    python_version, end, _ = (
+        bytes(view[start : start + _MAX_PYTHON_VERSION_LENGTH + 1])
+        .decode("ascii", "replace")
+        .partition("\0")
+    )
+    if not end:
+        raise ShakespeareCompiledPlayError("Corrupted compiled play")
+    raise ShakespeareCompiledPlayError(
+        f"Compiled with Python {python_version}, not {PYTHON_VERSION}, compile the "
+        "play again with this version of Python"
+    )
+
+
+def load_ast_file(path) -> Node:
+    """Load an AST serialized by dumps_ast from a file, without reading the whole
+    file into memory first."""
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped.
+            raise ShakespeareCompiledPlayError("Not a compiled play") from None
+    with mapped:
+        return loads_ast(mapped)
+
+
+def is_serialized_file(path) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _encode(node):
+    if isinstance(node, dict):
+        parseinfo = node.parseinfo
+        fields = {
+            key: _encode(value) for key, value in node.items() if key != "parseinfo"
+        }
+        return (
+            _AST,
+            fields,
+            parseinfo.rule,
+            parseinfo.pos,
+            parseinfo.endpos,
+            parseinfo.line,
+            parseinfo.endline,
+        )
+    if isinstance(node, list):
+        return (_LIST, [_encode(item) for item in node])
+    if isinstance(node, tuple):
+        return (_TUPLE, list(node))
+    return node
+
+
+def _decode(encoded, buffer):
+    if not isinstance(encoded, tuple):
+        return encoded
+
+    tag = encoded[0]
+    if tag == _AST:
+        _, fields, *position = encoded
+        node = Node({key: _decode(value, buffer) for key, value in fields.items()})
+        node["parseinfo"] = ParseInfo(buffer, *position)
+        return node
+    if tag == _LIST:
+        return [_decode(item, buffer) for item in encoded[1]]
+    if tag == _TUPLE:
+        return tuple(encoded[1])
+    raise ValueError("Unknown tag: " + str(tag))
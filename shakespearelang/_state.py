@@ -19,6 +19,15 @@ class State:
         self._characters_on_stage = {}
         self._characters_opposite = {}
 
+        # Compiled operations address characters by slot: their index in the
+        # dramatis personae, as assigned by Play.
+        self._slots = {name: slot for slot, name in enumerate(self.characters)}
+        self.character_list = list(self.characters.values())
+        self.on_stage = [False] * len(self.character_list)
+        self.opposites = [None] * len(self.character_list)
+        # Bit i is set when the character in slot i is on stage.
+        self.stage_mask = 0
+
     def __str__(self):
         return "\n".join(
             [f"global boolean = {self.global_boolean}", "on stage:"]
@@ -54,20 +63,30 @@ class State:
     def _enter_character(self, character_name):
         character = self.characters[character_name]
         self._characters_on_stage[character_name] = character
+        slot = self._slots[character_name]
+        self.on_stage[slot] = True
+        self.stage_mask |= 1 << slot
         self._update_opposites()
 
     def _exit_character(self, character_name):
-        character = self.characters[character_name]
         del self._characters_on_stage[character_name]
+        slot = self._slots[character_name]
+        self.on_stage[slot] = False
+        self.stage_mask &= ~(1 << slot)
         self._update_opposites()
 
     def _update_opposites(self):
+        for name in self._characters_opposite:
+            self.opposites[self._slots[name]] = None
+
         if len(self._characters_on_stage) != 2:
             self._characters_opposite = {}
         else:
             names = list(self._characters_on_stage.keys())
             self._characters_opposite[names[0]] = names[1]
             self._characters_opposite[names[1]] = names[0]
+            self.opposites[self._slots[names[0]]] = self.characters[names[1]]
+            self.opposites[self._slots[names[1]]] = self.characters[names[0]]
 
     def character_opposite(self, character_name):
         if character_name in self._characters_opposite:
@@ -98,3 +117,13 @@ class State:
             raise ShakespeareRuntimeError(f"{character_name} is already on stage!")
         if character_name not in self.characters:
             raise ShakespeareRuntimeError(f"{character_name} was not initialized!")
+
+
+def opposite_slot(stage_mask, slot):
+    """The slot of the character that the character in slot is talking to when
+    the stage mask is stage_mask, or None if that is not known."""
+    if stage_mask is None or bin(stage_mask).count("1") != 2:
+        return None
+    if not stage_mask & (1 << slot):
+        return None
+    return (stage_mask & ~(1 << slot)).bit_length() - 1
@@ -0,0 +1,420 @@
+from ._expression import (
+    FirstPersonValue,
+    SecondPersonValue,
+    CharacterName,
+    UnaryOperation,
+    BinaryOperation,
+)
+from ._operation import (
+    Entrance,
+    Exit,
+    Exeunt,
+    Breakpoint,
+    Question,
+    Assignment,
+    Input,
+    Output,
+    Push,
+    Pop,
+    Goto,
+)
+from ._state import opposite_slot
+from ._input import BasicInputManager
+from ._output import BasicOutputManager
+from .errors import ShakespeareRuntimeError
+import re
+
+# Names imported by generated modules. Keep these stable: transpiled plays written
+# to disk by older versions import them.
+factorial = UnaryOperation._evaluate_factorial
+square_root = UnaryOperation._evaluate_square_root
+quotient = BinaryOperation._evaluate_quotient
+remainder = BinaryOperation._evaluate_remainder
+
+_MODULE_HEADER = '''\
+"""
+{title}
+
+Transpiled from a Shakespeare Programming Language play by shakespearelang.
+Run this file directly, or import it and call run().
+"""
+
+from shakespearelang._transpile import (
+    BasicInputManager,
+    BasicOutputManager,
+    ShakespeareRuntimeError,
+    add_source_context,
+    factorial,
+    no_opposite,
+    not_initialized,
+    quotient,
+    remainder,
+    square_root,
+)
+
+SOURCE = {source}
+
+
+def run(input_manager=None, output_manager=None):
+    if output_manager is None:
+        output_manager = BasicOutputManager()
+    if input_manager is None:
+        input_manager = BasicInputManager(output_manager.flush)
+    consume_numeric_input = input_manager.consume_numeric_input
+    consume_character_input = input_manager.consume_character_input
+    output_number = output_manager.output_number
+    output_character = output_manager.output_character
+
+    value = {values}
+    stack = {stacks}
+    on_stage = []
+    boolean = False
+    position = 0
+    try:
+        while True:
+'''
+
+_MODULE_FOOTER = """\
+            return
+    except ShakespeareRuntimeError as exc:
+        add_source_context(exc, SOURCE, SPANS)
+        raise exc
+    finally:
+        output_manager.flush()
+
+
+# Maps line numbers in run() to the spans of the SPL source they came from.
+SPANS = {spans}
+
+
+if __name__ == "__main__":
+    run()
+"""
+
+_UNARY_TEMPLATES = {
+    ("the", "cube", "of"): "({} ** 3)",
+    ("the", "factorial", "of"): "factorial({})",
+    ("the", "square", "of"): "({} ** 2)",
+    ("the", "square", "root", "of"): "square_root({})",
+    "twice": "({} * 2)",
+}
+
+_BINARY_TEMPLATES = {
+    ("the", "difference", "between"): "({} - {})",
+    ("the", "product", "of"): "({} * {})",
+    ("the", "quotient", "between"): "quotient({}, {})",
+    ("the", "remainder", "of", "the", "quotient", "between"): "remainder({}, {})",
+    ("the", "sum", "of"): "({} + {})",
+}
+
+_COMPARISON_OPERATORS = {
+    "positive_comparative": ">",
+    "negative_comparative": "<",
+    "neutral_comparative": "==",
+}
+
+_BODY_INDENT = 3
+
+# Python cannot compile parentheses nested 200 deep, so sub-expressions nested
+# this deep are bound to temporary variables first.
+_MAX_EXPRESSION_NESTING = 50
+
+# Generated expressions that cannot raise, so evaluating them later than the
+# expressions after them changes nothing.
+_SIMPLE_EXPRESSION = re.compile(r"value\[\d+\]|\(-?\d+\)|t\d+")
+
+
+def transpile(play):
+    """Generate the source of a Python module that runs the play.
+
+    Characters are stored by index in local lists, the scenes become branches
+    of a dispatch loop over the position of their first operation, and a Goto
+    is an assignment to that position. Where Play knows who is on stage, the
+    on-stage checks are left out and second-person pronouns refer directly to
+    the character being spoken to.
+    """
+    return _Transpiler(play).transpile()
+
+
+def add_source_context(exc, source, spans):
+    """Attach the SPL source location of the failing operation to an error
+    raised inside a transpiled play."""
+    if exc.parseinfo:
+        return
+    span = spans.get(exc.__traceback__.tb_lineno)
+    if span is None:
+        return
+
+    # Only needed when reporting an error, so avoid the import otherwise.
+    from tatsu.buffering import Buffer
+    from tatsu.infos import ParseInfo
+
+    exc.parseinfo = ParseInfo(Buffer(source), *span)
+
+
+def no_opposite(on_stage, character_name):
+    if len(on_stage) > 2:
+        raise ShakespeareRuntimeError("Ambiguous second-person pronoun")
+    raise ShakespeareRuntimeError(f"{character_name} is talking to nobody!")
+
+
+def not_initialized(character_name):
+    raise ShakespeareRuntimeError(f"{character_name} was not initialized!")
+
+
+class _Transpiler:
+    def __init__(self, play):
+        self.play = play
+        self.slots = play.character_slots
+        self.lines = []
+        self.spans = {}
+        # The stage mask the current sentence runs with, if known.
+        self.stage = None
+        # Sub-expressions of the current sentence bound to temporary variables,
+        # as (name, expression), in the order they must be evaluated.
+        self.temporaries = []
+        self.temporary_count = 0
+
+    def transpile(self):
+        operations = self.play.operations
+        source = ""
+        if operations:
+            source = operations[0].ast_node.parseinfo.tokenizer.text
+
+        header = _MODULE_HEADER.format(
+            title=self.play.title.replace('"""', "'''"),
+            source=repr(source),
+            values=repr([0] * len(self.slots)),
+            stacks=repr([[] for _ in self.slots]),
+        )
+        self.first_line = header.count("\n") + 1
+
+        scene_starts = sorted(
+            {
+                index
+                for scenes in self.play.scene_indices.values()
+                for index in scenes.values()
+                if index < len(operations)
+            }
+        )
+        for block, start in enumerate(scene_starts):
+            end = (
+                scene_starts[block + 1]
+                if block + 1 < len(scene_starts)
+                else len(operations)
+            )
+            self._emit(0, f"if position == {start}:")
+            for position in range(start, end):
+                self._operation(position, operations[position])
+            self._emit(1, f"position = {end}")
+
+        spans = "".join(f"\n    {line}: {span!r}," for line, span in self.spans.items())
+        return (
+            header + "".join(self.lines) + _MODULE_FOOTER.format(spans=f"{{{spans}\n}}")
+        )
+
+    # EMITTING
+
+    def _emit(self, indent, line, operation=None):
+        self.lines.append("    " * (_BODY_INDENT + indent) + line + "\n")
+        if operation is not None:
+            parseinfo = operation.ast_node.parseinfo
+            self.spans[self.first_line + len(self.lines) - 1] = (
+                parseinfo.rule,
+                parseinfo.pos,
+                parseinfo.endpos,
+                parseinfo.line,
+                parseinfo.endline,
+            )
+
+    def _emit_with_temporaries(self, indent, line, operation):
+        for name, expression in self.temporaries:
+            self._emit(indent, f"{name} = {expression}", operation)
+        self.temporaries = []
+        self._emit(indent, line, operation)
+
+    def _raise(self, indent, message, operation):
+        self._emit(indent, f"raise ShakespeareRuntimeError({message!r})", operation)
+
+    # OPERATIONS
+
+    def _operation(self, position, operation):
+        if isinstance(operation, Breakpoint):
+            return
+        if isinstance(operation, (Entrance, Exit, Exeunt)):
+            self._stage_operation(operation)
+            return
+
+        indent = 1
+        character = operation.character
+        if character not in self.slots:
+            self._raise(indent, f"{character} was not initialized!", operation)
+            return
+        slot = self.slots[character]
+        self.stage = self.play.stages[position]
+        if self.stage is None or not self.stage & (1 << slot):
+            self.stage = None
+            self._emit(indent, f"if {slot} not in on_stage:", operation)
+            self._raise(indent + 1, f"{character} is not on stage!", operation)
+
+        if operation.has_condition:
+            negation = "" if operation.condition_type_positive else "not "
+            self._emit(indent, f"if {negation}boolean:", operation)
+            indent += 1
+
+        _SENTENCE_HANDLERS[type(operation)](self, indent, position, operation)
+
+    def _stage_operation(self, operation):
+        if isinstance(operation, Entrance):
+            characters = operation.characters
+            check, failure = "in", "is already on stage!"
+        elif isinstance(operation, Exit):
+            characters = [operation.character]
+            check, failure = "not in", "is not on stage!"
+        elif operation.characters is None:
+            self._emit(1, "on_stage.clear()", operation)
+            return
+        else:
+            characters = operation.characters
+            check, failure = "not in", "is not on stage!"
+
+        for name in characters:
+            if name not in self.slots:
+                self._raise(1, f"{name} was not initialized!", operation)
+                return
+            self._emit(1, f"if {self.slots[name]} {check} on_stage:", operation)
+            self._raise(2, f"{name} {failure}", operation)
+
+        for name in dict.fromkeys(characters):
+            if isinstance(operation, Entrance):
+                self._emit(1, f"on_stage.append({self.slots[name]})", operation)
+            else:
+                self._emit(1, f"on_stage.remove({self.slots[name]})", operation)
+
+    def _question(self, indent, position, operation):
+        comparative_rule = operation.op_ast_node.comparative.parseinfo.rule
+        (first, _), (second, _) = self._expressions(
+            operation.character, operation.first_value, operation.second_value
+        )
+        comparison = _COMPARISON_OPERATORS[comparative_rule]
+        self._emit_with_temporaries(
+            indent, f"boolean = {first} {comparison} {second}", operation
+        )
+
+    def _assignment(self, indent, position, operation):
+        self._emit(indent, f"target = {self._opposite(operation.character)}", operation)
+        value = self._expression(operation.value, operation.character)
+        self._emit_with_temporaries(indent, f"value[target] = {value}", operation)
+
+    def _input(self, indent, position, operation):
+        self._emit(indent, f"target = {self._opposite(operation.character)}", operation)
+        if operation.input_type == "number":
+            self._emit(indent, "value[target] = consume_numeric_input()", operation)
+        else:
+            self._emit(indent, "value[target] = consume_character_input()", operation)
+
+    def _output(self, indent, position, operation):
+        target = self._opposite(operation.character)
+        if operation.output_type == "number":
+            self._emit(indent, f"output_number(value[{target}])", operation)
+        else:
+            self._emit(indent, f"output_character(value[{target}])", operation)
+
+    def _push(self, indent, position, operation):
+        self._emit(indent, f"target = {self._opposite(operation.character)}", operation)
+        value = self._expression(operation.value, operation.character)
+        self._emit_with_temporaries(indent, f"stack[target].append({value})", operation)
+
+    def _pop(self, indent, position, operation):
+        self._emit(indent, f"target = {self._opposite(operation.character)}", operation)
+        self._emit(indent, "if not stack[target]:", operation)
+        self._raise(indent + 1, "Tried to pop from an empty stack.", operation)
+        self._emit(indent, "value[target] = stack[target].pop()", operation)
+
+    def _goto(self, indent, position, operation):
+        destination = operation.destination_position
+        if destination == position:
+            # Jumping to the operation that is already running moves on to the
+            # next one, the same as in the interpreter.
+            self._emit(indent, "pass", operation)
+            return
+        self._emit(indent, f"position = {destination}", operation)
+        self._emit(indent, "continue", operation)
+
+    # EXPRESSIONS
+
+    def _opposite(self, character):
+        slot = self.slots[character]
+        known_opposite = opposite_slot(self.stage, slot)
+        if known_opposite is not None:
+            return str(known_opposite)
+        return (
+            f"(on_stage[on_stage[0] == {slot}] if len(on_stage) == 2 "
+            f"else no_opposite(on_stage, {character!r}))"
+        )
+
+    def _expression(self, expression, character):
+        code, _ = self._nested_expression(expression, character)
+        return code
+
+    def _nested_expression(self, expression, character):
+        """Returns the code of the expression and how deeply it nests."""
+        if expression.constant:
+            return f"({expression.constant_value!r})", 1
+        if isinstance(expression, FirstPersonValue):
+            return f"value[{self.slots[character]}]", 1
+        if isinstance(expression, SecondPersonValue):
+            return f"value[{self._opposite(character)}]", 3
+        if isinstance(expression, CharacterName):
+            if expression.name not in self.slots:
+                return f"not_initialized({expression.name!r})", 1
+            return f"value[{self.slots[expression.name]}]", 1
+        if isinstance(expression, UnaryOperation):
+            operand, depth = self._nested_expression(expression.operand, character)
+            code = _UNARY_TEMPLATES[expression.ast_node.operation].format(operand)
+        else:
+            operands = self._expressions(
+                character, expression.first_operand, expression.second_operand
+            )
+            code = _BINARY_TEMPLATES[expression.ast_node.operation].format(
+                *(operand for operand, _ in operands)
+            )
+            depth = max(depth for _, depth in operands)
+
+        if depth + 1 < _MAX_EXPRESSION_NESTING:
+            return code, depth + 1
+        return self._bind_temporary(code, len(self.temporaries)), 0
+
+    def _expressions(self, character, *expressions):
+        """Returns the code and nesting of each expression, to be evaluated in
+        order."""
+        results = []
+        for expression in expressions:
+            start = len(self.temporaries)
+            code, depth = self._nested_expression(expression, character)
+            if len(self.temporaries) > start:
+                # Parts of this expression are now evaluated before the
+                # expressions that come before it, so those are too.
+                for index, (earlier, _) in enumerate(results):
+                    if not _SIMPLE_EXPRESSION.fullmatch(earlier):
+                        results[index] = (self._bind_temporary(earlier, start), 0)
+                        start += 1
+            results.append((code, depth))
+        return results
+
+    def _bind_temporary(self, code, index):
+        name = f"t{self.temporary_count}"
+        self.temporary_count += 1
+        self.temporaries.insert(index, (name, code))
+        return name
+
+
+_SENTENCE_HANDLERS = {
+    Question: _Transpiler._question,
+    Assignment: _Transpiler._assignment,
+    Input: _Transpiler._input,
+    Output: _Transpiler._output,
+    Push: _Transpiler._push,
+    Pop: _Transpiler._pop,
+    Goto: _Transpiler._goto,
+}
@@ -1,10 +1,12 @@
 #! /usr/bin/env python
 
 import click
+import os
 import sys
 from .shakespeare import Shakespeare
 from .errors import ShakespeareError
-from ._repl import start_console, debug_play
+from ._serialize import is_serialized_file
+from contextlib import ExitStack
 from functools import wraps, partial
 
 
@@ -46,6 +48,10 @@ def main(ctx, characters):
 @pretty_print_shakespeare_errors
 def console(characters):
     """Run a Shakespeare Programming Language console."""
+    # Imported here because it imports readline, which running plays does not
+    # need.
+    from ._repl import start_console
+
     start_console(characters.split(","))
 
 
@@ -54,19 +60,62 @@ def console(characters):
 @click.option(
     "--input-style",
     default="basic",
-    help="Input style to use. 'basic' is the default and best for piped input. 'interactive' is nicer when getting input from a human.",
+    help="Input style to use. 'basic' is the default and best for piped input. 'interactive' is nicer when getting input from a human. 'binary' is like 'basic' but reads bytes rather than text, for binary data.",
 )
 @click.option(
     "--output-style",
     default="basic",
-    help="Output style to use. 'basic' is the default and outputs exactly what the SPL play generated. 'verbose' prefixes output and shows visible representations of whitespace characters. 'debug' is like 'verbose' but with debug output from the interpreter.",
+    help="Output style to use. 'basic' is the default and outputs exactly what the SPL play generated. 'binary' is like 'basic' but writes bytes rather than text, for binary data. 'verbose' prefixes output and shows visible representations of whitespace characters. 'debug' is like 'verbose' but with debug output from the interpreter.",
+)
+@click.option(
+    "--cache-dir",
+    default=None,
+    help="Directory to cache parsed plays in, so that running the same play again does not parse it again. Default is not to cache.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Number of processes to parse the play in. Default is 1. More can make parsing very large plays faster.",
+)
+@click.option(
+    "--lazy",
+    is_flag=True,
+    help="Parse each scene only when the play first reaches it, so that large plays start running sooner. Parse errors in scenes that are never reached are not reported.",
+)
+@click.option(
+    "--input-file",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False),
+    help="File to read the play's input from instead of standard input. With the 'binary' input style, the file is memory-mapped rather than read, as is standard input when it is redirected from a file.",
 )
 @pretty_print_shakespeare_errors
-def run(file, input_style, output_style):
-    """Execute the Shakespeare Programming Language play located at filepath FILE."""
-    with open(file, "r") as f:
-        play = f.read()
-    Shakespeare(play, input_style=input_style, output_style=output_style).run()
+def run(file, input_style, output_style, cache_dir, jobs, lazy, input_file):
+    """Execute the Shakespeare Programming Language play located at filepath FILE, which may also be a play compiled with the compile command from a trusted source."""
+    with ExitStack() as stack:
+        stdin = None
+        if input_file is not None:
+            mode = "rb" if input_style == "binary" else "r"
+            stdin = stack.enter_context(open(input_file, mode))
+
+        if is_serialized_file(file):
+            interpreter = Shakespeare.from_compiled(
+                file, input_style=input_style, output_style=output_style, stdin=stdin
+            )
+        else:
+            with open(file, "r") as f:
+                play = f.read()
+            interpreter = Shakespeare(
+                play,
+                input_style=input_style,
+                output_style=output_style,
+                cache_dir=cache_dir,
+                jobs=jobs,
+                lazy=lazy,
+                stdin=stdin,
+            )
+        interpreter.run()
 
 
 @main.command()
@@ -86,4 +135,79 @@ def debug(file, input_style, output_style):
     """Execute the Shakespeare Programming Language play located at filepath FILE, pausing at breakpoints."""
     with open(file, "r") as f:
         play = f.read()
+    from ._repl import debug_play
+
     debug_play(play, input_style=input_style, output_style=output_style)
+
+
+@main.command()
+@click.argument("file")
+@click.option(
+    "-o",
+    "--output",
+    default=None,
+    help="File to write the Python module to. Default is to print it.",
+)
+@pretty_print_shakespeare_errors
+def transpile(file, output):
+    """Transpile the Shakespeare Programming Language play located at filepath FILE into a Python module."""
+    with open(file, "r") as f:
+        play = f.read()
+    python_source = Shakespeare(play).compile_to_python()
+    if output is None:
+        print(python_source, end="")
+    else:
+        with open(output, "w") as f:
+            f.write(python_source)
+
+
+@main.command(name="compile")
+@click.argument("file")
+@click.option(
+    "-o",
+    "--output",
+    default=None,
+    help="File to write the compiled play to. Default is FILE with the extension .splc.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Number of processes to parse the play in. Default is 1. More can make parsing very large plays faster.",
+)
+@pretty_print_shakespeare_errors
+def compile_play(file, output, jobs):
+    """Compile the Shakespeare Programming Language play located at filepath FILE, so that the run command can run it without parsing it. The compiled play can only be run with the same version of Python, and compiled plays should only be run from a trusted source."""
+    with open(file, "r") as f:
+        play = f.read()
+    compiled = Shakespeare(play, jobs=jobs).compile_to_splc()
+    if output is None:
+        output = os.path.splitext(file)[0] + ".splc"
+    with open(output, "wb") as f:
+        f.write(compiled)
+
+
+@main.command(name="parse-profile")
+@click.argument("file")
+@click.option(
+    "--format",
+    "output_format",
+    default="table",
+    type=click.Choice(["table", "json"]),
+    help="Format of the profile. 'table' is the default and lists the rules that took longest first. 'json' is for other programs.",
+)
+@pretty_print_shakespeare_errors
+def parse_profile(file, output_format):
+    """Parse the Shakespeare Programming Language play located at filepath FILE with the parser generated from the grammar, and show the calls, successes, failures, memo hits and time of each rule of the grammar."""
+    with open(file, "r") as f:
+        play = f.read()
+    from .parse_profile import profile_parse
+
+    profile = profile_parse(play)
+    if output_format == "json":
+        import json
+
+        print(json.dumps(profile.to_dict(), indent=2))
+    else:
+        print(profile.format_table(), end="")
@@ -89,3 +89,18 @@ class ShakespeareRuntimeError(ShakespeareError):
         if self.interpreter is None:
             return []
         return ["----- state -----", str(self.interpreter.state)]
+
+
+class ShakespeareCompiledPlayError(ShakespeareError):
+    """
+    An error caused by a compiled Shakespeare Programming Language play that
+    cannot be loaded, because it is corrupted or was compiled by an incompatible
+    version. Inherits from [ShakespeareError][shakespearelang.ShakespeareError].
+    """
+
+    def __init__(self, message):
+        self.message = message
+        super().__init__()
+
+    def __str__(self):
+        return f"SPL compiled play error: {self.message}"
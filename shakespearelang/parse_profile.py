@@ -0,0 +1,127 @@
+from .errors import ShakespeareParseError
+from time import perf_counter
+import sys
+from typing import Dict
+
+
+class RuleProfile:
+    """
+    How one rule of the grammar fared while parsing.
+
+    Attributes:
+        calls: How many times the rule was tried.
+        successes: How many of those times it matched.
+        failures: How many of those times it did not match, so the parser
+            backtracked.
+        memo_hits: How many of those times the result was already memoized.
+        time: The time spent in the rule in seconds, including the rules it
+            called.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.memo_hits = 0
+        self.time = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "successes": self.successes,
+            "failures": self.failures,
+            "memo_hits": self.memo_hits,
+            "time": self.time,
+        }
+
+
+class ParseProfile:
+    """
+    How each rule of the grammar fared while parsing something with the TatSu
+    parser, made by [profile_parse][shakespearelang.profile_parse].
+
+    Attributes:
+        rules: The profile of each rule that was tried, by name.
+        time: The time the whole parse took in seconds.
+    """
+
+    def __init__(self):
+        self.rules: Dict[str, RuleProfile] = {}
+        self.time = 0.0
+
+    def rule(self, name: str) -> RuleProfile:
+        """The profile of the named rule, which is empty if it was never tried."""
+        if name not in self.rules:
+            self.rules[name] = RuleProfile()
+        return self.rules[name]
+
+    def to_dict(self) -> dict:
+        """
+        Returns:
+            The profile as a dictionary that can be serialized as JSON.
+        """
+        return {
+            "time": self.time,
+            "rules": {name: rule.to_dict() for name, rule in self.rules.items()},
+        }
+
+    def format_table(self) -> str:
+        """
+        Returns:
+            The profile as a table, with the rules that took longest first.
+        """
+        width = max([len("rule")] + [len(name) for name in self.rules])
+        lines = [
+            f"{'rule':<{width}} {'calls':>9} {'successes':>9} {'failures':>9} "
+            f"{'memo hits':>9} {'time (ms)':>10}"
+        ]
+        for name, rule in sorted(
+            self.rules.items(), key=lambda item: item[1].time, reverse=True
+        ):
+            lines.append(
+                f"{name:<{width}} {rule.calls:>9} {rule.successes:>9} "
+                f"{rule.failures:>9} {rule.memo_hits:>9} {rule.time * 1000:>10.1f}"
+            )
+        lines.append(f"total time: {self.time * 1000:.1f} ms")
+        return "\n".join(lines) + "\n"
+
+
+def profile_parse(text: str, rule_name: str = "play") -> ParseProfile:
+    """
+    Parse Shakespeare Programming Language code with the TatSu parser generated
+    from the grammar, recording the calls, successes, failures (backtracking),
+    memo hits and time of each of its rules, to find the ones that make parsing
+    slow.
+
+    Arguments:
+        text: The code to parse.
+        rule_name: The rule of the grammar to parse it with, 'play' by default.
+
+    Returns:
+        The profile of the parse.
+
+    Raises:
+        ShakespeareParseError: If the code cannot be parsed.
+    """
+    # Imported here because it imports TatSu, which is slow to import.
+    from tatsu.exceptions import FailedParse
+    from ._profiling_parser import ProfilingParser
+
+    profile = ParseProfile()
+    parser = ProfilingParser(profile)
+    # Profiling adds a frame to every call of a rule, and deeply nested
+    # expressions already come close to the default recursion limit.
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(recursion_limit * _PROFILING_STACK_FACTOR)
+    start = perf_counter()
+    try:
+        parser.parse(text, rule_name=rule_name)
+    except FailedParse as parseException:
+        raise ShakespeareParseError(parseException) from None
+    finally:
+        profile.time = perf_counter() - start
+        sys.setrecursionlimit(recursion_limit)
+    return profile
+
+
+_PROFILING_STACK_FACTOR = 2
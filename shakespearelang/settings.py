@@ -1,5 +1,5 @@
-from ._input import BasicInputManager, InteractiveInputManager
-from ._output import BasicOutputManager, VerboseOutputManager
+from ._input import BasicInputManager, BinaryInputManager, InteractiveInputManager
+from ._output import BasicOutputManager, BinaryOutputManager, VerboseOutputManager
 
 
 class Settings:
@@ -11,23 +11,45 @@ class Settings:
     _INPUT_MANAGERS = {
         "basic": BasicInputManager,
         "interactive": InteractiveInputManager,
+        "binary": BinaryInputManager,
     }
 
     _OUTPUT_MANAGERS = {
         "basic": BasicOutputManager,
+        "binary": BinaryOutputManager,
         "verbose": VerboseOutputManager,
         "debug": VerboseOutputManager,
     }
 
-    def __init__(self, input_style, output_style):
+    def __init__(self, input_style, output_style, stdin=None, stdout=None):
+        self._stdin = stdin
+        self._stdout = stdout
         self.input_style = input_style
         self.output_style = output_style
 
+    @property
+    def stdin(self):
+        """
+        The file-like object the interpreter reads input from, or None for standard
+            input. It must be binary for the 'binary' input style and text otherwise.
+        """
+        return self._stdin
+
+    @property
+    def stdout(self):
+        """
+        The file-like object the interpreter writes output to, or None for standard
+            output. It must be binary for the 'binary' output style and text otherwise.
+        """
+        return self._stdout
+
     @property
     def input_style(self):
         """
         Input style of the interpreter. 'basic' is the best for piped input.
-            'interactive' is nicer when getting input from a human.
+            'interactive' is nicer when getting input from a human. 'binary' is like
+            'basic' but reads bytes rather than text, so each character input is a
+            byte value from 0 to 255.
         """
         return self._input_style
 
@@ -36,13 +58,19 @@ class Settings:
         if value not in self._INPUT_MANAGERS:
             raise ValueError("Unknown input style")
 
-        self.input_manager = self._INPUT_MANAGERS[value]()
+        self.input_manager = self._INPUT_MANAGERS[value](
+            self._flush_output, stdin=self._stdin, stdout=self._stdout
+        )
         self._input_style = value
 
     @property
     def output_style(self):
         """
-        Output style of the interpreter. 'basic' outputs exactly what the SPL play generated.
+        Output style of the interpreter. 'basic' outputs exactly what the SPL play generated,
+        in batches: it is written when input is read and whenever the interpreter stops
+        running the play, or sooner when standard output is a terminal and a line ends.
+        'binary' is like 'basic' but writes bytes rather than text, so each character
+        output must be a byte value from 0 to 255.
         'verbose' prefixes output and shows visible representations of
         whitespace characters. 'debug' is like 'verbose' but with debug output
         from the interpreter.
@@ -54,5 +82,13 @@ class Settings:
         if value not in self._OUTPUT_MANAGERS:
             raise ValueError("Unknown output style")
 
-        self.output_manager = self._OUTPUT_MANAGERS[value]()
+        output_manager = self._OUTPUT_MANAGERS[value](stdout=self._stdout)
+        if hasattr(self, "output_manager"):
+            # Output the old manager holds would be lost with it.
+            self.output_manager.flush()
+        self.output_manager = output_manager
         self._output_style = value
+
+    def _flush_output(self):
+        # Looked up when input is read, since the output style can change.
+        self.output_manager.flush()
@@ -4,19 +4,36 @@
 Shakespeare -- An interpreter for the Shakespeare Programming Language
 """
 
-from ._parser import shakespeareParser
-from tatsu.exceptions import FailedParse
+from ._serialize import dumps_ast, loads_ast, load_ast_file, _encode, _decode
 from .errors import ShakespeareRuntimeError, ShakespeareParseError
 from ._utils import parseinfo_context, normalize_name
 from ._state import State
 from ._preprocess import Play
+from ._lazy import LazyPlay
 from .settings import Settings
-from ._operation import operations_from_event, operation_from_sentence, Goto, Breakpoint
+from ._operation import (
+    operations_from_event,
+    operation_from_sentence,
+    Breakpoint,
+    Goto,
+)
 from ._expression import expression_from_ast
+from ._fusion import FusedOperationError
 import math
-from tatsu.ast import AST
+import re
 from functools import wraps
-from typing import Callable, Literal, Union
+from os import PathLike
+from typing import IO, TYPE_CHECKING, Callable, Literal, Optional, Union
+
+# Modules only some uses need are imported when first needed, to keep startup
+# fast: TatSu and the parsers when a play needs to be parsed, and the cache and
+# transpiler when used.
+if TYPE_CHECKING:
+    from tatsu.ast import AST
+
+
+# Everything but line breaks, to blank out text without moving any lines.
+_BLANK = re.compile(r"[^\r\n]")
 
 
 class Shakespeare:
@@ -26,9 +43,15 @@ class Shakespeare:
 
     def __init__(
         self,
-        play: Union[str, AST],
-        input_style: Literal["basic", "interactive"] = "basic",
-        output_style: Literal["basic", "verbose", "debug"] = "basic",
+        play: Union[str, "AST"],
+        input_style: Literal["basic", "interactive", "binary"] = "basic",
+        output_style: Literal["basic", "binary", "verbose", "debug"] = "basic",
+        parser: Literal["fast", "tatsu"] = "fast",
+        cache_dir: Optional[str] = None,
+        jobs: int = 1,
+        lazy: bool = False,
+        stdin: Optional[IO] = None,
+        stdout: Optional[IO] = None,
     ):
         """
         Arguments:
@@ -37,23 +60,69 @@ class Shakespeare:
                 interpreter.
             input_style: 'basic' is the default and best for piped input.
                 'interactive' is nicer when getting input from a human.
+                'binary' is like 'basic' but reads bytes rather than text.
                 This is passed directly along to the [Settings][shakespearelang.Settings]
                 instance for this interpreter. To change after initialization,
                 modify that instance at the .settings property of the interpreter.
             output_style: The output style to initialize the interpreter with.
                 'basic' is the default and outputs exactly what the SPL play generated.
+                'binary' is like 'basic' but writes bytes rather than text.
                 'verbose' prefixes output and shows visible representations of
                 whitespace characters. 'debug' is like 'verbose' but with debug output
                 from the interpreter.
                 This is passed directly along to the [Settings][shakespearelang.Settings]
                 instance for this interpreter. To change after initialization,
                 modify that instance at the .settings property of the interpreter.
+            parser: 'fast' is the default and parses plays with a hand-written
+                parser, falling back to the TatSu parser generated from the grammar
+                for anything it cannot parse, including plays with syntax errors.
+                'tatsu' always uses the TatSu parser. Both give the same results.
+            cache_dir: A directory to cache parsed plays in. If given, a play
+                that has been parsed before is loaded from there instead of
+                being parsed again. The cache is shared safely between
+                interpreters and processes, and the least recently used plays
+                are deleted when it grows too large.
+            jobs: How many processes to parse the play in. With more than one,
+                the acts and scenes of a large play are parsed in parallel by
+                the 'fast' parser. The result is the same either way.
+            lazy: If true, only the title, the dramatis personae and the act
+                and scene headings of the play are parsed at first, and each
+                scene is parsed the first time the play reaches it, so that the
+                play starts running sooner. Parse errors in scenes the play
+                never reaches are not reported, unless
+                [parse_all_scenes][shakespearelang.Shakespeare.parse_all_scenes]
+                is called. Only with the 'fast' parser, and not for plays that
+                are already parsed or in the cache.
+            stdin: A file-like object for the play to read input from instead
+                of standard input, such as an io.StringIO, or an io.BytesIO for
+                the 'binary' input style.
+            stdout: A file-like object for the play to write output to instead
+                of standard output, such as an io.StringIO, or an io.BytesIO for
+                the 'binary' output style. With both, interpreters can run
+                plays at the same time without replacing sys.stdin and
+                sys.stdout.
         """
-        self.settings = Settings(input_style, output_style)
-        self.parser = shakespeareParser()
-        ast = self._parse_if_necessary(play, "play")
-        self.play = Play(ast)
-        self.state = State(ast.dramatis_personae)
+        if parser not in ("fast", "tatsu"):
+            raise ValueError("Unknown parser")
+        if jobs < 1:
+            raise ValueError("jobs must be at least 1")
+
+        self.settings = Settings(input_style, output_style, stdin, stdout)
+        self._parser_name = parser
+        self._jobs = jobs
+        self._parser = None
+        self._fast_parser = None
+        self.cache = None
+        if cache_dir is not None:
+            from ._cache import PlayCache
+
+            self.cache = PlayCache(cache_dir)
+        self.play = None
+        if lazy and parser == "fast" and isinstance(play, str):
+            self.play = self._lazy_play(play)
+        if self.play is None:
+            self.play = Play(self._parse_if_necessary(play, "play"))
+        self.state = State(self.play.ast.dramatis_personae)
 
         self.current_position = 0
 
@@ -91,7 +160,7 @@ class Shakespeare:
     # PUBLIC METHODS
 
     @_add_interpreter_context_to_errors
-    def run(self, breakpoint_callback: Callable[[], None] = lambda: None) -> None:
+    def run(self, breakpoint_callback: Optional[Callable[[], None]] = None) -> None:
         """
         Execute the entire SPL play, optionally pausing at breakpoints.
 
@@ -100,12 +169,16 @@ class Shakespeare:
                 breakpoint is hit. After the callback returns, execution
                 continues. The default is to do nothing.
         """
-        while not self.play_over():
-            if isinstance(self._next_operation(), Breakpoint):
-                self._advance_position()
-                breakpoint_callback()
+        try:
+            if breakpoint_callback is None:
+                self._run_from(self.current_position)
             else:
-                self.step_forward()
+                self._run_from_with_breakpoints(
+                    self.current_position, breakpoint_callback
+                )
+        except FusedOperationError as failure:
+            self.current_position = failure.position
+            raise failure.error from None
 
     @_add_interpreter_context_to_errors
     def play_over(self) -> bool:
@@ -120,24 +193,7 @@ class Shakespeare:
         """
         Run the next event in the play.
         """
-        operation_to_run = self._next_operation()
-        if isinstance(operation_to_run, Breakpoint):
-            self._advance_position()
-            return
-
-        if self.settings.output_style == "debug":
-            print(
-                f"----------\nat line {operation_to_run.ast_node.parseinfo.line}\n-----\n"
-                + parseinfo_context(operation_to_run.ast_node.parseinfo)
-                + "-----\n"
-                + str(self.state)
-                + "\n----------"
-            )
-
-        pos_before_operation = self.current_position
-        self._run_operation(operation_to_run)
-        if self.current_position == pos_before_operation:
-            self._advance_position()
+        self._step()
 
     @_add_interpreter_context_to_errors
     def next_operation_text(self) -> str:
@@ -151,7 +207,7 @@ class Shakespeare:
 
     @_add_interpreter_context_to_errors
     @_parse_first_argument("event")
-    def run_event(self, event: Union[str, AST]) -> None:
+    def run_event(self, event: Union[str, "AST"]) -> None:
         """
         Run an event in the current execution context.
 
@@ -165,7 +221,7 @@ class Shakespeare:
 
     @_add_interpreter_context_to_errors
     @_parse_first_argument("sentence")
-    def run_sentence(self, sentence: Union[str, AST], character: str):
+    def run_sentence(self, sentence: Union[str, "AST"], character: str):
         """
         Run a sentence in the current execution context.
 
@@ -178,7 +234,7 @@ class Shakespeare:
 
     @_add_interpreter_context_to_errors
     @_parse_first_argument("value")
-    def evaluate_expression(self, expression: Union[str, AST], character: str) -> int:
+    def evaluate_expression(self, expression: Union[str, "AST"], character: str) -> int:
         """
         Evaluate an expression in the current execution context.
 
@@ -190,21 +246,245 @@ class Shakespeare:
             The integer value of the expression.
         """
         expression = expression_from_ast(expression, character)
-        return expression.evaluate(self.state)
+        return expression.compile_checked(self.play.character_slots)(self.state)
+
+    def parse_all_scenes(self) -> None:
+        """
+        Parse every scene of a play that is parsed lazily (see the lazy argument
+        of the constructor) and has not been parsed yet, so that any parse
+        errors in them are reported. Does nothing for other plays.
+        """
+        if isinstance(self.play, LazyPlay):
+            self.play.parse_all_scenes()
+
+    def compile_to_python(self) -> str:
+        """
+        Transpile the play into the source code of a standalone Python module.
+
+        The module defines a `run()` function that executes the play from the
+        beginning, with basic input and output, and can also be run as a script.
+        Runtime errors raised by it have the same messages as the interpreter's
+        and point to the SPL source of the sentence or event that failed.
+
+        Returns:
+            The Python source code.
+        """
+        from ._transpile import transpile
+
+        return transpile(self._eager_play())
+
+    def compile_to_splc(self) -> bytes:
+        """
+        Compile the play into a compact binary that can be loaded again with
+        [from_compiled][shakespearelang.Shakespeare.from_compiled] without
+        parsing it, and without importing the parser at all. It can only be
+        loaded by the same version of Python that compiled it.
+
+        Returns:
+            The contents of the compiled play (conventionally a .splc file).
+        """
+        return dumps_ast(self._eager_play().ast)
+
+    @classmethod
+    def from_compiled(
+        cls,
+        compiled: Union[bytes, str, PathLike],
+        input_style: Literal["basic", "interactive", "binary"] = "basic",
+        output_style: Literal["basic", "binary", "verbose", "debug"] = "basic",
+        stdin: Optional[IO] = None,
+        stdout: Optional[IO] = None,
+    ) -> "Shakespeare":
+        """
+        Create an interpreter for a play compiled with
+        [compile_to_splc][shakespearelang.Shakespeare.compile_to_splc].
+
+        Only load compiled plays from a trusted source: they are read with
+        marshal, which is not safe against maliciously constructed data.
+
+        Arguments:
+            compiled: The compiled play, or the path of a file containing it,
+                which is memory-mapped rather than read.
+            input_style: As for the constructor.
+            output_style: As for the constructor.
+            stdin: As for the constructor.
+            stdout: As for the constructor.
+
+        Raises:
+            ShakespeareCompiledPlayError: If the compiled play is corrupted or
+                was compiled by an incompatible version of shakespearelang or
+                of Python.
+        """
+        if isinstance(compiled, (bytes, bytearray, memoryview)):
+            ast = loads_ast(compiled)
+        else:
+            ast = load_ast_file(compiled)
+        return cls(
+            ast,
+            input_style=input_style,
+            output_style=output_style,
+            stdin=stdin,
+            stdout=stdout,
+        )
 
     def parse(self, item, rule_name):
+        if rule_name == "play" and self.cache:
+            ast = self.cache.load(item)
+            if ast is None:
+                ast = self._parse(item, rule_name)
+                self.cache.store(item, ast)
+            return ast
+        return self._parse(item, rule_name)
+
+    # HELPERS
+
+    def _parse(self, item, rule_name):
+        if rule_name == "play" and self._parser_name == "fast":
+            ast = self._get_fast_parser().parse(item, jobs=self._jobs)
+            if ast is not None:
+                return ast
+        from tatsu.exceptions import FailedParse
+
+        if self._parser is None:
+            from ._bounded_parser import BoundedMemoParser
+
+            self._parser = BoundedMemoParser()
         try:
-            return self.parser.parse(item, rule_name=rule_name)
+            return self._parser.parse(item, rule_name=rule_name)
         except FailedParse as parseException:
             raise ShakespeareParseError(parseException) from None
 
-    # HELPERS
+    def _lazy_play(self, text):
+        # A play in the cache is loaded from there in full instead. Lazily
+        # parsed plays are never added to the cache.
+        if self.cache and self.cache.load(text) is not None:
+            return None
+        outline = self._get_fast_parser().outline(text)
+        if outline is None:
+            return None
+        return LazyPlay(outline, self._parse_scene)
+
+    def _parse_scene(self, act, scene, end):
+        buffer = scene.parseinfo.tokenizer
+        ast = self._get_fast_parser().parse_scene(buffer, scene.parseinfo.pos, end)
+        if ast is not None:
+            return ast
+
+        # Parse a copy of the play with everything blanked out but the dramatis
+        # personae, the act heading and the scene, so that errors are reported
+        # where they are in the play.
+        text = buffer.text
+        kept = [
+            (0, self.play.ast.acts[0].parseinfo.pos),
+            (act.parseinfo.pos, act.parseinfo.endpos),
+            (scene.parseinfo.pos, end),
+        ]
+        pieces = []
+        pos = 0
+        for start, stop in kept:
+            pieces.append(_BLANK.sub(" ", text[pos:start]))
+            pieces.append(text[start:stop])
+            pos = stop
+        pieces.append(_BLANK.sub(" ", text[pos:]))
+        try:
+            ast = self._parse("".join(pieces), "play")
+        except ShakespeareParseError as error:
+            error.tokenizer = buffer
+            raise
+        return _decode(_encode(ast.acts[0].scenes[0]), buffer)
+
+    def _get_fast_parser(self):
+        if self._fast_parser is None:
+            from ._fast_parser import FastParser
+
+            self._fast_parser = FastParser()
+        return self._fast_parser
+
+    def _eager_play(self):
+        if not isinstance(self.play, LazyPlay):
+            return self.play
+        # Parsed again in full, which also reports any parse errors in it.
+        return Play(self.parse(self.play.ast.parseinfo.tokenizer.text, "play"))
+
+    def _run_from(self, position):
+        # The hot loop of the interpreter: keep it to one call per operation
+        # (or fused pair of operations), with everything else in locals.
+        # Breakpoints are compiled to do nothing.
+        operations = self.play.fused_operations(self.settings.output_style)
+        state = self.state
+        settings = self.settings
+        try:
+            # A lazily parsed play grows as its scenes are parsed, so its end
+            # is checked again whenever it is reached.
+            while position < len(operations):
+                end = len(operations)
+                while position < end:
+                    new_position = operations[position](state, settings)
+                    if new_position is None or new_position == position:
+                        position += 1
+                    else:
+                        position = new_position
+        finally:
+            self.current_position = position
+            settings.output_manager.flush()
+
+    def _run_from_with_breakpoints(self, position, breakpoint_callback):
+        breakpoint_positions = self.play.breakpoint_positions
+        operations = self.play.fused_operations(self.settings.output_style)
+        state = self.state
+        settings = self.settings
+        try:
+            while position < len(operations):
+                if position in breakpoint_positions:
+                    # The callback sees the interpreter as it is, and may step
+                    # through the play or change the output style.
+                    position += 1
+                    self.current_position = position
+                    settings.output_manager.flush()
+                    breakpoint_callback()
+                    position = self.current_position
+                    operations = self.play.fused_operations(settings.output_style)
+                    continue
+
+                new_position = operations[position](state, settings)
+                if new_position is None or new_position == position:
+                    position += 1
+                else:
+                    position = new_position
+        finally:
+            self.current_position = position
+            settings.output_manager.flush()
+
+    def _step(self):
+        operation_to_run = self._next_operation()
+        if isinstance(operation_to_run, Breakpoint):
+            self._advance_position()
+            return
+
+        position = self.current_position
+        compiled_operations = self.play.compiled_operations(self.settings.output_style)
+        try:
+            new_position = compiled_operations[position](self.state, self.settings)
+        finally:
+            self.settings.output_manager.flush()
+        if new_position is None or new_position == position:
+            self._advance_position()
+        else:
+            self.current_position = new_position
 
     def _run_operation(self, operation):
         if isinstance(operation, Goto):
-            operation.run(self.state, self, self.play, self.settings)
-        else:
-            operation.run(self.state, self.settings)
+            # Run on its own, a Goto to a scene that does not exist fails like
+            # any other sentence: only once it is known to be spoken and taken.
+            operation.resolve(
+                self.play, self.play.get_act(self.current_position), must_exist=False
+            )
+        run = operation.compile(self.play, output_style=self.settings.output_style)
+        try:
+            new_position = run(self.state, self.settings)
+        finally:
+            self.settings.output_manager.flush()
+        if new_position is not None:
+            self.current_position = new_position
 
     def _parse_if_necessary(self, item, rule_name):
         if not isinstance(item, str):
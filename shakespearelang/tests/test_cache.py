@@ -0,0 +1,118 @@
+from shakespearelang import Shakespeare
+from shakespearelang.errors import ShakespeareRuntimeError
+from shakespearelang._cache import PlayCache
+from shakespearelang._fast_parser import FastParser
+from shakespearelang._parser import shakespeareParser
+from .utils import create_play_file, expect_output_exactly, comparable_ast
+from pathlib import Path
+import os
+import pexpect
+import pytest
+
+SAMPLE_PLAYS = Path(__file__).parent / "sample_plays"
+
+
+def no_parsing(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("Parsed the play")
+
+    monkeypatch.setattr(FastParser, "parse", fail)
+    monkeypatch.setattr(shakespeareParser, "parse", fail)
+
+
+def test_cached_play_is_not_parsed_again(tmp_path, monkeypatch, capsys):
+    play = (SAMPLE_PLAYS / "hello_world.spl").read_text()
+    Shakespeare(play, cache_dir=tmp_path)
+
+    no_parsing(monkeypatch)
+    Shakespeare(play, cache_dir=tmp_path).run()
+
+    captured = capsys.readouterr()
+    assert captured.out == "Hello World!\n"
+    assert captured.err == ""
+
+
+def test_cached_play_has_same_ast(tmp_path):
+    play = (SAMPLE_PLAYS / "parse_everything.spl").read_text()
+    parsed = Shakespeare(play, cache_dir=tmp_path).parse(play, "play")
+    loaded = PlayCache(tmp_path).load(play)
+
+    assert comparable_ast(loaded) == comparable_ast(parsed)
+    assert loaded.parseinfo.tokenizer.text == play
+
+
+def test_runtime_errors_from_cached_play(tmp_path):
+    play = "A play. Juliet, a test. Act I: An act. Scene I: A scene. Juliet: Recall it."
+    with pytest.raises(ShakespeareRuntimeError) as parsed_exc:
+        Shakespeare(play, cache_dir=tmp_path).run()
+    with pytest.raises(ShakespeareRuntimeError) as cached_exc:
+        Shakespeare(play, cache_dir=tmp_path).run()
+
+    assert "juliet is not on stage" in str(cached_exc.value).lower()
+    assert str(cached_exc.value) == str(parsed_exc.value)
+
+
+def test_other_versions_are_not_used(tmp_path, monkeypatch):
+    play = (SAMPLE_PLAYS / "hi.spl").read_text()
+    Shakespeare(play, cache_dir=tmp_path)
+
+    monkeypatch.setattr(PlayCache, "_version_key", b"another version")
+    assert PlayCache(tmp_path).load(play) is None
+
+
+def test_corrupted_entries_are_parsed_again(tmp_path, capsys):
+    play = (SAMPLE_PLAYS / "hi.spl").read_text()
+    Shakespeare(play, cache_dir=tmp_path)
+    [entry] = tmp_path.iterdir()
+    entry.write_bytes(b"not a play")
+
+    Shakespeare(play, cache_dir=tmp_path).run()
+
+    captured = capsys.readouterr()
+    assert captured.out == "HI\n"
+    assert captured.err == ""
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    plays = [
+        (SAMPLE_PLAYS / name).read_text()
+        for name in ["hi.spl", "catch.spl", "echo.spl"]
+    ]
+    cache = PlayCache(tmp_path)
+    for play in plays[:2]:
+        Shakespeare(play, cache_dir=tmp_path)
+        # Backdate the entry, so that using it again clearly makes it newer.
+        os.utime(cache._path(play), (1000, 1000))
+
+    # Using the first play again leaves the second as the least recently used.
+    assert cache.load(plays[0]) is not None
+
+    entry_size = max(path.stat().st_size for path in tmp_path.iterdir())
+    small_cache = PlayCache(tmp_path, max_size=2 * entry_size + 100)
+    small_cache.store(plays[2], Shakespeare(plays[2]).parse(plays[2], "play"))
+
+    assert small_cache.load(plays[0]) is not None
+    assert small_cache.load(plays[1]) is None
+    assert small_cache.load(plays[2]) is not None
+
+
+def test_unwritable_cache_dir(tmp_path, capsys):
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+
+    Shakespeare((SAMPLE_PLAYS / "hi.spl").read_text(), cache_dir=not_a_directory).run()
+
+    captured = capsys.readouterr()
+    assert captured.out == "HI\n"
+    assert captured.err == ""
+
+
+def test_cli_cache_dir(tmp_path):
+    play_path = tmp_path / "play.spl"
+    cache_path = tmp_path / "cache"
+    create_play_file(play_path, (SAMPLE_PLAYS / "hi.spl").read_text())
+
+    for _ in range(2):
+        cli = pexpect.spawn(f"shakespeare run {play_path} --cache-dir={cache_path}")
+        expect_output_exactly(cli, "HI\n", eof=True)
+    assert len(list(cache_path.iterdir())) == 1
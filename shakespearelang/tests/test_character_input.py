@@ -1,5 +1,7 @@
 from shakespearelang import Shakespeare
-from io import StringIO
+from shakespearelang._input import BasicInputManager, BinaryInputManager
+from io import BytesIO, StringIO, TextIOWrapper
+import mmap
 
 
 def test_reads_characters_accurately(monkeypatch, capsys):
@@ -136,3 +138,47 @@ def test_conditional(monkeypatch, capsys):
     captured = capsys.readouterr()
     assert captured.out == ""
     assert captured.err == ""
+
+
+def test_long_line(monkeypatch):
+    length = 1_000_000
+    monkeypatch.setattr("sys.stdin", StringIO("x" * length + "\nrest"))
+    input_manager = BasicInputManager()
+
+    codes = [input_manager.consume_character_input() for _ in range(length + 1)]
+    assert codes == [ord("x")] * length + [ord("\n")]
+    assert input() == "rest"
+
+
+def test_binary(monkeypatch, capsys):
+    data = bytes([0, 97, 0xFF, 0xC3, 10, 0x80])
+    monkeypatch.setattr("sys.stdin", TextIOWrapper(BytesIO(data)))
+    s = Shakespeare("Foo. Juliet, a test. Romeo, a test.", input_style="binary")
+    s.run_event("[Enter Romeo and Juliet]")
+
+    for byte in data:
+        s.run_sentence("Open your mind!", "Juliet")
+        assert s.state.character_by_name("Romeo").value == byte
+
+    s.run_sentence("Open your mind!", "Juliet")
+    assert s.state.character_by_name("Romeo").value == -1
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == ""
+
+
+def test_binary_file_is_mapped(tmp_path):
+    path = tmp_path / "input.bin"
+    path.write_bytes(b"skip" + bytes(range(256)) + b"\n42\nrest")
+
+    with path.open("rb") as f:
+        f.read(4)
+        input_manager = BinaryInputManager(stdin=f)
+        codes = [input_manager.consume_character_input() for _ in range(257)]
+        assert isinstance(input_manager._input_buffer, mmap.mmap)
+        assert codes == list(range(256)) + [10]
+        assert input_manager.consume_numeric_input() == 42
+        codes = [input_manager.consume_character_input() for _ in range(5)]
+        assert codes == list(b"rest") + [-1]
+        assert f.read() == b""
@@ -1,8 +1,31 @@
 from shakespearelang import Shakespeare
 from shakespearelang.errors import ShakespeareRuntimeError
-from io import StringIO
+from shakespearelang._output import BasicOutputManager, BinaryOutputManager
+from io import BytesIO, StringIO, TextIOWrapper
 import pytest
 
+BUFFERED_PLAY = """
+Foo. Juliet, a test. Romeo, a test.
+
+Act I: One. Scene I: One.
+
+[Enter Romeo and Juliet]
+
+Juliet: You are the sum of a big big big big big cat and the sum of a big big
+        big big big big cat and a cat. Speak your mind! Speak your mind!
+        Open your mind! Speak your mind! Recall your past!
+"""
+
+
+class CountingStdout(StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
 
 def test_outputs_correct_character(capsys):
     s = Shakespeare("Foo. Juliet, a test. Romeo, a test. Act I: One. Scene I: One.")
@@ -180,3 +203,131 @@ def test_conditional(capsys):
     captured = capsys.readouterr()
     assert captured.out == "b"
     assert captured.err == ""
+
+
+def test_output_is_written_in_batches(monkeypatch):
+    stdout = CountingStdout()
+    monkeypatch.setattr("sys.stdout", stdout)
+    monkeypatch.setattr("sys.stdin", StringIO("b"))
+    s = Shakespeare(BUFFERED_PLAY)
+
+    with pytest.raises(ShakespeareRuntimeError):
+        s.run()
+    assert stdout.getvalue() == "aab"
+    assert stdout.writes == 2
+
+
+def test_output_is_flushed_before_input(monkeypatch):
+    stdout = StringIO()
+    monkeypatch.setattr("sys.stdout", stdout)
+    output_before_input = []
+
+    class Stdin:
+        def readline(self, size=-1):
+            output_before_input.append(stdout.getvalue())
+            return "b"
+
+    monkeypatch.setattr("sys.stdin", Stdin())
+
+    for input_style in ["basic", "interactive"]:
+        stdout.truncate(0)
+        stdout.seek(0)
+        with pytest.raises(ShakespeareRuntimeError):
+            Shakespeare(BUFFERED_PLAY, input_style=input_style).run()
+
+    assert output_before_input == ["aa", "aaTaking input character: "]
+
+
+def test_output_is_flushed_by_flush_policy(monkeypatch):
+    stdout = StringIO()
+    monkeypatch.setattr("sys.stdout", stdout)
+
+    line_buffered = BasicOutputManager(flush_policy="line")
+    line_buffered.output_character(97)
+    line_buffered.output_number(12)
+    assert stdout.getvalue() == ""
+    line_buffered.output_character(10)
+    assert stdout.getvalue() == "a12\n"
+
+    fully_buffered = BasicOutputManager(buffer_size=3, flush_policy="full")
+    fully_buffered.output_character(10)
+    fully_buffered.output_character(98)
+    assert stdout.getvalue() == "a12\n"
+    fully_buffered.output_number(-5)
+    assert stdout.getvalue() == "a12\n\nb-5"
+
+
+def test_unknown_flush_policy():
+    with pytest.raises(ValueError) as exc:
+        BasicOutputManager(flush_policy="never")
+    assert str(exc.value) == "Unknown flush policy"
+
+
+def test_binary(monkeypatch):
+    stdout = TextIOWrapper(BytesIO())
+    monkeypatch.setattr("sys.stdout", stdout)
+    s = Shakespeare("Foo. Juliet, a test. Romeo, a test.", output_style="binary")
+    s.run_event("[Enter Romeo and Juliet]")
+
+    for byte in [0, 97, 0xFF, 0xC3, 10, 0x80]:
+        s.state.character_by_name("Romeo").value = byte
+        s.run_sentence("Speak your mind!", "Juliet")
+    s.state.character_by_name("Romeo").value = 42
+    s.run_sentence("Open your heart!", "Juliet")
+
+    assert stdout.buffer.getvalue() == bytes([0, 97, 0xFF, 0xC3, 10, 0x80]) + b"42"
+
+    for value in [256, -1]:
+        s.state.character_by_name("Romeo").value = value
+        with pytest.raises(ShakespeareRuntimeError) as exc:
+            s.run_sentence("Speak your mind!", "Juliet")
+        assert "invalid byte value" in str(exc.value).lower()
+        assert ">>Speak your mind!<<" in str(exc.value)
+
+
+def test_binary_output_follows_text_output(monkeypatch):
+    stdout = TextIOWrapper(BytesIO())
+    monkeypatch.setattr("sys.stdout", stdout)
+
+    stdout.write("text ")
+    output_manager = BinaryOutputManager(flush_policy="line")
+    output_manager.output_character(98)
+    assert stdout.buffer.getvalue() == b""
+    output_manager.output_character(10)
+    assert stdout.buffer.getvalue() == b"text b\n"
+
+
+def test_output_is_flushed_when_output_style_changes(monkeypatch):
+    stdout = StringIO()
+    monkeypatch.setattr("sys.stdout", stdout)
+    s = Shakespeare("Foo. Juliet, a test. Romeo, a test.")
+    s.settings.output_manager.output_character(97)
+
+    s.settings.output_style = "verbose"
+    assert stdout.getvalue() == "a"
+
+
+def test_output_to_write_only_stream():
+    class WriteOnly:
+        def __init__(self):
+            self.written = []
+
+        def write(self, text):
+            self.written.append(text)
+
+    stdout = WriteOnly()
+    output_manager = BasicOutputManager(stdout=stdout)
+    assert output_manager.flush_policy == "full"
+    output_manager.output_character(97)
+    output_manager.output_character(10)
+    assert stdout.written == []
+    output_manager.flush()
+    assert stdout.written == ["a\n"]
+
+    stdout = WriteOnly()
+    Shakespeare(
+        "Foo. Juliet, a test. Romeo, a test. Act I: One. Scene I: One. "
+        "[Enter Romeo and Juliet] Juliet: Speak your mind!",
+        stdout=stdout,
+    ).run()
+    assert stdout.written == ["\x00"]
@@ -0,0 +1,151 @@
+from shakespearelang import Shakespeare
+from shakespearelang.errors import ShakespeareCompiledPlayError, ShakespeareRuntimeError
+import shakespearelang._serialize
+from .utils import create_play_file, expect_output_exactly, comparable_ast
+from io import StringIO
+from pathlib import Path
+import pexpect
+import pytest
+
+SAMPLE_PLAYS = Path(__file__).parent / "sample_plays"
+
+ERROR_PLAY = """
+Test.
+
+Juliet, a test.
+Romeo, a test.
+
+Act I: Nothing to see here.
+Scene I: These are not the actors you're looking for.
+
+[Enter Juliet and Romeo]
+
+Juliet: You are as good as the quotient between me and nothing.
+"""
+
+
+def test_compiled_play_runs_the_same(monkeypatch, capsys):
+    play = (SAMPLE_PLAYS / "primes.spl").read_text()
+    compiled = Shakespeare(play).compile_to_splc()
+
+    monkeypatch.setattr("sys.stdin", StringIO("20"))
+    Shakespeare.from_compiled(compiled).run()
+
+    captured = capsys.readouterr()
+    assert captured.out == ">2\n3\n5\n7\n11\n13\n17\n19\n"
+    assert captured.err == ""
+
+
+def test_compiled_play_has_same_ast(tmp_path):
+    play = (SAMPLE_PLAYS / "parse_everything.spl").read_text()
+    interpreter = Shakespeare(play)
+    compiled_path = tmp_path / "play.splc"
+    compiled_path.write_bytes(interpreter.compile_to_splc())
+
+    loaded = Shakespeare.from_compiled(compiled_path)
+
+    assert comparable_ast(loaded.play.ast) == comparable_ast(interpreter.play.ast)
+
+
+def test_runtime_errors_from_compiled_play():
+    with pytest.raises(ShakespeareRuntimeError) as parsed_exc:
+        Shakespeare(ERROR_PLAY).run()
+    compiled = Shakespeare(ERROR_PLAY).compile_to_splc()
+    with pytest.raises(ShakespeareRuntimeError) as compiled_exc:
+        Shakespeare.from_compiled(compiled).run()
+
+    assert str(compiled_exc.value) == str(parsed_exc.value)
+    assert ">>the quotient between me and nothing<<" in str(compiled_exc.value)
+
+
+def test_loading_compiled_play_does_not_import_parser(tmp_path):
+    compiled_path = tmp_path / "play.splc"
+    compiled_path.write_bytes(
+        Shakespeare((SAMPLE_PLAYS / "hi.spl").read_text()).compile_to_splc()
+    )
+    script = (
+        "import sys; from shakespearelang import Shakespeare; "
+        f"Shakespeare.from_compiled({str(compiled_path)!r}).run(); "
+        "print(sorted(m for m in sys.modules if 'tatsu' in m or 'lang._parser' in m))"
+    )
+
+    cli = pexpect.spawn("python", ["-c", script])
+    expect_output_exactly(cli, "HI\n[]\n", eof=True)
+
+
+@pytest.mark.parametrize(
+    "compiled",
+    [
+        b"",
+        b"SPLC",
+        b"SPLCnot marshal data",
+        b"SPLC\0cpython-3.10",
+        b"Foobar. Juliet, a test.",
+    ],
+)
+def test_invalid_compiled_play(compiled):
+    with pytest.raises(ShakespeareCompiledPlayError):
+        Shakespeare.from_compiled(compiled)
+
+
+def test_empty_compiled_play_file(tmp_path):
+    compiled_path = tmp_path / "play.splc"
+    compiled_path.write_bytes(b"")
+
+    with pytest.raises(ShakespeareCompiledPlayError) as exc:
+        Shakespeare.from_compiled(compiled_path)
+    assert str(exc.value) == "SPL compiled play error: Not a compiled play"
+
+
+def test_compiled_play_from_other_version(monkeypatch):
+    monkeypatch.setattr(shakespearelang._serialize, "grammar_version", lambda: "old")
+    compiled = Shakespeare((SAMPLE_PLAYS / "hi.spl").read_text()).compile_to_splc()
+    monkeypatch.undo()
+
+    with pytest.raises(ShakespeareCompiledPlayError) as exc:
+        Shakespeare.from_compiled(compiled)
+    assert str(exc.value) == (
+        "SPL compiled play error: Compiled by an incompatible version of "
+        "shakespearelang, compile the play again"
+    )
+
+
+def test_compiled_play_from_other_python_version(monkeypatch):
+    monkeypatch.setattr(shakespearelang._serialize, "_HEADER", b"SPLC\0cpython-2.7\0")
+    compiled = Shakespeare((SAMPLE_PLAYS / "hi.spl").read_text()).compile_to_splc()
+    monkeypatch.undo()
+
+    with pytest.raises(ShakespeareCompiledPlayError) as exc:
+        Shakespeare.from_compiled(compiled)
+    assert str(exc.value) == (
+        "SPL compiled play error: Compiled with Python cpython-2.7, not "
+        f"{shakespearelang._serialize.PYTHON_VERSION}, compile the play again "
+        "with this version of Python"
+    )
+
+
+def test_compiled_play_from_older_format():
+    compiled = Shakespeare((SAMPLE_PLAYS / "hi.spl").read_text()).compile_to_splc()
+    older = b"SPLC" + compiled[len(shakespearelang._serialize._HEADER) :]
+
+    with pytest.raises(ShakespeareCompiledPlayError) as exc:
+        Shakespeare.from_compiled(older)
+    assert str(exc.value) == (
+        "SPL compiled play error: Compiled by an incompatible version of "
+        "shakespearelang, compile the play again"
+    )
+
+
+def test_cli_compile_and_run(tmp_path):
+    play_path = tmp_path / "play.spl"
+    compiled_path = tmp_path / "other.splc"
+    create_play_file(play_path, (SAMPLE_PLAYS / "hi.spl").read_text())
+
+    cli = pexpect.spawn(f"shakespeare compile {play_path} -o {compiled_path}")
+    expect_output_exactly(cli, "", eof=True)
+    cli = pexpect.spawn(f"shakespeare run {compiled_path}")
+    expect_output_exactly(cli, "HI\n", eof=True)
+
+    cli = pexpect.spawn(f"shakespeare compile {play_path}")
+    expect_output_exactly(cli, "", eof=True)
+    assert (tmp_path / "play.splc").read_bytes() == compiled_path.read_bytes()
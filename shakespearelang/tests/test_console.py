@@ -274,6 +274,50 @@ def test_expression():
     expect_output_exactly(cli, "", eof=True)
 
 
+def test_untaken_goto_to_missing_scene():
+    cli = pexpect.spawn("shakespeare")
+    cli.setecho(False)
+    cli.waitnoecho()
+
+    expect_output_exactly(cli, STANDARD_REPL_BEGINNING)
+    expect_interaction(
+        cli,
+        "Juliet: If so, let us proceed to scene IV.",
+        "Not jumping to Scene IV because global boolean is False",
+    )
+    expect_interaction(cli, "exit", "", prompt=False)
+    expect_output_exactly(cli, "", eof=True)
+
+
+def test_goto_to_missing_scene_off_stage():
+    cli = pexpect.spawn("shakespeare")
+    cli.setecho(False)
+    cli.waitnoecho()
+
+    expect_output_exactly(cli, STANDARD_REPL_BEGINNING)
+    expect_interaction(cli, "[Exit Romeo]", "Exit Romeo")
+    expect_interaction(
+        cli,
+        "Romeo: Let us proceed to scene IV.",
+        dedent(
+            """\
+            SPL runtime error: Romeo is not on stage!
+              at line 1
+            ----- context -----
+            Romeo: >>Let us proceed to scene IV.<<
+
+            ----- state -----
+            global boolean = False
+            on stage:
+              Juliet = 0 ()
+            off stage:
+              Romeo = 0 ()"""
+        ),
+    )
+    expect_interaction(cli, "exit", "", prompt=False)
+    expect_output_exactly(cli, "", eof=True)
+
+
 def test_display_character():
     cli = pexpect.spawn("shakespeare")
     cli.setecho(False)
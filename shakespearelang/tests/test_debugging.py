@@ -1,3 +1,4 @@
+from shakespearelang import Shakespeare
 from tatsu.exceptions import FailedParse
 from io import StringIO
 import pytest
@@ -1339,3 +1340,34 @@ def test_exit_loop_by_boolean_state(tmp_path):
     )
     expect_interaction(cli, "next", "Exeunt all", prompt=False)
     expect_output_exactly(cli, "", eof=True)
+
+
+def test_breakpoints_do_nothing_without_callback(capsys):
+    s = Shakespeare(BREAKPOINT)
+    s.run()
+    assert s.play_over()
+
+    captured = capsys.readouterr()
+    assert captured.out == "HI\n"
+    assert captured.err == ""
+
+
+def test_breakpoint_callback_can_step(capsys):
+    s = Shakespeare(BREAKPOINT)
+    positions = []
+
+    def on_breakpoint():
+        positions.append(s.current_position)
+        assert capsys.readouterr().out == "H"
+        assert "Thou art the sum of thyself and a King" in s.next_operation_text()
+        s.step_forward()
+        s.step_forward()
+        assert capsys.readouterr().out == "I"
+
+    s.run(on_breakpoint)
+    assert positions == [4]
+    assert s.play_over()
+
+    captured = capsys.readouterr()
+    assert captured.out == "\n"
+    assert captured.err == ""
@@ -274,6 +274,70 @@ def test_errors_on_partial_exeunt_before_entrance():
     assert_off_stage(s, ["The Ghost", "Demetrius"])
 
 
+STAGE_PLAY = """
+    Test.
+
+    Romeo, a test.
+    Juliet, a test.
+    Macbeth, a test.
+
+    Act I: Nothing to see here.
+    Scene I: A meeting.
+
+    [Enter Romeo and Juliet]
+
+    Juliet: You are a cat. Are you as good as nothing?
+
+    Juliet: If not, let us proceed to scene II.
+
+    [Enter Macbeth]
+
+    Scene II: Somebody may be missing.
+
+    Juliet: You are a pig.
+
+    [Exeunt]
+
+    Juliet: You are nothing.
+"""
+
+
+def test_stage_known_before_each_operation():
+    s = Shakespeare(STAGE_PLAY)
+    romeo_and_juliet = 0b011
+    assert s.play.stages == [
+        0,
+        romeo_and_juliet,
+        romeo_and_juliet,
+        romeo_and_juliet,
+        romeo_and_juliet,
+        None,
+        None,
+        0,
+    ]
+
+
+def test_stage_changed_from_outside_is_still_checked():
+    s = Shakespeare(STAGE_PLAY)
+    s.step_forward()
+    s.run_event("[Enter Macbeth]")
+
+    with pytest.raises(ShakespeareRuntimeError) as exc:
+        s.step_forward()
+    assert "ambiguous" in str(exc.value).lower()
+    assert ">>You are a cat.<<" in str(exc.value)
+
+    s.run_event("[Exeunt Romeo and Macbeth]")
+    with pytest.raises(ShakespeareRuntimeError) as exc:
+        s.step_forward()
+    assert "talking to nobody" in str(exc.value).lower()
+
+    s.run_event("[Exit Juliet]")
+    with pytest.raises(ShakespeareRuntimeError) as exc:
+        s.step_forward()
+    assert "juliet is not on stage" in str(exc.value).lower()
+
+
 def assert_on_stage(s, l):
     assert sorted([c for c in s.state._characters_on_stage]) == sorted(l)
 
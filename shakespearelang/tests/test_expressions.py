@@ -641,3 +641,90 @@ def test_complex_expressions():
                     my chihuahua
     """
     assert s.evaluate_expression(second_expression, "Juliet") == 7
+
+
+def test_constant_subtrees_are_folded():
+    s = Shakespeare(
+        """
+        Foo. Juliet, a test. Romeo, a test.
+        Act I: One. Scene I: One.
+        [Enter Romeo and Juliet]
+        Juliet: You are the sum of the square of a big cat and twice nothing.
+        Juliet: You are the sum of yourself and the difference between a cat and a cat.
+        Juliet: You are the product of a cat and the sum of yourself and a big cat.
+        """
+    )
+    folded, partly_folded, simplified = [
+        operation.value for operation in s.play.operations[1:]
+    ]
+    assert folded.constant
+    assert folded.constant_value == 4
+    assert type(partly_folded).__name__ == "SecondPersonValue"
+    assert type(simplified).__name__ == "BinaryOperation"
+    assert type(simplified.first_operand).__name__ == "SecondPersonValue"
+
+    s.run()
+    assert s.state.character_by_name("Romeo").value == 6
+
+
+def test_constant_folding_keeps_runtime_errors():
+    s = Shakespeare("Foo. Juliet, a test. Romeo, a test.")
+    s.run_event("[Enter Romeo and Juliet]")
+
+    with pytest.raises(ShakespeareRuntimeError) as exc:
+        s.evaluate_expression(
+            "the sum of a cat and the quotient between a cat and nothing", "Juliet"
+        )
+    assert "zero" in str(exc.value).lower()
+    assert ">>the quotient between a cat and nothing<<" in str(exc.value)
+
+    with pytest.raises(ShakespeareRuntimeError) as exc:
+        s.evaluate_expression("the square root of twice the Microsoft", "Juliet")
+    assert "negative" in str(exc.value).lower()
+    assert ">>the square root of twice the Microsoft<<" in str(exc.value)
+
+    s.run_event("[Exit Romeo]")
+    with pytest.raises(ShakespeareRuntimeError) as exc:
+        s.evaluate_expression(
+            "the product of a cat and the sum of you and nothing", "Juliet"
+        )
+    assert "talking to nobody" in str(exc.value).lower()
+    assert ">>you<<" in str(exc.value)
+
+
+def test_unevaluated_constant_errors_do_not_stop_loading():
+    s = Shakespeare(
+        """
+        Foo. Juliet, a test. Romeo, a test.
+        Act I: One. Scene I: One.
+        [Enter Romeo and Juliet]
+        Juliet: Am I better than you?
+        Juliet: If so, you are the quotient between a cat and nothing.
+        """
+    )
+    s.run()
+    assert s.state.character_by_name("Romeo").value == 0
+
+
+def test_overflowing_constants_do_not_stop_loading():
+    huge = "the cube of " * 5 + "a big big big big big big big big big big cat"
+    s = Shakespeare(
+        f"""
+        Foo. Juliet, a test. Romeo, a test.
+        Act I: One. Scene I: One.
+        [Enter Romeo and Juliet]
+        Juliet: Am I better than you?
+        Juliet: If so, you are the square root of {huge}.
+        Juliet: If so, you are the quotient between {huge} and a big cat.
+        Juliet: You are {"the cube of " * 12}a big cat.
+        """
+    )
+    square_root, quotient, unbounded = [
+        operation.value for operation in s.play.operations[2:]
+    ]
+    assert not square_root.constant
+    assert not quotient.constant
+    assert not unbounded.constant
+
+    s.run()
+    assert s.state.character_by_name("Romeo").value == pow(2, pow(3, 12))
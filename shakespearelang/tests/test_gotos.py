@@ -190,6 +190,82 @@ def test_errors_on_goto_nonexistent(capsys):
     assert captured.err == ""
 
 
+def test_goto_nonexistent_is_checked_like_other_sentences(capsys):
+    s = Shakespeare(SAMPLE_PLAY)
+    s.step_forward()
+
+    s.run_sentence("If so, let us proceed to scene IV.", "Juliet")
+    assert s.current_position == 1
+
+    with pytest.raises(ShakespeareRuntimeError) as exc:
+        s.run_sentence("Let us proceed to scene IV.", "Macbeth")
+    assert "macbeth is not on stage" in str(exc.value).lower()
+    assert s.current_position == 1
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == ""
+
+
+def test_errors_on_goto_nonexistent_at_load_time(capsys):
+    with pytest.raises(ShakespeareRuntimeError) as exc:
+        s = Shakespeare(
+            """
+            Test.
+
+            Romeo, a test.
+            Juliet, a test.
+
+            Act I: Nothing to see here.
+            Scene I: Nowhere to go.
+
+            [Enter Romeo and Juliet]
+
+            Juliet: Are you as good as nothing? If not, let us proceed to scene II.
+
+            Act II: Somewhere else.
+            Scene II: Not reachable from act I.
+
+            [A pause]
+        """
+        )
+    assert "scene ii does not exist" in str(exc.value).lower()
+    assert ">>If not, let us proceed to scene II.<<" in str(exc.value)
+    assert exc.value.interpreter == None
+
+
+def test_goto_resolves_forward_within_act(capsys):
+    s = Shakespeare(
+        """
+        Test.
+
+        Romeo, a test.
+        Juliet, a test.
+
+        Act I: Nothing to see here.
+        Scene I: Skipping ahead.
+
+        [Enter Romeo and Juliet]
+
+        Juliet: Let us proceed to scene III.
+
+        Scene II: Skipped.
+
+        Juliet: Open your heart!
+
+        Scene III: The end.
+
+        [Exeunt]
+    """
+    )
+    s.run()
+    assert s.current_position == 4
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == ""
+
+
 def test_duplicate_scene_numbers(capsys):
     with pytest.raises(ShakespeareRuntimeError) as exc:
         s = Shakespeare(
@@ -250,3 +326,68 @@ def test_duplicate_act_numbers(capsys):
     assert "is not unique" in str(exc.value).lower()
     assert "Act >>I<<: Nothing strikes back." in str(exc.value)
     assert exc.value.interpreter == None
+
+
+LOOP_PLAY = """
+    Test.
+
+    Romeo, a test.
+    Juliet, a test.
+
+    Act I: Counting.
+    Scene I: Setup.
+
+    [Enter Romeo and Juliet]
+
+    Scene II: Loop.
+
+    Juliet: You are the sum of yourself and a cat. Open your heart!
+    Juliet: Are you worse than a big big cat? If so, let us return to scene II.
+    Juliet: You are as bad as nothing. Open your heart!
+"""
+
+
+def test_fused_operations_run_the_same(capsys):
+    s = Shakespeare(LOOP_PLAY)
+    s.run()
+    assert s.state.character_by_name("Romeo").value == 0
+    assert s.current_position == len(s.play.operations)
+
+    captured = capsys.readouterr()
+    assert captured.out == "12340"
+    assert captured.err == ""
+
+
+def test_stepping_visits_fused_operations_one_by_one(capsys):
+    s = Shakespeare(LOOP_PLAY)
+    s.step_forward()
+    positions = []
+    while not s.play_over() and len(positions) < 7:
+        positions.append(s.current_position)
+        assert s.next_operation_text().count(">>") == 1
+        s.step_forward()
+    assert positions == [1, 2, 3, 4, 1, 2, 3]
+    assert ">>If so, let us return to scene II.<<" in s.next_operation_text()
+
+    captured = capsys.readouterr()
+    assert captured.out == "12"
+    assert captured.err == ""
+
+
+def test_error_in_fused_operation_stops_at_failing_sentence(capsys):
+    s = Shakespeare(
+        LOOP_PLAY.replace(
+            "as bad as nothing. Open your heart!",
+            "as bad as Microsoft. Speak your mind!",
+        )
+    )
+    with pytest.raises(ShakespeareRuntimeError) as exc:
+        s.run()
+    assert "invalid character code" in str(exc.value).lower()
+    assert ">>Speak your mind!<<" in str(exc.value)
+    assert exc.value.interpreter == s
+    assert s.current_position == 6
+
+    captured = capsys.readouterr()
+    assert captured.out == "1234"
+    assert captured.err == ""
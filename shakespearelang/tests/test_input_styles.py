@@ -84,3 +84,25 @@ def test_interactive_input_character(tmp_path):
     expect_output_exactly(cli, "10Taking input character: ")
     cli.sendline("c")
     expect_output_exactly(cli, "99", eof=True)
+
+def test_input_file_character(tmp_path):
+    file_path = tmp_path / "play.spl"
+    create_play_file(file_path, CHARACTER_INPUT)
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("c\n")
+    cli = pexpect.spawn(f"shakespeare run {file_path} --input-file={input_path}")
+    cli.setecho(False)
+    cli.waitnoecho()
+
+    expect_output_exactly(cli, "9910", eof=True)
+
+def test_input_file_binary(tmp_path):
+    file_path = tmp_path / "play.spl"
+    create_play_file(file_path, CHARACTER_INPUT)
+    input_path = tmp_path / "input.bin"
+    input_path.write_bytes(b"\xff\x00")
+    cli = pexpect.spawn(f"shakespeare run {file_path} --input-style=binary --input-file={input_path}")
+    cli.setecho(False)
+    cli.waitnoecho()
+
+    expect_output_exactly(cli, "2550", eof=True)
@@ -0,0 +1,158 @@
+from shakespearelang import Shakespeare
+from shakespearelang._fast_parser import FastParser
+from shakespearelang._lazy import LazyPlay
+from shakespearelang.errors import ShakespeareParseError, ShakespeareRuntimeError
+from .utils import create_play_file, expect_output_exactly
+from io import StringIO
+from pathlib import Path
+import pexpect
+import pytest
+
+SAMPLE_PLAYS = sorted((Path(__file__).parent / "sample_plays").glob("*.spl"))
+SAMPLE_INPUTS = {
+    "echo.spl": "m123cfoobar123",
+    "primes.spl": "20",
+    "reverse.spl": "first\nsecond\nthird",
+    "sierpinski.spl": "4",
+    "parse_everything.spl": "45c",
+}
+
+BROKEN_SECOND_SCENE = """\
+Foobar. Juliet, a test. Romeo, a test.
+
+Act I: An act.
+
+Scene I: A scene.
+
+[Enter Juliet and Romeo]
+
+Juliet: Thou art a cat. Speak your mind! Let us proceed to scene III.
+
+Scene II: Broken.
+
+Juliet: You are a pig and a cow.
+
+Scene III: Recall act I: it looks like a heading!
+
+Romeo: Remember me. Recall scene II: so does this! Speak your mind!
+
+Act II: Another act.
+
+Scene I: The end.
+
+Juliet: Speak your mind!
+"""
+
+
+@pytest.mark.parametrize("path", SAMPLE_PLAYS, ids=lambda path: path.name)
+@pytest.mark.parametrize("output_style", ["basic", "verbose", "debug"])
+def test_lazy_play_runs_like_sample_play(path, output_style, monkeypatch, capsys):
+    play = path.read_text()
+    outputs = []
+    for lazy in [False, True]:
+        monkeypatch.setattr("sys.stdin", StringIO(SAMPLE_INPUTS.get(path.name, "")))
+        interpreter = Shakespeare(play, output_style=output_style, lazy=lazy)
+        interpreter.run()
+        outputs.append(capsys.readouterr().out)
+
+    assert isinstance(interpreter.play, LazyPlay)
+    assert outputs[1] == outputs[0]
+
+
+def test_scenes_are_parsed_when_reached(monkeypatch, capsys):
+    parsed = []
+    parse_scene = FastParser.parse_scene
+
+    def record(self, buffer, start, end):
+        parsed.append(buffer.posline(start))
+        return parse_scene(self, buffer, start, end)
+
+    monkeypatch.setattr(FastParser, "parse_scene", record)
+    play = BROKEN_SECOND_SCENE.replace("a pig and a cow", "a pig")
+    interpreter = Shakespeare(play, lazy=True)
+    assert parsed == []
+
+    interpreter.run()
+
+    assert capsys.readouterr().out == "\x01\x01\x01"
+    assert parsed == [4, 14, 20]
+
+
+def test_unreached_scene_parse_errors_are_not_reported(capsys):
+    Shakespeare(BROKEN_SECOND_SCENE, lazy=True).run()
+
+    assert capsys.readouterr().out == "\x01\x01\x01"
+
+
+def test_parse_all_scenes_reports_parse_errors():
+    interpreter = Shakespeare(BROKEN_SECOND_SCENE, lazy=True)
+
+    with pytest.raises(ShakespeareParseError) as lazy_exc:
+        interpreter.parse_all_scenes()
+    with pytest.raises(ShakespeareParseError) as eager_exc:
+        Shakespeare(BROKEN_SECOND_SCENE)
+    assert str(lazy_exc.value) == str(eager_exc.value)
+
+
+def test_reached_scene_parse_errors_are_reported(capsys):
+    play = BROKEN_SECOND_SCENE.replace("Let us proceed to scene III.", "")
+    interpreter = Shakespeare(play, lazy=True)
+
+    with pytest.raises(ShakespeareParseError) as lazy_exc:
+        interpreter.run()
+    with pytest.raises(ShakespeareParseError) as eager_exc:
+        Shakespeare(play)
+    assert str(lazy_exc.value) == str(eager_exc.value)
+    assert capsys.readouterr().out == "\x01"
+
+
+def test_goto_to_missing_scene_is_reported_when_reached():
+    play = BROKEN_SECOND_SCENE.replace(
+        "Scene I: A scene.", "Scene I: A scene.\n\nJuliet: Let us return to scene V."
+    )
+    interpreter = Shakespeare(play, lazy=True)
+
+    with pytest.raises(ShakespeareRuntimeError) as exc:
+        interpreter.run()
+    assert "Scene V does not exist." in str(exc.value)
+
+
+def test_stepping_through_lazy_play(capsys):
+    interpreter = Shakespeare(BROKEN_SECOND_SCENE, lazy=True)
+    assert "Scene I: A scene." in interpreter.next_operation_text()
+
+    while not interpreter.play_over():
+        interpreter.step_forward()
+
+    assert capsys.readouterr().out == "\x01\x01\x01"
+
+
+def test_compiling_lazy_play_parses_it_in_full():
+    interpreter = Shakespeare(BROKEN_SECOND_SCENE, lazy=True)
+
+    with pytest.raises(ShakespeareParseError):
+        interpreter.compile_to_splc()
+
+
+@pytest.mark.parametrize(
+    "play",
+    [
+        "Foobar. Juliet, a test.\n\nAct I: An act.\n\nScene IVX: Not a numeral.",
+        "Foobar. Juliet, a test.\n\nAct I: An act.\n\n[Enter Juliet]",
+        "Foobar. Juliet, a test.\n\nScene I: No act.",
+    ],
+)
+def test_plays_without_outline_are_parsed_in_full(play):
+    with pytest.raises(ShakespeareParseError) as lazy_exc:
+        Shakespeare(play, lazy=True)
+    with pytest.raises(ShakespeareParseError) as eager_exc:
+        Shakespeare(play)
+    assert str(lazy_exc.value) == str(eager_exc.value)
+
+
+def test_cli_lazy(tmp_path):
+    file_path = tmp_path / "play.spl"
+    create_play_file(file_path, BROKEN_SECOND_SCENE)
+
+    cli = pexpect.spawn(f"shakespeare run --lazy {file_path}")
+    expect_output_exactly(cli, "\x01\x01\x01", eof=True)
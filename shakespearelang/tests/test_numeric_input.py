@@ -1,6 +1,6 @@
 from shakespearelang import Shakespeare
 from shakespearelang.errors import ShakespeareRuntimeError
-from io import StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 import pytest
 
 
@@ -116,3 +116,42 @@ def test_interactive_style(monkeypatch, capsys):
     captured = capsys.readouterr()
     assert captured.out == "Taking input number: "
     assert captured.err == ""
+
+
+def test_numbers_split_across_reads(monkeypatch, capsys):
+    # Lines longer than this are read in parts.
+    monkeypatch.setattr("shakespearelang._input._READ_SIZE", 3)
+    monkeypatch.setattr("sys.stdin", StringIO("4257\n12345678a\n999\nrest"))
+    s = Shakespeare("Foo. Juliet, a test. Romeo, a test.")
+    s.run_event("[Enter Romeo and Juliet]")
+
+    s.run_sentence("Listen to your heart!", "Juliet")
+    assert s.state.character_by_name("Romeo").value == 4257
+    s.run_sentence("Listen to your heart!", "Juliet")
+    assert s.state.character_by_name("Romeo").value == 12345678
+    s.run_sentence("Open your mind!", "Juliet")
+    assert s.state.character_by_name("Romeo").value == 97
+    s.run_sentence("Open your mind!", "Juliet")
+    assert s.state.character_by_name("Romeo").value == 10
+    s.run_sentence("Listen to your heart!", "Juliet")
+    assert s.state.character_by_name("Romeo").value == 999
+    assert input() == "rest"
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == ""
+
+
+def test_binary(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", TextIOWrapper(BytesIO(b"4257\n12\xff")))
+    s = Shakespeare("Foo. Juliet, a test. Romeo, a test.", input_style="binary")
+    s.run_event("[Enter Romeo and Juliet]")
+    s.run_sentence("Listen to your heart!", "Juliet")
+    assert s.state.character_by_name("Romeo").value == 4257
+    s.run_sentence("Listen to your heart!", "Juliet")
+    assert s.state.character_by_name("Romeo").value == 12
+    s.run_sentence("Open your mind!", "Juliet")
+    assert s.state.character_by_name("Romeo").value == 0xFF
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == ""
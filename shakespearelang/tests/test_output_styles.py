@@ -1,4 +1,5 @@
 import pexpect
+from shakespearelang import Shakespeare
 from .utils import expect_output_exactly, create_play_file
 from textwrap import dedent
 
@@ -581,3 +582,28 @@ def test_output_debug(tmp_path):
         ),
         eof=True
     )
+
+
+def test_output_style_changed_at_breakpoint(capsys):
+    s = Shakespeare(LOOP, output_style="basic")
+
+    def on_breakpoint():
+        s.settings.output_style = "verbose"
+
+    s.run(on_breakpoint)
+    captured = capsys.readouterr()
+    assert captured.out.startswith(
+        "Enter Hamlet, Juliet\nHamlet set to 1\nOutputting Hamlet\n"
+    )
+    assert "Jumping to Scene II" in captured.out
+    assert captured.err == ""
+
+    s = Shakespeare(LOOP, output_style="debug")
+
+    def on_breakpoint():
+        s.settings.output_style = "basic"
+
+    s.run(on_breakpoint)
+    captured = capsys.readouterr()
+    assert captured.out == "1234"
+    assert captured.err == ""
@@ -0,0 +1,79 @@
+from shakespearelang import profile_parse, ShakespeareParseError
+from .utils import expect_output_exactly
+from pathlib import Path
+import json
+import pexpect
+import pytest
+
+SAMPLE_PLAYS = Path(__file__).parent / "sample_plays"
+
+
+def test_profile_counts_rules():
+    profile = profile_parse((SAMPLE_PLAYS / "primes.spl").read_text())
+
+    play = profile.rules["play"]
+    assert (play.calls, play.successes, play.failures) == (1, 1, 0)
+    assert profile.rules["scene"].successes == 6
+    assert sum(rule.memo_hits for rule in profile.rules.values()) > 0
+    for rule in profile.rules.values():
+        assert rule.calls == rule.successes + rule.failures
+        assert rule.memo_hits <= rule.calls
+        assert 0 <= rule.time <= profile.time
+
+
+def test_profile_of_other_rule():
+    profile = profile_parse("twice the sum of a cat and nothing", rule_name="value")
+
+    assert profile.rules["value"].successes == 4
+    assert "play" not in profile.rules
+
+
+def test_profile_parse_error():
+    with pytest.raises(ShakespeareParseError) as exc:
+        profile_parse("Foobar. Juliet, a test.\n\nAct I: An act.\n\nScene IVX: No.")
+    assert "at line 5" in str(exc.value)
+
+
+def test_profile_table():
+    table = profile_parse((SAMPLE_PLAYS / "hi.spl").read_text()).format_table()
+
+    lines = table.splitlines()
+    assert lines[0].split() == [
+        "rule",
+        "calls",
+        "successes",
+        "failures",
+        "memo",
+        "hits",
+        "time",
+        "(ms)",
+    ]
+    assert lines[1].split()[:4] == ["play", "1", "1", "0"]
+    assert lines[-1].startswith("total time: ")
+
+
+def test_cli_parse_profile_json():
+    path = SAMPLE_PLAYS / "hi.spl"
+    output = pexpect.run(f"shakespeare parse-profile --format json {path}")
+
+    profile = json.loads(output)
+    assert profile["rules"]["play"] == {
+        "calls": 1,
+        "successes": 1,
+        "failures": 0,
+        "memo_hits": 0,
+        "time": profile["rules"]["play"]["time"],
+    }
+    assert profile["time"] >= profile["rules"]["play"]["time"]
+
+
+def test_cli_parse_profile_table():
+    cli = pexpect.spawn(f"shakespeare parse-profile {SAMPLE_PLAYS / 'hi.spl'}")
+    cli.expect("total time: ")
+    cli.expect(pexpect.EOF)
+
+
+def test_profile_deeply_nested_play():
+    profile = profile_parse((SAMPLE_PLAYS / "parse_everything.spl").read_text())
+
+    assert profile.rules["play"].successes == 1
@@ -0,0 +1,134 @@
+from shakespearelang import Shakespeare
+from shakespearelang.errors import ShakespeareParseError
+from shakespearelang._fast_parser import FastParser
+from shakespearelang._bounded_parser import BoundedMemoParser, UNMEMOIZED_RULES
+from shakespearelang._parser import shakespeareParser
+import shakespearelang._fast_parser
+from .utils import comparable_ast, expect_output_exactly
+from pathlib import Path
+import pexpect
+import pytest
+
+SAMPLE_PLAYS = sorted((Path(__file__).parent / "sample_plays").glob("*.spl"))
+
+UNUSUAL_PLAY = """\
+An unusual play!
+LADY MACBETH,a test.   The Ghost  ,a test!
+
+Act   II:Strange spacing.Scene I:Nothing much!
+[Enter Lady   Macbeth and
+   the ghost]
+Lady Macbeth:If so,let us return to scene II! You are as  fat-kidneyed as a
+  stone wall.Remember the sum of nothing and thyself.
+  If not ,art thou more good than my summer's day?[A pause]
+Scene II:.
+[Exeunt]
+The Ghost: Recall   your past! Speak thy mind.  Open thine heart! Listen to your heart.
+Open your mind!  Are you worse than twice the square root of zero?
+[Exit The Ghost]
+
+   """
+
+BROKEN_PLAYS = [
+    "",
+    "Foobar",
+    "Foobar. Juliet, a test.\n\nAct I: An act.\n\nScene IVX: Not a numeral.",
+    "Foobar. Juliet, a test.\n\nAct I: An act.\n\nScene I: A scene.\n\n"
+    "[Enter Juliet and]",
+    "Foobar. Juliet, a test. Romeo, a test.\n\nAct I: An act.\n\nScene I: A scene."
+    "\n\n[Enter Juliet and Romeo]\n\nJuliet: You are a pig and a cow.",
+]
+
+
+def test_fast_parser_matches_tatsu_on_sample_plays():
+    for path in SAMPLE_PLAYS:
+        assert_same_ast(path.read_text())
+
+
+def test_fast_parser_matches_tatsu_on_unusual_formatting():
+    assert FastParser().parse(UNUSUAL_PLAY) is not None
+    assert_same_ast(UNUSUAL_PLAY)
+
+
+@pytest.mark.parametrize("play", BROKEN_PLAYS)
+def test_parse_errors_are_unchanged(play):
+    assert FastParser().parse(play) is None
+    with pytest.raises(ShakespeareParseError) as fast_exc:
+        Shakespeare(play)
+    with pytest.raises(ShakespeareParseError) as tatsu_exc:
+        Shakespeare(play, parser="tatsu")
+    assert str(fast_exc.value) == str(tatsu_exc.value)
+
+
+def test_parallel_parse_matches_serial_parse(monkeypatch):
+    # Small enough that the sample plays are split into several chunks.
+    monkeypatch.setattr(shakespearelang._fast_parser, "_MIN_CHUNK_SIZE", 100)
+    for play in [path.read_text() for path in SAMPLE_PLAYS] + [UNUSUAL_PLAY]:
+        serial_ast = Shakespeare(play).parse(play, "play")
+        parallel_ast = Shakespeare(play, jobs=3).parse(play, "play")
+        assert comparable_ast(parallel_ast) == comparable_ast(serial_ast)
+
+
+@pytest.mark.parametrize("play", BROKEN_PLAYS)
+def test_parallel_parse_errors_are_unchanged(play, monkeypatch):
+    monkeypatch.setattr(shakespearelang._fast_parser, "_MIN_CHUNK_SIZE", 10)
+    with pytest.raises(ShakespeareParseError) as serial_exc:
+        Shakespeare(play)
+    with pytest.raises(ShakespeareParseError) as parallel_exc:
+        Shakespeare(play, jobs=2)
+    assert str(parallel_exc.value) == str(serial_exc.value)
+
+
+def test_bounded_memo_parser_matches_tatsu():
+    for name in ["hello_world.spl", "primes.spl"]:
+        play = (SAMPLE_PLAYS[0].parent / name).read_text()
+        bounded_ast = BoundedMemoParser().parse(play, rule_name="play")
+        tatsu_ast = shakespeareParser().parse(play, rule_name="play")
+        assert comparable_ast(bounded_ast) == comparable_ast(tatsu_ast)
+
+
+def test_bounded_memo_parser_forgets_parsed_scenes():
+    memos = []
+
+    class RecordingParser(BoundedMemoParser):
+        def _forget_before(self, pos):
+            super()._forget_before(pos)
+            memos.append((pos, list(self._memos)))
+
+    play = (SAMPLE_PLAYS[0].parent / "primes.spl").read_text()
+    ast = RecordingParser().parse(play, rule_name="play")
+
+    assert len(memos) == sum(len(act.scenes) for act in ast.acts)
+    for pos, keys in memos:
+        assert all(key.pos >= pos for key in keys)
+        assert not any(key.rule.name in UNMEMOIZED_RULES for key in keys)
+
+
+def test_running_a_play_does_not_import_tatsu():
+    hi = next(path for path in SAMPLE_PLAYS if path.name == "hi.spl")
+    script = (
+        "import sys; from shakespearelang import Shakespeare; "
+        f"Shakespeare(open({str(hi)!r}).read()).run(); "
+        "print(sorted(m for m in sys.modules if 'tatsu' in m or 'click' in m))"
+    )
+
+    cli = pexpect.spawn("python", ["-c", script])
+    expect_output_exactly(cli, "HI\n[]\n", eof=True)
+
+
+def test_unknown_parser():
+    with pytest.raises(ValueError) as exc:
+        Shakespeare("Foo. Juliet, a test.", parser="foo")
+    assert str(exc.value) == "Unknown parser"
+
+
+def test_invalid_jobs():
+    with pytest.raises(ValueError) as exc:
+        Shakespeare("Foo. Juliet, a test.", jobs=0)
+    assert str(exc.value) == "jobs must be at least 1"
+
+
+def assert_same_ast(play):
+    fast_ast = Shakespeare(play).parse(play, "play")
+    tatsu_ast = Shakespeare(play, parser="tatsu").parse(play, "play")
+    assert comparable_ast(fast_ast) == comparable_ast(tatsu_ast)
@@ -0,0 +1,93 @@
+from shakespearelang import Shakespeare
+from shakespearelang.errors import ShakespeareRuntimeError
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
+from pathlib import Path
+import pytest
+
+ECHO_PLAY = """
+Foo. Juliet, a test. Romeo, a test.
+
+Act I: One. Scene I: One.
+
+[Enter Romeo and Juliet]
+
+Juliet: Listen to your heart! Open your heart! Open your mind! Speak your mind!
+"""
+
+
+def test_reads_and_writes_given_streams(capsys):
+    stdout = StringIO()
+    Shakespeare(ECHO_PLAY, stdin=StringIO("42\nab"), stdout=stdout).run()
+
+    assert stdout.getvalue() == "42a"
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == ""
+
+
+def test_binary_streams(capsys):
+    stdout = BytesIO()
+    Shakespeare(
+        ECHO_PLAY,
+        input_style="binary",
+        output_style="binary",
+        stdin=BytesIO(b"42\n\xff"),
+        stdout=stdout,
+    ).run()
+
+    assert stdout.getvalue() == b"42\xff"
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == ""
+
+
+def test_interactive_input_streams(capsys):
+    stdout = StringIO()
+    Shakespeare(
+        ECHO_PLAY, input_style="interactive", stdin=StringIO("42\nab\n"), stdout=stdout
+    ).run()
+
+    assert stdout.getvalue() == "Taking input number: 42Taking input character: a"
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == ""
+
+
+def test_debug_output_stream(capsys):
+    stdout = StringIO()
+    Shakespeare(
+        ECHO_PLAY, output_style="debug", stdin=StringIO("42\nab"), stdout=stdout
+    ).run()
+
+    assert "at line 5" in stdout.getvalue()
+    assert "Outputting number: 42" in stdout.getvalue()
+    assert "Outputting character: 'a'" in stdout.getvalue()
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == ""
+
+
+def test_end_of_given_input():
+    stdout = StringIO()
+    with pytest.raises(ShakespeareRuntimeError) as exc:
+        Shakespeare(ECHO_PLAY, stdin=StringIO(""), stdout=stdout).run()
+    assert "end of file" in str(exc.value).lower()
+
+
+def test_plays_run_on_threads_at_once():
+    path = Path(__file__).parent / "sample_plays/reverse.spl"
+    play = path.read_text()
+
+    def run(text):
+        stdout = StringIO()
+        Shakespeare(play, stdin=StringIO(text), stdout=stdout).run()
+        return stdout.getvalue()
+
+    texts = [f"line {i}\nof thread {i}" for i in range(16)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        outputs = list(executor.map(run, texts))
+
+    assert outputs == [
+        "\n".join(line[::-1] for line in reversed(text.split("\n"))) for text in texts
+    ]
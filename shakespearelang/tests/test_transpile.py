@@ -0,0 +1,154 @@
+from shakespearelang import Shakespeare
+from shakespearelang.errors import ShakespeareRuntimeError
+from io import StringIO
+from pathlib import Path
+import pexpect
+import pytest
+from .utils import expect_output_exactly, create_play_file
+
+ERROR_PLAY = """
+A comedy of errors.
+
+Romeo, a player.
+Juliet, a player.
+
+                    Act I: All the World.
+
+                    Scene I: A Stage.
+
+[Enter Romeo and Juliet]
+
+Romeo: You are a pig. Recall your mind!
+
+Recall your mind!
+
+[Exeunt]
+
+"""
+
+
+@pytest.mark.parametrize(
+    "filename,input",
+    [
+        ("hi.spl", ""),
+        ("hello_world.spl", ""),
+        ("catch.spl", ""),
+        ("echo.spl", "m123cfoobar123"),
+        ("primes.spl", "20"),
+        ("reverse.spl", "first\nsecond\nthird"),
+        ("sierpinski.spl", "4"),
+        ("parse_everything.spl", "45c"),
+    ],
+)
+def test_matches_interpreter_output(monkeypatch, capsys, filename, input):
+    path = Path(__file__).parent / f"sample_plays/{filename}"
+    with path.open() as f:
+        interpreter = Shakespeare(f.read())
+
+    monkeypatch.setattr("sys.stdin", StringIO(input))
+    interpreter.run()
+    expected = capsys.readouterr().out
+
+    monkeypatch.setattr("sys.stdin", StringIO(input))
+    run_python(interpreter.compile_to_python())
+    assert capsys.readouterr().out == expected
+
+
+def test_gotos_and_conditionals(capsys):
+    s = Shakespeare(
+        """
+        Test.
+
+        Romeo, a test.
+        Juliet, a test.
+
+        Act I: Counting.
+        Scene I: Setup.
+
+        [Enter Romeo and Juliet]
+
+        Juliet: You are nothing.
+
+        Scene II: Loop.
+
+        Juliet: Open your heart! You are the sum of yourself and a cat.
+                Are you better than a big big cat? If not, let us return to scene II.
+                If so, let us proceed to scene III.
+
+        Scene III: Done.
+
+        Juliet: Open your heart!
+
+        [Exeunt]
+        """
+    )
+    run_python(s.compile_to_python())
+    assert capsys.readouterr().out == "012345"
+
+
+def test_runtime_error_messages_and_lines():
+    s = Shakespeare(ERROR_PLAY)
+    with pytest.raises(ShakespeareRuntimeError) as interpreter_exc:
+        s.run()
+
+    with pytest.raises(ShakespeareRuntimeError) as transpiled_exc:
+        run_python(s.compile_to_python())
+
+    assert transpiled_exc.value.message == interpreter_exc.value.message
+    assert transpiled_exc.value.parseinfo.line == interpreter_exc.value.parseinfo.line
+    assert ">>Recall your mind!<<" in str(transpiled_exc.value)
+
+
+DEEP_PLAY = """
+Deep.
+
+Romeo, a test.
+Juliet, a test.
+
+Act I: Nesting. Scene I: Nesting.
+
+[Enter Romeo and Juliet]
+
+Juliet: You are {twice}a cat. Open your heart!
+        You are {sums}you. Open your heart!
+        Are you as good as {sums}nothing? If so, open your heart!
+        Remember {twice}me. Recall your past! Open your heart!
+        You are the sum of the quotient between a cat and nothing and
+        {sums}the square root of a pig.
+"""
+
+
+def test_deeply_nested_expressions(capsys):
+    depth = 210
+    s = Shakespeare(
+        DEEP_PLAY.format(twice="twice " * depth, sums="the sum of a cat and " * depth)
+    )
+    with pytest.raises(ShakespeareRuntimeError) as interpreter_exc:
+        s.run()
+    expected = capsys.readouterr().out
+
+    with pytest.raises(ShakespeareRuntimeError) as transpiled_exc:
+        run_python(s.compile_to_python())
+    assert capsys.readouterr().out == expected
+    assert transpiled_exc.value.message == "Cannot divide by zero"
+    assert transpiled_exc.value.message == interpreter_exc.value.message
+    assert transpiled_exc.value.parseinfo.line == interpreter_exc.value.parseinfo.line
+
+
+def test_cli_transpile(tmp_path):
+    play_path = tmp_path / "play.spl"
+    python_path = tmp_path / "play.py"
+    with (Path(__file__).parent / "sample_plays/hi.spl").open() as f:
+        create_play_file(play_path, f.read())
+
+    cli = pexpect.spawn(f"shakespeare transpile {play_path} -o {python_path}")
+    expect_output_exactly(cli, "", eof=True)
+
+    cli = pexpect.spawn(f"python {python_path}")
+    expect_output_exactly(cli, "HI\n", eof=True)
+
+
+def run_python(source):
+    namespace = {"__name__": "transpiled_play"}
+    exec(compile(source, "<transpiled play>", "exec"), namespace)
+    namespace["run"]()
@@ -28,3 +28,29 @@ def expect_output_exactly(cli, output, eof=False):
 def create_play_file(path, contents):
     with open(path, "w") as f:
         f.write(contents)
+
+
+# AST helpers
+def comparable_ast(node):
+    # For comparing ASTs parsed or loaded separately: spell out the parseinfo
+    # without the buffer, which differs, and whether sequences are tuples, which
+    # equality ignores.
+    if isinstance(node, dict):
+        parseinfo = node.parseinfo
+        return (
+            {
+                key: comparable_ast(value)
+                for key, value in node.items()
+                if key != "parseinfo"
+            },
+            (
+                parseinfo.rule,
+                parseinfo.pos,
+                parseinfo.endpos,
+                parseinfo.line,
+                parseinfo.endline,
+            ),
+        )
+    if isinstance(node, (list, tuple)):
+        return (isinstance(node, tuple), [comparable_ast(item) for item in node])
+    return node